@@ -2,12 +2,14 @@ from rest_framework import viewsets, permissions
 from apps.accounting.models.models import Sale, Cost, Transaction
 from .serializers import SaleSerializer, CostSerializer, TransactionSerializer
 from apps.users.permissions import IsOrganizationMember
+from core.pagination import OptionalKeysetPagination
 
 
 class OrganizationScopedViewSet(viewsets.ModelViewSet):
     """Base viewset that scopes querysets to the active organization."""
 
     permission_classes = [permissions.IsAuthenticated, IsOrganizationMember]
+    pagination_class = OptionalKeysetPagination
 
     def get_queryset(self):
         org = getattr(self.request, "organization", None)
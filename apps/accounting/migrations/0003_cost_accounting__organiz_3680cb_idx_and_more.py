@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0002_cost_organization_sale_organization_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cost",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="accounting__organiz_3680cb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sale",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="accounting__organiz_0b9487_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="accounting__organiz_f55857_idx",
+            ),
+        ),
+    ]
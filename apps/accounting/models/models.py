@@ -14,6 +14,11 @@ class Sale(models.Model):
     quantity = models.IntegerField()
     unit_price = models.DecimalField(max_digits=10, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
+
     @property
     def total(self):
         return self.quantity * self.unit_price
@@ -34,6 +39,11 @@ class Cost(models.Model):
     description = models.CharField(max_length=200, blank=True)
     amount = models.DecimalField(max_digits=12, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
+
     def __str__(self):
         return f"Cost {self.date} - {self.amount}"
 
@@ -51,5 +61,10 @@ class Transaction(models.Model):
     amount = models.DecimalField(max_digits=12, decimal_places=2)
     note = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
+
     def __str__(self):
         return f"Transaction {self.date} - {self.amount}"
@@ -0,0 +1,35 @@
+"""Filter sets for the birds API."""
+
+import django_filters
+from django.utils import timezone
+
+from apps.birds.models.models import Batch
+
+
+class BatchFilter(django_filters.FilterSet):
+    """Filters on batch fields and the KPI annotations from ``with_kpis()``."""
+
+    min_age_days = django_filters.NumberFilter(field_name="age_days", lookup_expr="gte")
+    max_age_days = django_filters.NumberFilter(field_name="age_days", lookup_expr="lte")
+    min_survival_rate = django_filters.NumberFilter(
+        field_name="survival_pct", lookup_expr="gte"
+    )
+    max_survival_rate = django_filters.NumberFilter(
+        field_name="survival_pct", lookup_expr="lte"
+    )
+    min_mortality_rate = django_filters.NumberFilter(
+        field_name="mortality_pct", lookup_expr="gte"
+    )
+    max_mortality_rate = django_filters.NumberFilter(
+        field_name="mortality_pct", lookup_expr="lte"
+    )
+    under_withdrawal = django_filters.BooleanFilter(method="filter_under_withdrawal")
+
+    class Meta:
+        model = Batch
+        fields = ["status", "supplier"]
+
+    def filter_under_withdrawal(self, queryset, name, value):
+        if value:
+            return queryset.under_withdrawal()
+        return queryset.exclude(withdrawal_clears_on__gt=timezone.localdate())
@@ -0,0 +1,34 @@
+"""View helpers for reading archived batches and their records."""
+
+from apps.birds.services.archive_service import get_archive_model
+
+
+def include_archived(request):
+    """Return ``True`` when the request asks for archived data too."""
+    value = request.query_params.get("include_archived", "")
+    return value.lower() in ("1", "true", "yes")
+
+
+class IncludeArchivedMixin:
+    """
+    For organization-scoped record list views: with ``?include_archived=true``
+    the filtered hot queryset is UNIONed with the same filters applied to the
+    record's archive table.
+    """
+
+    def get_archived_queryset(self, queryset):
+        archive = get_archive_model(queryset.model)
+        return archive.objects.filter(organization=self.request.organization)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not include_archived(self.request) or not getattr(
+            self.request, "organization", None
+        ):
+            return queryset
+
+        archived = super().filter_queryset(self.get_archived_queryset(queryset))
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return (
+            queryset.order_by().union(archived.order_by(), all=True).order_by(*ordering)
+        )
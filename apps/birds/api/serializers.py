@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from apps.birds.models.models import Batch
+from apps.birds.services.archive_service import check_not_archived
 from apps.users.api.serializers import UserSerializer
 
 
@@ -17,12 +18,20 @@ class BatchSerializer(serializers.ModelSerializer):
     class Meta:
         model = Batch
         fields = "__all__"
+        read_only_fields = Batch.RUNNING_TOTAL_FIELDS + [
+            "archived_at",
+            "withdrawal_clears_on",
+        ]
         extra_kwargs = {"created_by": {"read_only": True}}
 
     def get_age_in_weeks(self, obj):
+        if hasattr(obj, "age_weeks"):
+            return obj.age_weeks
         return round(obj.age_in_days / 7, 1)
 
     def get_survival_rate(self, obj):
+        if hasattr(obj, "survival_pct"):
+            return obj.survival_pct
         if obj.initial_count == 0:
             return 0
         return round((obj.current_count / obj.initial_count) * 100, 2)
@@ -62,6 +71,17 @@ class BatchSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class UnarchivedBatchMixin:
+    """
+    For serializers of records that move to the archive tables: a record
+    may not be written for a batch that has already been archived.
+    """
+
+    def validate_batch(self, batch):
+        check_not_archived(batch)
+        return batch
+
+
 class BatchSummarySerializer(serializers.ModelSerializer):
     """Serializer for batch summary with computed fields."""
 
@@ -79,9 +99,13 @@ class BatchSummarySerializer(serializers.ModelSerializer):
         ]
 
     def get_age_in_weeks(self, obj):
+        if hasattr(obj, "age_weeks"):
+            return obj.age_weeks
         return round(obj.age_in_days / 7, 1)
 
     def get_survival_rate(self, obj):
+        if hasattr(obj, "survival_pct"):
+            return obj.survival_pct
         if obj.initial_count == 0:
             return 0
         return round((obj.current_count / obj.initial_count) * 100, 2)
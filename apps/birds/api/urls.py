@@ -11,5 +11,15 @@ urlpatterns = [
         views.batch_performance_view,
         name="batch_performance",
     ),
+    path(
+        "<int:batch_id>/growth-curve/",
+        views.batch_growth_curve_view,
+        name="batch_growth_curve",
+    ),
     path("bulk-update/", views.bulk_batch_update_view, name="bulk_batch_update"),
+    path(
+        "under-withdrawal/",
+        views.batches_under_withdrawal_view,
+        name="batches_under_withdrawal",
+    ),
 ]
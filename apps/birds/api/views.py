@@ -1,13 +1,27 @@
 """Batch API views for listing, creating, updating, and retrieving batch statistics and performance."""
 
+from datetime import datetime
+
+from django.utils import timezone
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Sum, Avg
 from apps.birds.models.models import Batch
+from apps.birds.api.filters import BatchFilter
+from apps.birds.api.mixins import include_archived
 from apps.birds.api.serializers import BatchSerializer
+from apps.birds.services.batch_service import (
+    MAX_BULK_UPDATE_ITEMS,
+    bulk_update_counts,
+    get_batch_statistics,
+)
+from apps.birds.services.growth_service import (
+    GROWTH_CURVE_DEFAULT_POINTS,
+    GROWTH_CURVE_MAX_POINTS,
+    get_growth_curve,
+)
 from apps.users.permissions import IsOrganizationMember, IsOrganizationAdmin
 
 
@@ -22,15 +36,27 @@ class BatchListCreateView(generics.ListCreateAPIView):
     serializer_class = BatchSerializer
     permission_classes = [permissions.IsAuthenticated, IsOrganizationMember]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_class = BatchFilter
     search_fields = ["batch_number"]
-    ordering_fields = ["batch_id", "current_count", "collection_date", "created_at"]
+    ordering_fields = [
+        "batch_id",
+        "current_count",
+        "collection_date",
+        "created_at",
+        "age_days",
+        "survival_pct",
+        "mortality_pct",
+    ]
     ordering = ["created_at"]
 
     def get_queryset(self):
         org = _get_org_or_error(self.request)
         if not org:
             return Batch.objects.none()
-        return Batch.objects.filter(organization=org)
+        batches = Batch.objects.filter(organization=org)
+        if not include_archived(self.request):
+            batches = batches.unarchived()
+        return batches.with_kpis()
 
 
 class BatchDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -43,7 +69,13 @@ class BatchDetailView(generics.RetrieveUpdateDestroyAPIView):
         org = _get_org_or_error(self.request)
         if not org:
             return Batch.objects.none()
-        return Batch.objects.filter(organization=org)
+        return Batch.objects.filter(organization=org).with_kpis()
+
+    def perform_update(self, serializer):
+        batch = serializer.save()
+        # The KPI annotations were computed before the write; reload them so
+        # the response reflects the new counts.
+        serializer.instance = self.get_queryset().get(pk=batch.pk)
 
     def get_permissions(self):
         if self.request.method in ["PUT", "PATCH", "DELETE"]:
@@ -61,27 +93,7 @@ def batch_statistics_view(request):
             {"error": "No organization selected"}, status=status.HTTP_400_BAD_REQUEST
         )
 
-    batches = Batch.objects.filter(organization=org)
-    active_batches = batches.filter(status="active")
-
-    stats = {
-        "total_flocks": batches.count(),
-        "active_batches": active_batches.count(),
-        "total_birds": active_batches.aggregate(total=Sum("current_count"))["total"]
-        or 0,
-        "average_batch_size": active_batches.aggregate(avg=Avg("current_count"))["avg"]
-        or 0,
-        "mortality_stats": {},
-    }
-
-    inactive_batches = batches.exclude(status="active")
-    for batch_status, _ in Batch.STATUS_CHOICES:
-        if batch_status != "active":
-            count = inactive_batches.filter(status=batch_status).count()
-            if count > 0:
-                stats["mortality_stats"][batch_status] = count
-
-    return Response(stats)
+    return Response(get_batch_statistics(org))
 
 
 @api_view(["GET"])
@@ -95,23 +107,16 @@ def batch_performance_view(request, batch_id):
         )
 
     try:
-        batch = Batch.objects.get(id=batch_id, organization=org)
-
-        age_weeks = batch.age_in_days / 7
-        survival_rate = (
-            (batch.current_count / batch.initial_count * 100)
-            if batch.initial_count > 0
-            else 0
-        )
+        batch = Batch.objects.with_kpis().get(id=batch_id, organization=org)
 
-        weight_data = []
+        weight_data = get_growth_curve(batch)["series"]["weight_g"]
 
         performance_data = {
             "batch": BatchSerializer(batch).data,
             "metrics": {
-                "age_weeks": round(age_weeks, 1),
-                "survival_rate": round(survival_rate, 2),
-                "mortality_rate": round(100 - survival_rate, 2),
+                "age_weeks": batch.age_weeks,
+                "survival_rate": batch.survival_pct,
+                "mortality_rate": batch.mortality_pct,
                 "birds_lost": batch.initial_count - batch.current_count,
             },
             "weight_data": weight_data,
@@ -123,6 +128,38 @@ def batch_performance_view(request, batch_id):
         return Response({"error": "Batch not found"}, status=status.HTTP_404_NOT_FOUND)
 
 
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def batch_growth_curve_view(request, batch_id):
+    """
+    API view for a batch's weight, feed and mortality per age-day,
+    downsampled to ``?points=`` points per series for charting.
+    """
+    org = _get_org_or_error(request)
+    if not org:
+        return Response(
+            {"error": "No organization selected"}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        points = int(request.query_params.get("points", GROWTH_CURVE_DEFAULT_POINTS))
+    except (TypeError, ValueError):
+        points = 0
+    if not 3 <= points <= GROWTH_CURVE_MAX_POINTS:
+        return Response(
+            {"error": f"points must be between 3 and {GROWTH_CURVE_MAX_POINTS}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        batch = Batch.objects.get(id=batch_id, organization=org)
+    except Batch.DoesNotExist:
+        return Response({"error": "Batch not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    curve = get_growth_curve(batch, points)
+    return Response({"batch_id": batch.id, "points": points, **curve})
+
+
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
 def bulk_batch_update_view(request):
@@ -134,30 +171,66 @@ def bulk_batch_update_view(request):
         )
 
     batch_updates = request.data.get("batch_updates", [])
-    if not batch_updates:
+    if not batch_updates or not isinstance(batch_updates, list):
         return Response(
             {"error": "No batch updates provided"}, status=status.HTTP_400_BAD_REQUEST
         )
+    if len(batch_updates) > MAX_BULK_UPDATE_ITEMS:
+        return Response(
+            {"error": f"At most {MAX_BULK_UPDATE_ITEMS} updates per request"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
+    # All-or-nothing: nothing is written unless every item is valid.
+    results, applied = bulk_update_counts(org, batch_updates)
+    errors = [
+        f"Batch {result['batch_id']}: {result['error']}"
+        for result in results
+        if not result["ok"]
+    ]
     updated_batches = []
-    errors = []
-
-    for update in batch_updates:
-        try:
-            bid = update.get("batch_id")
-            new_count = update.get("new_count")
+    if applied:
+        updated_batches = Batch.objects.filter(
+            organization=org, pk__in={result["batch_id"] for result in results}
+        ).select_related("created_by")
+    return Response(
+        {
+            "updated_batches": BatchSerializer(updated_batches, many=True).data,
+            "applied": applied,
+            "updated_count": len(results) if applied else 0,
+            "results": results,
+            "errors": errors,
+        },
+        status=status.HTTP_200_OK if applied else status.HTTP_400_BAD_REQUEST,
+    )
 
-            batch = Batch.objects.get(id=bid, organization=org)
-            batch.current_count = new_count
-            if new_count <= 0:
-                batch.status = "deceased"
-            batch.save()
 
-            updated_batches.append(BatchSerializer(batch).data)
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def batches_under_withdrawal_view(request):
+    """
+    Batches whose birds are still inside a medication withdrawal period on
+    ``?on=YYYY-MM-DD`` (default today), soonest to clear first.
+    """
+    org = _get_org_or_error(request)
+    if not org:
+        return Response(
+            {"error": "No organization selected"}, status=status.HTTP_400_BAD_REQUEST
+        )
 
-        except Batch.DoesNotExist:
-            errors.append(f"Batch with id {bid} not found")
-        except Exception as e:
-            errors.append(f"Error updating batch {bid}: {str(e)}")
+    on = request.query_params.get("on")
+    try:
+        on = datetime.strptime(on, "%Y-%m-%d").date() if on else timezone.localdate()
+    except ValueError:
+        return Response(
+            {"error": "on must be a date in YYYY-MM-DD format"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-    return Response({"updated_batches": updated_batches, "errors": errors})
+    batches = (
+        Batch.objects.filter(organization=org)
+        .under_withdrawal(on)
+        .order_by("withdrawal_clears_on", "pk")
+        .values("id", "batch_number", "status", "current_count", "withdrawal_clears_on")
+    )
+    return Response({"date": on, "results": list(batches)})
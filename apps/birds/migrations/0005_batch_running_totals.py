@@ -0,0 +1,107 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:35
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_running_totals(apps, schema_editor):
+    Batch = apps.get_model("birds", "Batch")
+    FeedRecord = apps.get_model("production", "FeedRecord")
+    WeightRecord = apps.get_model("production", "WeightRecord")
+    MortalityRecord = apps.get_model("health", "MortalityRecord")
+    HealthRecord = apps.get_model("health", "HealthRecord")
+
+    def total(model, expression, field):
+        output_field = Batch._meta.get_field(field)
+        rows = (
+            model.objects.filter(batch=OuterRef("pk"))
+            .order_by()
+            .values("batch")
+            .annotate(total=Sum(expression, output_field=output_field))
+            .values("total")
+        )
+        return Coalesce(Subquery(rows), Value(0), output_field=output_field)
+
+    def newest(model, source):
+        return Subquery(
+            model.objects.filter(batch=OuterRef("pk"))
+            .order_by("-date", "-pk")
+            .values(source)[:1]
+        )
+
+    Batch.objects.update(
+        feed_kg_total=total(FeedRecord, F("quantity_kg"), "feed_kg_total"),
+        feed_cost_total=total(
+            FeedRecord, F("quantity_kg") * F("cost_per_kg"), "feed_cost_total"
+        ),
+        deaths_total=total(MortalityRecord, F("count"), "deaths_total"),
+        health_cost_total=total(HealthRecord, F("cost"), "health_cost_total"),
+        last_weight_g=newest(WeightRecord, "average_weight"),
+        last_weight_date=newest(WeightRecord, "date"),
+        last_feed_date=newest(FeedRecord, "date"),
+        last_mortality_date=newest(MortalityRecord, "date"),
+        last_health_date=newest(HealthRecord, "date"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0004_batch_organization_batch_batches_organiz_5e2140_idx"),
+        ("health", "0002_mortalityrecord_organization"),
+        ("production", "0003_eggproduction_organization_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="batch",
+            name="deaths_total",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="feed_cost_total",
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=16),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="feed_kg_total",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="health_cost_total",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="last_feed_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="last_health_date",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="last_mortality_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="last_weight_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="batch",
+            name="last_weight_g",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.RunPython(
+            backfill_running_totals, reverse_code=migrations.RunPython.noop
+        ),
+    ]
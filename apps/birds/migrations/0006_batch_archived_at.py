@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0005_batch_running_totals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="batch",
+            name="archived_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
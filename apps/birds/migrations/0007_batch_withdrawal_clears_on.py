@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:17
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_withdrawal_clears_on(apps, schema_editor):
+    Batch = apps.get_model("birds", "Batch")
+    Medication = apps.get_model("health", "Medication")
+    latest = {}
+    treatments = Medication.objects.values_list(
+        "health_record__batch_id",
+        "health_record__date",
+        "duration_days",
+        "withdrawal_period",
+    )
+    for batch_id, treated_at, duration_days, withdrawal_period in treatments:
+        if timezone.is_aware(treated_at):
+            treated_at = timezone.localtime(treated_at)
+        value = treated_at.date() + timedelta(days=duration_days + withdrawal_period)
+        if batch_id not in latest or value > latest[batch_id]:
+            latest[batch_id] = value
+    for batch_id, value in latest.items():
+        Batch.objects.filter(pk=batch_id).update(withdrawal_clears_on=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0006_batch_archived_at"),
+        ("health", "0007_daily_mortality"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="batch",
+            name="withdrawal_clears_on",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="batch",
+            index=models.Index(
+                fields=["organization", "withdrawal_clears_on"],
+                name="batches_organiz_8d81e8_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_withdrawal_clears_on, migrations.RunPython.noop),
+    ]
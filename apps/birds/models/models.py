@@ -1,11 +1,112 @@
 """Broiler-focused bird models (farms/buildings removed)."""
 
 from django.db import models
+from django.db.models import Case, F, FloatField, Func, IntegerField, Value, When
+from django.db.models.functions import Cast, Coalesce, Greatest, Round
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 User = get_user_model()
 
 
+def archive_model(model):
+    """
+    Build the cold-storage twin of a batch record *model*: same columns in
+    the same order (so the two can be UNIONed), ids copied rather than
+    generated, and a ``archived_<related_name>`` reverse accessor on Batch.
+    Call it from the module that defines *model* so the app label matches.
+    """
+    attrs = {"__module__": model.__module__}
+    for field in model._meta.concrete_fields:
+        name, path, args, kwargs = field.deconstruct()
+        if field.primary_key:
+            attrs[name] = models.BigIntegerField(primary_key=True)
+            continue
+        kwargs.pop("db_index", None)
+        if field.is_relation:
+            related_name = field.remote_field.related_name
+            kwargs["related_name"] = (
+                f"archived_{related_name}" if field.name == "batch" else "+"
+            )
+        attrs[name] = field.__class__(*args, **kwargs)
+
+    opts = model._meta
+    attrs["Meta"] = type(
+        "Meta",
+        (),
+        {
+            "db_table": f"archived_{opts.db_table}",
+            "verbose_name": f"Archived {opts.verbose_name}",
+            "verbose_name_plural": f"Archived {opts.verbose_name_plural}",
+            "ordering": opts.ordering,
+            "indexes": [models.Index(fields=index.fields) for index in opts.indexes],
+        },
+    )
+    return type(f"Archived{model.__name__}", (models.Model,), attrs)
+
+
+class DaysSince(Func):
+    """
+    Whole 24-hour periods elapsed since a datetime expression, computed in
+    the database; the same count ``Batch.age_in_days`` gives in Python.
+    """
+
+    arity = 1
+    output_field = IntegerField()
+    template = (
+        "CAST(EXTRACT(DAY FROM (CURRENT_TIMESTAMP - %(expressions)s)) AS integer)"
+    )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="CAST(julianday('now') - julianday(%(expressions)s) AS integer)",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        # Datetimes are stored in UTC, so compare against UTC rather than the
+        # session time zone CURRENT_TIMESTAMP would use.
+        return self.as_sql(
+            compiler,
+            connection,
+            template="TIMESTAMPDIFF(DAY, %(expressions)s, UTC_TIMESTAMP(6))",
+            **extra_context,
+        )
+
+
+class BatchQuerySet(models.QuerySet):
+    def unarchived(self):
+        """Batches whose records still live in the hot tables."""
+        return self.filter(archived_at__isnull=True)
+
+    def under_withdrawal(self, on=None):
+        """Batches still inside a medication withdrawal period on date *on*."""
+        return self.filter(withdrawal_clears_on__gt=on or timezone.localdate())
+
+    def with_kpis(self):
+        """
+        Annotate ``age_days``, ``age_weeks``, ``survival_pct`` and
+        ``mortality_pct`` so they can be filtered and ordered on in SQL.
+        """
+        survival = Case(
+            When(initial_count=0, then=Value(0.0)),
+            default=Cast("current_count", FloatField()) * 100 / F("initial_count"),
+            output_field=FloatField(),
+        )
+        return self.annotate(
+            age_days=Greatest(Coalesce(DaysSince("collection_date"), Value(0)), 0),
+            age_weeks=Round(Cast("age_days", FloatField()) / 7, 1),
+            survival_pct=Round(survival, 2),
+            mortality_pct=Case(
+                When(initial_count=0, then=Value(0.0)),
+                default=Round(Value(100.0) - survival, 2),
+                output_field=FloatField(),
+            ),
+        )
+
+
 class Batch(models.Model):
     """
     Model representing different batches of broilers
@@ -35,6 +136,39 @@ class Batch(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Running totals maintained by ``batch_service`` as feed, weight,
+    # mortality and health records are written; never set them directly.
+    feed_kg_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    feed_cost_total = models.DecimalField(max_digits=16, decimal_places=4, default=0)
+    deaths_total = models.PositiveIntegerField(default=0)
+    health_cost_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    last_weight_g = models.DecimalField(
+        max_digits=6, decimal_places=2, null=True, blank=True
+    )
+    last_weight_date = models.DateField(null=True, blank=True)
+    last_feed_date = models.DateField(null=True, blank=True)
+    last_mortality_date = models.DateField(null=True, blank=True)
+    last_health_date = models.DateTimeField(null=True, blank=True)
+    # Set once the batch's records have been moved to the archive tables.
+    archived_at = models.DateTimeField(null=True, blank=True)
+    # First day the birds are clear of every medication's withdrawal period,
+    # maintained by ``withdrawal_service``; null when never medicated.
+    withdrawal_clears_on = models.DateField(null=True, blank=True)
+
+    RUNNING_TOTAL_FIELDS = [
+        "feed_kg_total",
+        "feed_cost_total",
+        "deaths_total",
+        "health_cost_total",
+        "last_weight_g",
+        "last_weight_date",
+        "last_feed_date",
+        "last_mortality_date",
+        "last_health_date",
+    ]
+
+    objects = BatchQuerySet.as_manager()
+
     class Meta:
         db_table = "batches"
         verbose_name = "batch"
@@ -42,6 +176,7 @@ class Batch(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["organization", "status"]),
+            models.Index(fields=["organization", "withdrawal_clears_on"]),
         ]
 
     def __str__(self):
@@ -49,6 +184,12 @@ class Batch(models.Model):
 
     @property
     def age_in_days(self):
+        # Whole 24-hour periods since collection, never negative, which is
+        # what the ``age_days`` annotation from ``with_kpis()`` counts too;
+        # querysets built with it carry the value already.
+        if hasattr(self, "age_days"):
+            return self.age_days
+
         from django.utils import timezone
 
         # collection_date may be None (partial records) or naive/aware.
@@ -69,10 +210,12 @@ class Batch(models.Model):
             pass
 
         delta = now - collection_date
-        return delta.days if hasattr(delta, "days") else 0
+        return max(delta.days, 0) if hasattr(delta, "days") else 0
 
     @property
     def mortality_rate(self):
+        if hasattr(self, "mortality_pct"):
+            return self.mortality_pct
         if self.initial_count == 0:
             return 0
         return (
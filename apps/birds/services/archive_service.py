@@ -0,0 +1,129 @@
+"""Move the records of long-closed batches out of the hot tables."""
+
+import logging
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Days after a sold batch was last updated before its records are archived.
+BATCH_ARCHIVE_AFTER_DAYS = getattr(settings, "BATCH_ARCHIVE_AFTER_DAYS", 180)
+# Batches archived per run of ``archive_sold_batches``.
+BATCH_ARCHIVE_LIMIT = 100
+
+# Hot record tables and the archive tables their rows move to. Health
+# records stay hot: they are few and carry vaccination/medication details.
+ARCHIVE_MODELS = {
+    "production.FeedRecord": "production.ArchivedFeedRecord",
+    "production.EggProduction": "production.ArchivedEggProduction",
+    "production.WeightRecord": "production.ArchivedWeightRecord",
+    "production.EnvironmentalRecord": "production.ArchivedEnvironmentalRecord",
+    "health.MortalityRecord": "health.ArchivedMortalityRecord",
+}
+
+
+def get_archive_model(model):
+    """Return the archive model for hot record *model*, or ``None``."""
+    label = ARCHIVE_MODELS.get(model._meta.label)
+    return apps.get_model(label) if label else None
+
+
+def check_not_archived(batch):
+    """
+    Raise ``ValidationError`` if *batch*'s records have moved to the archive
+    tables: its per-batch reads no longer see the hot tables, so new hot
+    records would be invisible there.
+    """
+    if batch is not None and batch.archived_at is not None:
+        raise ValidationError(
+            f"Batch {batch} is archived; its records can no longer change.",
+            code="archived",
+        )
+
+
+def batch_records(batch, related_name):
+    """
+    Return the ``related_name`` records of *batch* (e.g. ``"weight_records"``)
+    from the archive table when the batch has been archived.
+    """
+    if batch.archived_at is not None:
+        related_name = f"archived_{related_name}"
+    return getattr(batch, related_name).all()
+
+
+def _move_rows(model, batch_id):
+    """Copy *model* rows of one batch into its archive table, then delete them."""
+    archive = get_archive_model(model)
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(field.column) for field in model._meta.concrete_fields)
+    source = quote(model._meta.db_table)
+    batch_column = quote(model._meta.get_field("batch").column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(archive._meta.db_table)} ({columns}) "
+            f"SELECT {columns} FROM {source} WHERE {batch_column} = %s",
+            [batch_id],
+        )
+        # Raw DELETE on purpose: the batch keeps its running totals.
+        cursor.execute(f"DELETE FROM {source} WHERE {batch_column} = %s", [batch_id])
+        return cursor.rowcount
+
+
+def archive_batch(batch):
+    """
+    Move every feed, egg, weight, environmental and mortality record of
+    *batch* into the archive tables in one transaction and stamp
+    ``archived_at``. Returns the number of rows moved, or ``None`` if the
+    batch was already archived or is no longer sold.
+    """
+    from apps.birds.models.models import Batch
+    from apps.birds.services.growth_service import invalidate_growth_curve
+
+    with transaction.atomic():
+        locked = (
+            Batch.objects.select_for_update()
+            .filter(pk=batch.pk, status="sold", archived_at__isnull=True)
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if locked is None:
+            return None
+        moved = sum(
+            _move_rows(apps.get_model(label), batch.pk) for label in ARCHIVE_MODELS
+        )
+        batch.archived_at = timezone.now()
+        Batch.objects.filter(pk=batch.pk).update(archived_at=batch.archived_at)
+
+    invalidate_growth_curve(batch.pk)
+    logger.info("Archived batch id=%s (%s record(s) moved)", batch.pk, moved)
+    return moved
+
+
+def archive_sold_batches(older_than_days=None, limit=BATCH_ARCHIVE_LIMIT):
+    """
+    Archive up to *limit* sold batches untouched for *older_than_days*
+    (default ``BATCH_ARCHIVE_AFTER_DAYS``). Returns (batches, rows) moved.
+    """
+    from apps.birds.models.models import Batch
+
+    if older_than_days is None:
+        older_than_days = BATCH_ARCHIVE_AFTER_DAYS
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    candidates = (
+        Batch.objects.unarchived()
+        .filter(status="sold", updated_at__lt=cutoff)
+        .order_by("updated_at")[:limit]
+    )
+
+    archived = rows = 0
+    for batch in candidates:
+        moved = archive_batch(batch)
+        if moved is not None:
+            archived += 1
+            rows += moved
+    return archived, rows
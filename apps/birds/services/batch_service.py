@@ -0,0 +1,320 @@
+"""Business logic for batch bookkeeping that spans many rows."""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Seconds a per-organization statistics snapshot is cached; 0 disables it.
+BATCH_STATISTICS_CACHE_TIMEOUT = getattr(
+    settings, "BATCH_STATISTICS_CACHE_TIMEOUT", 5 * 60
+)
+
+# Batch running totals fed by each record model. ``sums`` maps a Batch field
+# to the SQL expression summed over records and the amount one record adds;
+# ``latest`` maps a Batch field to the field copied from the newest record.
+RUNNING_TOTALS = {
+    "production.FeedRecord": {
+        "sums": {
+            "feed_kg_total": (F("quantity_kg"), lambda record: record.quantity_kg),
+            "feed_cost_total": (
+                F("quantity_kg") * F("cost_per_kg"),
+                lambda record: record.total_cost,
+            ),
+        },
+        "latest": {"last_feed_date": "date"},
+    },
+    "production.WeightRecord": {
+        "sums": {},
+        "latest": {"last_weight_date": "date", "last_weight_g": "average_weight"},
+    },
+    "health.MortalityRecord": {
+        "sums": {"deaths_total": (F("count"), lambda record: record.count)},
+        "latest": {"last_mortality_date": "date"},
+    },
+    "health.HealthRecord": {
+        "sums": {"health_cost_total": (F("cost"), lambda record: record.cost)},
+        "latest": {"last_health_date": "date"},
+    },
+}
+
+# Rows per UPDATE statement issued by bulk_update.
+BULK_UPDATE_BATCH_SIZE = 500
+# Upper bound on items accepted by one bulk count update.
+MAX_BULK_UPDATE_ITEMS = 5000
+
+
+def _parse_update(update):
+    """Return ``(batch_id, new_count, error)`` for one raw update item."""
+    if not isinstance(update, dict):
+        return None, None, "Each update must be an object."
+
+    batch_id = update.get("batch_id")
+    new_count = update.get("new_count")
+    try:
+        batch_id = int(batch_id)
+    except (TypeError, ValueError):
+        return batch_id, None, "batch_id must be an integer."
+    if isinstance(new_count, bool):
+        return batch_id, None, "new_count must be an integer."
+    try:
+        new_count = int(new_count)
+    except (TypeError, ValueError):
+        return batch_id, None, "new_count must be an integer."
+    if new_count < 0:
+        return batch_id, None, "new_count cannot be negative."
+    return batch_id, new_count, None
+
+
+def _batches_updated(organization, batches):
+    """Do the bookkeeping the skipped Batch post_save signals would have done."""
+    from apps.health.services.vaccination_service import clear_batch_schedules
+
+    closed = [batch.pk for batch in batches if batch.status != "active"]
+    if closed:
+        clear_batch_schedules(closed)
+    invalidate_batch_statistics(organization.pk)
+
+
+def bulk_update_counts(organization, updates):
+    """
+    Apply ``{"batch_id", "new_count"}`` *updates* to *organization*'s batches
+    atomically.
+
+    The referenced batches are locked with one ``SELECT ... FOR UPDATE``,
+    every item is validated, and only if all of them are valid the changes
+    are written with ``bulk_update``, for the batches whose count or status
+    actually changed. A batch dropping to zero birds is marked ``deceased``.
+    Later items win when a batch appears twice. Returns (results, applied)
+    where *results* has one dict per item.
+    """
+    from apps.birds.models.models import Batch
+
+    parsed = [_parse_update(update) for update in updates]
+    batch_ids = {batch_id for batch_id, _, error in parsed if error is None}
+
+    with transaction.atomic():
+        batches = (
+            Batch.objects.select_for_update()
+            .filter(organization=organization)
+            .in_bulk(batch_ids)
+        )
+
+        stored = {
+            batch.pk: (batch.current_count, batch.status) for batch in batches.values()
+        }
+        results = []
+        touched = {}
+        for batch_id, new_count, error in parsed:
+            batch = batches.get(batch_id) if error is None else None
+            if error is None and batch is None:
+                error = "Batch not found"
+            if error is None and new_count > batch.initial_count:
+                error = "Current count cannot exceed initial count"
+            if error is not None:
+                results.append({"batch_id": batch_id, "ok": False, "error": error})
+                continue
+
+            batch.current_count = new_count
+            if new_count <= 0:
+                batch.status = "deceased"
+            touched[batch.pk] = batch
+            results.append(
+                {
+                    "batch_id": batch_id,
+                    "ok": True,
+                    "current_count": new_count,
+                    "status": batch.status,
+                }
+            )
+
+        if any(not result["ok"] for result in results):
+            return results, False
+
+        changed = [
+            batch
+            for batch in touched.values()
+            if (batch.current_count, batch.status) != stored[batch.pk]
+        ]
+        if not changed:
+            return results, True
+
+        fields = ["current_count", "updated_at"]
+        if any(batch.status != stored[batch.pk][1] for batch in changed):
+            fields.append("status")
+        now = timezone.now()
+        for batch in changed:
+            batch.updated_at = now
+        Batch.objects.bulk_update(changed, fields, batch_size=BULK_UPDATE_BATCH_SIZE)
+        _batches_updated(organization, changed)
+
+    logger.info(
+        "Bulk count update applied to %s batch(es) for org id=%s",
+        len(changed),
+        organization.pk,
+    )
+    return results, True
+
+
+def _statistics_key(organization_id):
+    return f"batch_statistics:{organization_id}"
+
+
+def compute_batch_statistics(organization):
+    """
+    Build the batch statistics payload for *organization* from a single
+    query that groups batches by status.
+    """
+    from apps.birds.models.models import Batch
+
+    rows = (
+        Batch.objects.filter(organization=organization)
+        .order_by()
+        .values("status")
+        .annotate(batches=Count("pk"), birds=Sum("current_count"))
+    )
+    by_status = {row["status"]: row for row in rows}
+
+    active = by_status.get("active", {})
+    active_batches = active.get("batches", 0)
+    active_birds = active.get("birds") or 0
+    return {
+        "total_flocks": sum(row["batches"] for row in by_status.values()),
+        "active_batches": active_batches,
+        "total_birds": active_birds,
+        "average_batch_size": active_birds / active_batches if active_batches else 0,
+        "mortality_stats": {
+            batch_status: by_status[batch_status]["batches"]
+            for batch_status, _ in Batch.STATUS_CHOICES
+            if batch_status != "active" and batch_status in by_status
+        },
+    }
+
+
+def get_batch_statistics(organization):
+    """Return the (cached) batch statistics snapshot for *organization*."""
+    if not BATCH_STATISTICS_CACHE_TIMEOUT:
+        return compute_batch_statistics(organization)
+
+    key = _statistics_key(organization.pk)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_batch_statistics(organization)
+        cache.set(key, stats, BATCH_STATISTICS_CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_batch_statistics(organization_id):
+    """Drop the cached statistics snapshot; call after any Batch write."""
+    if organization_id is not None:
+        cache.delete(_statistics_key(organization_id))
+
+
+def _record_amounts(record):
+    sums = RUNNING_TOTALS[record._meta.label]["sums"]
+    return {field: amount(record) or 0 for field, (_, amount) in sums.items()}
+
+
+def _newest_values(model, batch, source):
+    """Subquery for *source* on *batch*'s newest *model* record."""
+    return Subquery(
+        model._default_manager.filter(batch=batch)
+        .order_by("-date", "-pk")
+        .values(source)[:1]
+    )
+
+
+def _apply_totals(batch_id, amounts, latest):
+    from apps.birds.models.models import Batch
+
+    updates = {field: F(field) + amount for field, amount in amounts.items() if amount}
+    updates.update(latest)
+    if updates:
+        Batch.objects.filter(pk=batch_id).update(**updates)
+
+
+def record_added(record):
+    """
+    Fold a newly created feed, weight, mortality or health *record* into its
+    batch's running totals with one ``UPDATE``.
+    """
+    from apps.birds.models.models import Batch
+
+    latest_fields = RUNNING_TOTALS[record._meta.label]["latest"]
+    date_field = next(iter(latest_fields))
+    # Compare against the batch row itself rather than re-reading the record
+    # table, so concurrent inserts for one batch cannot hide each other.
+    newer = Q(**{f"{date_field}__isnull": True}) | Q(
+        **{f"{date_field}__lte": record.date}
+    )
+    latest = {
+        field: Case(
+            When(newer, then=Value(getattr(record, source))),
+            default=F(field),
+            output_field=Batch._meta.get_field(field),
+        )
+        for field, source in latest_fields.items()
+    }
+    _apply_totals(record.batch_id, _record_amounts(record), latest)
+
+
+def record_removed(record):
+    """Take a deleted (or moved) *record* back out of its batch's totals."""
+    latest = {
+        field: _newest_values(type(record), record.batch_id, source)
+        for field, source in RUNNING_TOTALS[record._meta.label]["latest"].items()
+    }
+    amounts = {field: -amount for field, amount in _record_amounts(record).items()}
+    _apply_totals(record.batch_id, amounts, latest)
+
+
+def record_changed(previous, record):
+    """Move batch running totals from the *previous* state of *record*."""
+    if previous.batch_id != record.batch_id:
+        record_removed(previous)
+        before = {}
+    else:
+        before = _record_amounts(previous)
+
+    latest = {
+        field: _newest_values(type(record), record.batch_id, source)
+        for field, source in RUNNING_TOTALS[record._meta.label]["latest"].items()
+    }
+    amounts = {
+        field: amount - before.get(field, 0)
+        for field, amount in _record_amounts(record).items()
+    }
+    _apply_totals(record.batch_id, amounts, latest)
+
+
+def recalculate_running_totals(batches):
+    """
+    Rebuild the running totals of the *batches* queryset from the record
+    tables in one ``UPDATE``. Returns the number of batches updated.
+    """
+    from django.apps import apps
+    from django.db.models.functions import Coalesce
+
+    updates = {}
+    for label, spec in RUNNING_TOTALS.items():
+        model = apps.get_model(label)
+        for field, (expression, _) in spec["sums"].items():
+            output_field = batches.model._meta.get_field(field)
+            total = (
+                model._default_manager.filter(batch=OuterRef("pk"))
+                .order_by()
+                .values("batch")
+                .annotate(total=Sum(expression, output_field=output_field))
+                .values("total")
+            )
+            updates[field] = Coalesce(
+                Subquery(total), Value(0), output_field=output_field
+            )
+        for field, source in spec["latest"].items():
+            updates[field] = _newest_values(model, OuterRef("pk"), source)
+    return batches.update(**updates)
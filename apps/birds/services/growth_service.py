@@ -0,0 +1,125 @@
+"""Per-batch growth curves downsampled for charting."""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Sum
+
+logger = logging.getLogger(__name__)
+
+# Seconds a batch's full growth series is cached; record writes drop it.
+GROWTH_CURVE_CACHE_TIMEOUT = getattr(settings, "GROWTH_CURVE_CACHE_TIMEOUT", 60 * 60)
+# Points per series returned when the client does not ask for a budget.
+GROWTH_CURVE_DEFAULT_POINTS = 200
+# Largest point budget a client may request per series.
+GROWTH_CURVE_MAX_POINTS = 2000
+
+
+def largest_triangle_three_buckets(points, threshold, key):
+    """
+    Downsample *points* to *threshold* items with the Largest-Triangle-
+    Three-Buckets algorithm, keeping the first and last point. *key* maps a
+    point to its ``(x, y)`` floats; the selected original items are returned.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(points)
+
+    xy = [key(point) for point in points]
+    sampled = [points[0]]
+    bucket_size = (count - 2) / (threshold - 2)
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        following = xy[end : min(int((bucket + 2) * bucket_size) + 1, count)]
+        avg_x = sum(x for x, _ in following) / len(following)
+        avg_y = sum(y for _, y in following) / len(following)
+
+        anchor_x, anchor_y = xy[anchor]
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            x, y = xy[index]
+            area = abs(
+                (anchor_x - avg_x) * (y - anchor_y)
+                - (anchor_x - x) * (avg_y - anchor_y)
+            )
+            if area > best_area:
+                best, best_area = index, area
+        sampled.append(points[best])
+        anchor = best
+    sampled.append(points[-1])
+    return sampled
+
+
+def _point_xy(point):
+    return float(point["age_day"]), float(point["value"])
+
+
+def downsample(series, points):
+    """Reduce a growth *series* to at most *points* points."""
+    return largest_triangle_three_buckets(series, points, _point_xy)
+
+
+def _daily_series(records, start_date, aggregate):
+    rows = records.order_by().values("date").annotate(value=aggregate).order_by("date")
+    return [
+        {
+            "age_day": (row["date"] - start_date).days,
+            "date": row["date"],
+            "value": float(row["value"] or 0),
+        }
+        for row in rows
+    ]
+
+
+def build_growth_series(batch):
+    """
+    Return ``{"weight_g", "feed_kg", "deaths"}`` daily series for *batch*,
+    one point per recorded day keyed by the batch's age in days.
+    """
+    from apps.birds.services.archive_service import batch_records
+
+    start_date = batch.collection_date.date()
+    return {
+        "weight_g": _daily_series(
+            batch_records(batch, "weight_records"), start_date, Avg("average_weight")
+        ),
+        "feed_kg": _daily_series(
+            batch_records(batch, "feed_records"), start_date, Sum("quantity_kg")
+        ),
+        "deaths": _daily_series(batch.daily_mortality.all(), start_date, Sum("deaths")),
+    }
+
+
+def _growth_curve_key(batch_id):
+    return f"growth_curve:{batch_id}"
+
+
+def get_growth_series(batch):
+    """Return the (cached) full growth series for *batch*."""
+    key = _growth_curve_key(batch.pk)
+    series = cache.get(key)
+    if series is None:
+        series = build_growth_series(batch)
+        cache.set(key, series, GROWTH_CURVE_CACHE_TIMEOUT)
+    return series
+
+
+def get_growth_curve(batch, points=GROWTH_CURVE_DEFAULT_POINTS):
+    """
+    Return *batch*'s growth series, each downsampled to *points* points,
+    along with the number of recorded days per series.
+    """
+    series = get_growth_series(batch)
+    return {
+        "series": {name: downsample(data, points) for name, data in series.items()},
+        "recorded_days": {name: len(data) for name, data in series.items()},
+    }
+
+
+def invalidate_growth_curve(batch_id):
+    """Drop the cached growth series; call after any record write for the batch."""
+    if batch_id is not None:
+        cache.delete(_growth_curve_key(batch_id))
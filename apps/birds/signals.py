@@ -0,0 +1,67 @@
+"""Signal handlers for the birds app."""
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.birds.models.models import Batch
+from apps.birds.services import batch_service
+from apps.birds.services.archive_service import ARCHIVE_MODELS, check_not_archived
+from apps.birds.services.growth_service import invalidate_growth_curve
+from apps.birds.services.batch_service import invalidate_batch_statistics
+from apps.health.models.models import HealthRecord, MortalityRecord
+from apps.production.models.models import FeedRecord, WeightRecord
+from core.signals import deleted_with_batch, previous_state, remember_previous
+
+# Record models whose writes feed Batch running totals.
+RUNNING_TOTAL_SENDERS = [FeedRecord, WeightRecord, MortalityRecord, HealthRecord]
+
+
+@receiver(post_save, sender=Batch)
+@receiver(post_delete, sender=Batch)
+def batch_changed(sender, instance, **kwargs):
+    """Drop the organization's cached batch statistics."""
+    invalidate_batch_statistics(instance.organization_id)
+
+
+@receiver(post_delete, sender=Batch)
+def batch_deleted(sender, instance, **kwargs):
+    """Record deletes skip the growth curve when the batch goes with them."""
+    invalidate_growth_curve(instance.pk)
+
+
+def record_saved(sender, instance, created, raw=False, **kwargs):
+    """Apply a saved record to its batch's running totals and growth curve."""
+    if raw:
+        return
+    previous = previous_state(instance)
+    if created or previous is None:
+        batch_service.record_added(instance)
+    else:
+        batch_service.record_changed(previous, instance)
+        invalidate_growth_curve(previous.batch_id)
+    invalidate_growth_curve(instance.batch_id)
+
+
+def record_deleted(sender, instance, **kwargs):
+    """Remove a deleted record from its batch's running totals and growth curve."""
+    if deleted_with_batch(kwargs.get("origin")):
+        # The batch itself is going away with its records.
+        return
+    batch_service.record_removed(instance)
+    invalidate_growth_curve(instance.batch_id)
+
+
+def record_saving(sender, instance, raw=False, **kwargs):
+    """Refuse hot-table writes for a batch whose records were archived."""
+    if not raw:
+        check_not_archived(instance.batch)
+
+
+for label in ARCHIVE_MODELS:
+    pre_save.connect(record_saving, sender=apps.get_model(label))
+
+for model in RUNNING_TOTAL_SENDERS:
+    pre_save.connect(remember_previous, sender=model)
+    post_save.connect(record_saved, sender=model)
+    post_delete.connect(record_deleted, sender=model)
@@ -0,0 +1,18 @@
+"""Celery tasks for the birds app."""
+
+import logging
+
+from celery import shared_task
+
+from apps.birds.services import archive_service
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def archive_sold_batches():
+    """Move the records of long-sold batches into the archive tables."""
+    batches, rows = archive_service.archive_sold_batches()
+    if batches:
+        logger.info("Archived %s batch(es), %s record(s)", batches, rows)
+    return batches
@@ -0,0 +1,23 @@
+"""Shared test helpers and factories for the birds app."""
+
+import itertools
+
+from apps.birds.models.models import Batch
+
+_batch_numbers = itertools.count(1)
+
+
+def create_batch(organization, created_by=None, initial_count=1000, **kwargs):
+    """Create an active batch with a unique batch number."""
+    defaults = {
+        "batch_number": f"B-{next(_batch_numbers):05d}",
+        "supplier": "Test Hatchery",
+        "current_count": initial_count,
+    }
+    defaults.update(kwargs)
+    return Batch.objects.create(
+        organization=organization,
+        created_by=created_by or organization.owner,
+        initial_count=initial_count,
+        **defaults,
+    )
@@ -0,0 +1,225 @@
+"""Tests for moving the records of sold batches into the archive tables."""
+
+import json
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.models.models import Batch
+from apps.birds.services.archive_service import (
+    archive_batch,
+    archive_sold_batches,
+    batch_records,
+)
+from apps.birds.services.growth_service import get_growth_curve
+from apps.birds.tests.factories import create_batch
+from apps.health.models.models import ArchivedMortalityRecord, MortalityRecord
+from apps.health.tests.factories import create_mortality_record
+from apps.production.models.models import (
+    ArchivedFeedRecord,
+    ArchivedWeightRecord,
+    FeedRecord,
+    WeightRecord,
+)
+from apps.production.tests.factories import create_feed_record, create_weight_record
+from apps.users.tests.factories import create_organization, create_user
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+def sold(batch, days_ago=0):
+    """Mark *batch* sold, last updated *days_ago* days back."""
+    Batch.objects.filter(pk=batch.pk).update(
+        status="sold", updated_at=timezone.now() - timedelta(days=days_ago)
+    )
+    batch.refresh_from_db()
+    return batch
+
+
+class ArchiveBatchTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="archive@test.com", username="archive")
+        self.org = create_organization(self.user, name="Archive Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.today = timezone.localdate()
+
+    def test_moves_rows_and_keeps_ids_and_totals(self):
+        weight = create_weight_record(self.batch, "400")
+        feed = create_feed_record(self.batch, "12")
+        mortality = create_mortality_record(self.batch, count=3)
+        kept = create_feed_record(self.other, "5")
+        sold(self.batch)
+
+        moved = archive_batch(self.batch)
+
+        self.assertEqual(moved, 3)
+        self.assertIsNotNone(Batch.objects.get(pk=self.batch.pk).archived_at)
+        self.assertFalse(WeightRecord.objects.filter(batch=self.batch).exists())
+        self.assertFalse(FeedRecord.objects.filter(batch=self.batch).exists())
+        self.assertFalse(MortalityRecord.objects.filter(batch=self.batch).exists())
+        self.assertEqual(ArchivedWeightRecord.objects.get().pk, weight.pk)
+        self.assertEqual(ArchivedFeedRecord.objects.get().pk, feed.pk)
+        self.assertEqual(ArchivedMortalityRecord.objects.get().pk, mortality.pk)
+        self.assertTrue(FeedRecord.objects.filter(pk=kept.pk).exists())
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.deaths_total, 3)
+        self.assertEqual(self.batch.feed_kg_total, 12)
+
+    def test_archived_batch_is_not_archived_twice(self):
+        sold(self.batch)
+        self.assertEqual(archive_batch(self.batch), 0)
+
+        self.assertIsNone(archive_batch(self.batch))
+
+    def test_reopened_batch_is_not_archived(self):
+        create_weight_record(self.batch, "400")
+        stale = sold(self.batch)
+        Batch.objects.filter(pk=self.batch.pk).update(status="active")
+
+        self.assertIsNone(archive_batch(stale))
+
+        self.assertIsNone(Batch.objects.get(pk=self.batch.pk).archived_at)
+        self.assertTrue(WeightRecord.objects.filter(batch=self.batch).exists())
+
+    def test_archive_sold_batches_picks_old_sold_batches(self):
+        old = sold(self.batch, days_ago=200)
+        create_feed_record(old, "8")
+        sold(self.other, days_ago=10)
+        create_batch(self.org)
+
+        self.assertEqual(archive_sold_batches(older_than_days=180), (1, 1))
+
+        self.assertEqual(list(Batch.objects.filter(archived_at__isnull=False)), [old])
+        self.assertEqual(archive_sold_batches(older_than_days=180), (0, 0))
+
+    def test_reads_follow_the_batch_to_the_archive(self):
+        create_weight_record(self.batch, "400", date=self.today - timedelta(days=1))
+        sold(self.batch)
+        archive_batch(self.batch)
+        self.batch.refresh_from_db()
+
+        self.assertEqual(
+            [
+                record.average_weight
+                for record in batch_records(self.batch, "weight_records")
+            ],
+            [400],
+        )
+        self.assertEqual(
+            [
+                point["value"]
+                for point in get_growth_curve(self.batch)["series"]["weight_g"]
+            ],
+            [400.0],
+        )
+
+    def test_orm_writes_to_an_archived_batch_are_refused(self):
+        sold(self.batch)
+        archive_batch(self.batch)
+        self.batch.refresh_from_db()
+
+        with self.assertRaises(ValidationError):
+            create_weight_record(self.batch, "900")
+        with self.assertRaises(ValidationError):
+            create_mortality_record(self.batch)
+        self.assertFalse(WeightRecord.objects.filter(batch=self.batch).exists())
+
+
+class ArchivedBatchApiTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="archiveapi@test.com", username="archiveapi")
+        self.org = create_organization(self.user, name="Archive API Org")
+        self.client = get_auth_client(self.user, self.org)
+        self.batch = create_batch(self.org)
+        self.active = create_batch(self.org)
+        self.today = timezone.localdate()
+        self.archived_weight = create_weight_record(
+            self.batch, "400", date=self.today - timedelta(days=3)
+        )
+        self.hot_weight = create_weight_record(self.active, "600")
+        sold(self.batch)
+        archive_batch(self.batch)
+
+    def _weight_payload(self, batch, average_weight="900"):
+        return {
+            "batch": batch.pk,
+            "date": self.today.isoformat(),
+            "sample_size": 10,
+            "average_weight": average_weight,
+            "min_weight": "100",
+            "max_weight": "1000",
+            "age_in_days": 20,
+        }
+
+    def test_new_records_for_an_archived_batch_are_rejected(self):
+        resp = self.client.post(
+            reverse("weight_record_list_create"),
+            self._weight_payload(self.batch),
+            format="json",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("batch", resp.data)
+        self.assertFalse(WeightRecord.objects.filter(batch=self.batch).exists())
+
+    def test_bulk_rows_for_an_archived_batch_are_rejected(self):
+        resp = self.client.post(
+            reverse("weight_record_bulk_create"),
+            [self._weight_payload(self.active), self._weight_payload(self.batch)],
+            format="json",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["row"] for error in resp.data["errors"]], [2])
+        self.assertIn("batch", resp.data["errors"][0]["errors"])
+        self.assertEqual(WeightRecord.objects.count(), 1)
+
+    def test_include_archived_unions_the_archive_table(self):
+        url = reverse("weight_record_list_create")
+
+        hot = self.client.get(url)
+        both = self.client.get(url, {"include_archived": "true"})
+
+        self.assertEqual(
+            [row["id"] for row in hot.data["results"]], [self.hot_weight.pk]
+        )
+        self.assertEqual(
+            [row["id"] for row in both.data["results"]],
+            [self.hot_weight.pk, self.archived_weight.pk],
+        )
+        filtered = self.client.get(
+            url, {"include_archived": "true", "batch": self.batch.pk}
+        )
+        self.assertEqual(
+            [row["id"] for row in filtered.data["results"]], [self.archived_weight.pk]
+        )
+
+    def test_include_archived_refuses_cursor_pagination(self):
+        resp = self.client.get(
+            reverse("weight_record_list_create"),
+            {"include_archived": "true", "pagination": "cursor"},
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("pagination", json.loads(resp.content))
@@ -0,0 +1,142 @@
+"""Tests for the batch KPI annotations and the filters built on them."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.models.models import Batch
+from apps.birds.tests.factories import create_batch
+from apps.users.tests.factories import create_organization, create_user
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+def collected(batch, ago):
+    """Move *batch*'s collection date to *ago* before now."""
+    Batch.objects.filter(pk=batch.pk).update(collection_date=timezone.now() - ago)
+    batch.refresh_from_db()
+    return batch
+
+
+class BatchKpiAnnotationTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="kpis@test.com", username="kpis")
+        self.org = create_organization(self.user, name="KPI Org")
+
+    def _annotated(self, batch):
+        return Batch.objects.with_kpis().get(pk=batch.pk)
+
+    def test_rates_and_age(self):
+        batch = collected(
+            create_batch(self.org, initial_count=200, current_count=150),
+            timedelta(days=15, hours=3),
+        )
+
+        annotated = self._annotated(batch)
+
+        self.assertEqual(annotated.age_days, 15)
+        self.assertEqual(annotated.age_weeks, 2.1)
+        self.assertEqual(annotated.survival_pct, 75.0)
+        self.assertEqual(annotated.mortality_pct, 25.0)
+
+    def test_empty_batch_rates_are_zero(self):
+        batch = create_batch(self.org, initial_count=0, current_count=0)
+
+        annotated = self._annotated(batch)
+
+        self.assertEqual((annotated.survival_pct, annotated.mortality_pct), (0, 0))
+
+    def test_annotated_age_matches_python_age(self):
+        for ago in (
+            timedelta(hours=1),
+            timedelta(hours=23, minutes=59),
+            timedelta(days=1, hours=1),
+            timedelta(days=3, hours=23),
+            timedelta(days=40),
+            -timedelta(hours=5),
+        ):
+            with self.subTest(ago=ago):
+                batch = collected(create_batch(self.org), ago)
+                self.assertEqual(self._annotated(batch).age_days, batch.age_in_days)
+
+
+class BatchKpiViewTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="kpiview@test.com", username="kpiview")
+        self.org = create_organization(self.user, name="KPI View Org")
+        self.client = get_auth_client(self.user, self.org)
+        self.young = collected(
+            create_batch(self.org, initial_count=100, current_count=95),
+            timedelta(days=2, hours=1),
+        )
+        self.middle = collected(
+            create_batch(self.org, initial_count=100, current_count=80),
+            timedelta(days=10, hours=1),
+        )
+        self.old = collected(
+            create_batch(self.org, initial_count=100, current_count=90),
+            timedelta(days=30, hours=1),
+        )
+
+    def _ids(self, **params):
+        resp = self.client.get(reverse("batch_list_create"), params)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return [batch["id"] for batch in resp.data["results"]]
+
+    def test_range_filters(self):
+        self.assertEqual(self._ids(min_age_days=5, max_age_days=20), [self.middle.pk])
+        self.assertCountEqual(
+            self._ids(min_survival_rate=90), [self.young.pk, self.old.pk]
+        )
+        self.assertEqual(self._ids(max_survival_rate=85), [self.middle.pk])
+        self.assertEqual(self._ids(min_mortality_rate=15), [self.middle.pk])
+        self.assertEqual(self._ids(max_mortality_rate=5), [self.young.pk])
+
+    def test_ordering_on_annotations(self):
+        self.assertEqual(
+            self._ids(ordering="age_days"),
+            [self.young.pk, self.middle.pk, self.old.pk],
+        )
+        self.assertEqual(
+            self._ids(ordering="-survival_pct"),
+            [self.young.pk, self.old.pk, self.middle.pk],
+        )
+        self.assertEqual(
+            self._ids(ordering="mortality_pct"),
+            [self.young.pk, self.old.pk, self.middle.pk],
+        )
+
+    def test_list_and_detail_report_annotations(self):
+        resp = self.client.get(reverse("batch_detail", args=[self.middle.pk]))
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["age_in_days"], 10)
+        self.assertEqual(resp.data["survival_rate"], 80.0)
+        self.assertEqual(resp.data["mortality_rate"], 20.0)
+
+    def test_patch_returns_recomputed_rates(self):
+        url = reverse("batch_detail", args=[self.young.pk])
+
+        resp = self.client.patch(url, {"current_count": 50}, format="json")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["current_count"], 50)
+        self.assertEqual(resp.data["survival_rate"], 50.0)
+        self.assertEqual(resp.data["mortality_rate"], 50.0)
+        self.assertEqual(resp.data["age_in_days"], 2)
@@ -0,0 +1,116 @@
+"""Tests for the grouped, cached batch statistics."""
+
+from django.core.cache import cache
+from django.db.models import Avg, Sum
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.models.models import Batch
+from apps.birds.services.batch_service import (
+    compute_batch_statistics,
+    get_batch_statistics,
+)
+from apps.birds.tests.factories import create_batch
+from apps.users.tests.factories import create_organization, create_user
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+def per_status_statistics(organization):
+    """The payload as batch_statistics_view built it, one query per figure."""
+    batches = Batch.objects.filter(organization=organization)
+    active_batches = batches.filter(status="active")
+    stats = {
+        "total_flocks": batches.count(),
+        "active_batches": active_batches.count(),
+        "total_birds": active_batches.aggregate(total=Sum("current_count"))["total"]
+        or 0,
+        "average_batch_size": active_batches.aggregate(avg=Avg("current_count"))["avg"]
+        or 0,
+        "mortality_stats": {},
+    }
+    for batch_status, _ in Batch.STATUS_CHOICES:
+        if batch_status != "active":
+            count = batches.filter(status=batch_status).count()
+            if count > 0:
+                stats["mortality_stats"][batch_status] = count
+    return stats
+
+
+class BatchStatisticsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="stats@test.com", username="stats")
+        self.org = create_organization(self.user, name="Stats Org")
+
+    def test_matches_the_per_status_counts(self):
+        self.assertEqual(
+            compute_batch_statistics(self.org), per_status_statistics(self.org)
+        )
+
+        create_batch(self.org, initial_count=100)
+        create_batch(self.org, initial_count=300, current_count=250)
+        create_batch(self.org, status="sold")
+        create_batch(self.org, status="sold")
+        create_batch(self.org, initial_count=50, current_count=0, status="deceased")
+        other_org = create_organization(
+            create_user(email="elsewhere@test.com", username="elsewhere"),
+            name="Elsewhere Org",
+        )
+        create_batch(other_org, initial_count=999)
+
+        with self.assertNumQueries(1):
+            stats = compute_batch_statistics(self.org)
+
+        self.assertEqual(stats, per_status_statistics(self.org))
+        self.assertEqual(stats["total_flocks"], 5)
+        self.assertEqual(stats["total_birds"], 350)
+        self.assertEqual(stats["average_batch_size"], 175)
+        self.assertEqual(stats["mortality_stats"], {"sold": 2})
+
+    def test_snapshot_is_cached(self):
+        create_batch(self.org)
+        get_batch_statistics(self.org)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_batch_statistics(self.org)["active_batches"], 1)
+
+    def test_batch_create_update_and_delete_drop_the_snapshot(self):
+        batch = create_batch(self.org, initial_count=100)
+        self.assertEqual(get_batch_statistics(self.org)["total_birds"], 100)
+
+        create_batch(self.org, initial_count=40)
+        self.assertEqual(get_batch_statistics(self.org)["total_birds"], 140)
+
+        batch.status = "sold"
+        batch.save()
+        stats = get_batch_statistics(self.org)
+        self.assertEqual(stats["total_birds"], 40)
+        self.assertEqual(stats["mortality_stats"], {"sold": 1})
+
+        batch.delete()
+        stats = get_batch_statistics(self.org)
+        self.assertEqual(stats["total_flocks"], 1)
+        self.assertEqual(stats["mortality_stats"], {})
+
+    def test_statistics_endpoint(self):
+        create_batch(self.org, initial_count=80)
+        client = get_auth_client(self.user, self.org)
+
+        resp = client.get(reverse("batch_statistics"))
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data, per_status_statistics(self.org))
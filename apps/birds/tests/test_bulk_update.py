@@ -0,0 +1,199 @@
+"""Tests for the all-or-nothing bulk batch count update."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.models.models import Batch
+from apps.birds.services import batch_service
+from apps.birds.tests.factories import create_batch
+from apps.health.models.models import HealthRecord, Vaccination, VaccinationSchedule
+from apps.users.tests.factories import create_organization, create_user
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+class BulkBatchUpdateViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("bulk_batch_update")
+        self.user = create_user(email="bulk@test.com", username="bulk")
+        self.org = create_organization(self.user, name="Bulk Org")
+        self.first = create_batch(self.org, initial_count=100)
+        self.second = create_batch(self.org, initial_count=50)
+        self.client = get_auth_client(self.user, self.org)
+
+    def _post(self, updates):
+        return self.client.post(self.url, {"batch_updates": updates}, format="json")
+
+    def test_applies_every_update(self):
+        resp = self._post(
+            [
+                {"batch_id": self.first.pk, "new_count": 90},
+                {"batch_id": self.second.pk, "new_count": 0},
+            ]
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(resp.data["applied"])
+        self.assertEqual(resp.data["updated_count"], 2)
+        self.assertEqual(resp.data["errors"], [])
+        self.assertEqual(
+            {
+                batch["id"]: batch["current_count"]
+                for batch in resp.data["updated_batches"]
+            },
+            {self.first.pk: 90, self.second.pk: 0},
+        )
+        self.second.refresh_from_db()
+        self.assertEqual(self.second.status, "deceased")
+
+    def test_invalid_item_rolls_back_everything(self):
+        other_org = create_organization(
+            create_user(email="other@test.com", username="other"), name="Other Org"
+        )
+        foreign = create_batch(other_org)
+
+        resp = self._post(
+            [
+                {"batch_id": self.first.pk, "new_count": 90},
+                {"batch_id": self.second.pk, "new_count": 51},
+                {"batch_id": foreign.pk, "new_count": 1},
+                {"batch_id": "x", "new_count": 1},
+                {"batch_id": self.first.pk, "new_count": -1},
+            ]
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(resp.data["applied"])
+        self.assertEqual(resp.data["updated_count"], 0)
+        self.assertEqual(resp.data["updated_batches"], [])
+        self.assertEqual(
+            [(result["ok"], result.get("error")) for result in resp.data["results"]],
+            [
+                (True, None),
+                (False, "Current count cannot exceed initial count"),
+                (False, "Batch not found"),
+                (False, "batch_id must be an integer."),
+                (False, "new_count cannot be negative."),
+            ],
+        )
+        self.assertEqual(len(resp.data["errors"]), 4)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.current_count, 100)
+
+    def test_empty_or_oversized_payload_rejected(self):
+        self.assertEqual(self._post([]).status_code, status.HTTP_400_BAD_REQUEST)
+        updates = [{"batch_id": self.first.pk, "new_count": 1}] * (
+            batch_service.MAX_BULK_UPDATE_ITEMS + 1
+        )
+        self.assertEqual(self._post(updates).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class BulkUpdateCountsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="counts@test.com", username="counts")
+        self.org = create_organization(self.user, name="Counts Org")
+        self.batch = create_batch(self.org, initial_count=100)
+
+    def test_closing_a_batch_clears_its_vaccination_schedule(self):
+        record = HealthRecord.objects.create(
+            batch=self.batch,
+            record_type="vaccination",
+            date=timezone.now(),
+            description="Newcastle",
+            created_by=self.user,
+        )
+        Vaccination.objects.create(
+            health_record=record,
+            vaccine_name="ND",
+            manufacturer="Vet Co",
+            batch_number="V1",
+            dosage="1 drop",
+            administration_method="eye drop",
+            birds_vaccinated=100,
+            next_vaccination_date=timezone.localdate() + timedelta(days=7),
+        )
+        self.assertTrue(VaccinationSchedule.objects.filter(batch=self.batch).exists())
+
+        results, applied = batch_service.bulk_update_counts(
+            self.org, [{"batch_id": self.batch.pk, "new_count": 0}]
+        )
+
+        self.assertTrue(applied)
+        self.assertFalse(VaccinationSchedule.objects.filter(batch=self.batch).exists())
+
+    def test_invalidates_cached_statistics(self):
+        self.assertEqual(
+            batch_service.get_batch_statistics(self.org)["total_birds"], 100
+        )
+
+        batch_service.bulk_update_counts(
+            self.org, [{"batch_id": self.batch.pk, "new_count": 60}]
+        )
+
+        self.assertEqual(
+            batch_service.get_batch_statistics(self.org)["total_birds"], 60
+        )
+
+    def test_only_changed_batches_are_written(self):
+        other = create_batch(self.org, initial_count=100)
+        stamps = dict(
+            Batch.objects.filter(organization=self.org).values_list("pk", "updated_at")
+        )
+
+        with patch.object(
+            batch_service, "_batches_updated", wraps=batch_service._batches_updated
+        ) as bookkeeping:
+            results, applied = batch_service.bulk_update_counts(
+                self.org,
+                [
+                    {"batch_id": self.batch.pk, "new_count": 100},
+                    {"batch_id": other.pk, "new_count": 80},
+                ],
+            )
+
+        self.assertTrue(applied)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(list(bookkeeping.call_args.args[1]), [other])
+        self.batch.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.batch.updated_at, stamps[self.batch.pk])
+        self.assertGreater(other.updated_at, stamps[other.pk])
+
+    def test_no_op_update_writes_nothing(self):
+        batch_service.get_batch_statistics(self.org)
+
+        with patch.object(batch_service, "_batches_updated") as bookkeeping:
+            with CaptureQueriesContext(connection) as queries:
+                results, applied = batch_service.bulk_update_counts(
+                    self.org, [{"batch_id": self.batch.pk, "new_count": 100}]
+                )
+
+        self.assertTrue(applied)
+        self.assertTrue(results[0]["ok"])
+        bookkeeping.assert_not_called()
+        self.assertFalse(
+            [query for query in queries if query["sql"].startswith("UPDATE")]
+        )
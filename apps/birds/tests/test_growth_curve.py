@@ -0,0 +1,98 @@
+"""Tests for the cached per-batch growth series."""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.birds.services.growth_service import (
+    _growth_curve_key,
+    downsample,
+    get_growth_series,
+)
+from apps.birds.tests.factories import create_batch
+from apps.health.tests.factories import create_mortality_record
+from apps.production.tests.factories import create_feed_record, create_weight_record
+from apps.users.tests.factories import create_organization, create_user
+
+
+def _values(series):
+    return [point["value"] for point in series]
+
+
+class GrowthSeriesCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="growth@test.com", username="growth")
+        self.org = create_organization(self.user, name="Growth Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.today = timezone.localdate()
+
+    def _cached(self, batch):
+        return cache.get(_growth_curve_key(batch.pk)) is not None
+
+    def test_series_is_cached_until_a_record_is_created(self):
+        create_weight_record(self.batch, "500")
+        self.assertEqual(_values(get_growth_series(self.batch)["weight_g"]), [500.0])
+        self.assertTrue(self._cached(self.batch))
+
+        create_feed_record(self.batch, "7", date=self.today - timedelta(days=1))
+        self.assertFalse(self._cached(self.batch))
+        self.assertEqual(_values(get_growth_series(self.batch)["feed_kg"]), [7.0])
+
+    def test_edit_refreshes_the_series(self):
+        weight = create_weight_record(self.batch, "500")
+        create_mortality_record(self.batch, count=2)
+        get_growth_series(self.batch)
+
+        weight.average_weight = Decimal("650")
+        weight.save()
+
+        series = get_growth_series(self.batch)
+        self.assertEqual(_values(series["weight_g"]), [650.0])
+        self.assertEqual(_values(series["deaths"]), [2.0])
+
+    def test_move_refreshes_both_batches(self):
+        feed = create_feed_record(self.batch, "7")
+        get_growth_series(self.batch)
+        get_growth_series(self.other)
+
+        feed.batch = self.other
+        feed.save()
+
+        self.assertEqual(get_growth_series(self.batch)["feed_kg"], [])
+        self.assertEqual(_values(get_growth_series(self.other)["feed_kg"]), [7.0])
+
+    def test_delete_refreshes_the_series(self):
+        mortality = create_mortality_record(self.batch, count=2)
+        self.assertEqual(_values(get_growth_series(self.batch)["deaths"]), [2.0])
+
+        mortality.delete()
+
+        self.assertEqual(get_growth_series(self.batch)["deaths"], [])
+
+    def test_batch_delete_drops_only_its_series(self):
+        create_feed_record(self.batch, "7")
+        create_feed_record(self.other, "3")
+        get_growth_series(self.batch)
+        get_growth_series(self.other)
+
+        self.batch.delete()
+
+        self.assertFalse(self._cached(self.batch))
+        self.assertTrue(self._cached(self.other))
+
+
+class DownsampleTests(TestCase):
+
+    def test_keeps_end_points_and_budget(self):
+        series = [{"age_day": day, "value": float(day % 7)} for day in range(100)]
+        sampled = downsample(series, 10)
+        self.assertEqual(len(sampled), 10)
+        self.assertEqual(sampled[0], series[0])
+        self.assertEqual(sampled[-1], series[-1])
+        self.assertEqual(downsample(series[:5], 10), series[:5])
@@ -0,0 +1,127 @@
+"""Tests for the Batch running totals kept current by record signals."""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.birds.models.models import Batch
+from apps.birds.services.batch_service import recalculate_running_totals
+from apps.birds.tests.factories import create_batch
+from apps.health.tests.factories import create_health_record, create_mortality_record
+from apps.production.tests.factories import create_feed_record, create_weight_record
+from apps.users.tests.factories import create_organization, create_user
+
+
+class RunningTotalsTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="totals@test.com", username="totals")
+        self.org = create_organization(self.user, name="Totals Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.today = timezone.localdate()
+        self.yesterday = self.today - timedelta(days=1)
+
+    def _totals(self, batch):
+        batch.refresh_from_db()
+        return {field: getattr(batch, field) for field in Batch.RUNNING_TOTAL_FIELDS}
+
+    def assertMatchesRecalculation(self, *batches):
+        expected = [self._totals(batch) for batch in batches]
+        recalculate_running_totals(
+            Batch.objects.filter(pk__in=[batch.pk for batch in batches])
+        )
+        self.assertEqual([self._totals(batch) for batch in batches], expected)
+
+    def test_create_adds_to_totals(self):
+        create_feed_record(self.batch, "10", "2", date=self.today)
+        create_feed_record(self.batch, "5", "3", date=self.yesterday)
+        create_mortality_record(self.batch, count=4, date=self.yesterday)
+        create_health_record(self.batch, cost=Decimal("12.50"))
+        create_weight_record(self.batch, "800", date=self.today)
+        create_weight_record(self.batch, "700", date=self.yesterday)
+
+        totals = self._totals(self.batch)
+        self.assertEqual(totals["feed_kg_total"], Decimal("15"))
+        self.assertEqual(totals["feed_cost_total"], Decimal("35"))
+        self.assertEqual(totals["deaths_total"], 4)
+        self.assertEqual(totals["health_cost_total"], Decimal("12.50"))
+        # An older record does not replace the newest values.
+        self.assertEqual(totals["last_feed_date"], self.today)
+        self.assertEqual(totals["last_weight_g"], Decimal("800"))
+        self.assertEqual(totals["last_mortality_date"], self.yesterday)
+        self.assertMatchesRecalculation(self.batch)
+
+    def test_edit_applies_the_difference(self):
+        feed = create_feed_record(self.batch, "10", "2", date=self.today)
+        weight = create_weight_record(self.batch, "800", date=self.today)
+        create_weight_record(self.batch, "700", date=self.yesterday)
+        mortality = create_mortality_record(self.batch, count=4)
+
+        feed.quantity_kg = Decimal("4")
+        feed.date = self.yesterday
+        feed.save()
+        weight.date = self.today - timedelta(days=2)
+        weight.save()
+        mortality.count = 1
+        mortality.save()
+
+        totals = self._totals(self.batch)
+        self.assertEqual(totals["feed_kg_total"], Decimal("4"))
+        self.assertEqual(totals["feed_cost_total"], Decimal("8"))
+        self.assertEqual(totals["last_feed_date"], self.yesterday)
+        self.assertEqual(totals["last_weight_g"], Decimal("700"))
+        self.assertEqual(totals["last_weight_date"], self.yesterday)
+        self.assertEqual(totals["deaths_total"], 1)
+        self.assertMatchesRecalculation(self.batch)
+
+    def test_move_between_batches(self):
+        feed = create_feed_record(self.batch, "10", "2")
+        mortality = create_mortality_record(self.batch, count=3)
+        health = create_health_record(self.batch, cost=Decimal("9"))
+
+        for record in (feed, mortality, health):
+            record.batch = self.other
+            record.save()
+
+        source, target = self._totals(self.batch), self._totals(self.other)
+        self.assertEqual(source["feed_kg_total"], 0)
+        self.assertIsNone(source["last_feed_date"])
+        self.assertEqual(source["deaths_total"], 0)
+        self.assertEqual(source["health_cost_total"], 0)
+        self.assertEqual(target["feed_kg_total"], Decimal("10"))
+        self.assertEqual(target["last_feed_date"], self.today)
+        self.assertEqual(target["deaths_total"], 3)
+        self.assertEqual(target["health_cost_total"], Decimal("9"))
+        self.assertMatchesRecalculation(self.batch, self.other)
+
+    def test_delete_takes_record_back_out(self):
+        create_feed_record(self.batch, "10", "2", date=self.yesterday)
+        newest = create_feed_record(self.batch, "5", "2", date=self.today)
+        mortality = create_mortality_record(self.batch, count=2)
+        weight = create_weight_record(self.batch, "800")
+
+        newest.delete()
+        mortality.delete()
+        weight.delete()
+
+        totals = self._totals(self.batch)
+        self.assertEqual(totals["feed_kg_total"], Decimal("10"))
+        self.assertEqual(totals["last_feed_date"], self.yesterday)
+        self.assertEqual(totals["deaths_total"], 0)
+        self.assertIsNone(totals["last_mortality_date"])
+        self.assertIsNone(totals["last_weight_g"])
+        self.assertMatchesRecalculation(self.batch)
+
+    def test_batch_delete_cascades_without_touching_other_batches(self):
+        create_feed_record(self.batch, "10", "2")
+        create_mortality_record(self.batch, count=2)
+        create_feed_record(self.other, "3", "2")
+        before = self._totals(self.other)
+
+        self.batch.delete()
+
+        self.assertFalse(Batch.objects.filter(pk=self.batch.pk).exists())
+        self.assertEqual(self._totals(self.other), before)
@@ -4,6 +4,7 @@ from apps.health.models.models import (
     Vaccination,
     Medication,
     MortalityRecord,
+    VaccinationSchedule,
 )
 
 
@@ -47,3 +48,11 @@ class MortalityRecordAdmin(admin.ModelAdmin):
     list_filter = ("cause_category", "date", "created_at")
     search_fields = ("flock__flock_id", "specific_cause")
     readonly_fields = ("created_at",)
+
+
+@admin.register(VaccinationSchedule)
+class VaccinationScheduleAdmin(admin.ModelAdmin):
+    list_display = ("vaccine_name", "batch", "organization", "due_date", "reminder")
+    list_filter = ("due_date",)
+    search_fields = ("vaccine_name", "batch__batch_number")
+    raw_id_fields = ("vaccination", "batch", "reminder")
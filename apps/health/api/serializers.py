@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from apps.birds.api.serializers import UnarchivedBatchMixin
 from apps.health.models.models import (
     HealthRecord,
     Vaccination,
@@ -128,7 +129,7 @@ class HealthRecordCreateSerializer(serializers.ModelSerializer):
         return health_record
 
 
-class MortalityRecordSerializer(serializers.ModelSerializer):
+class MortalityRecordSerializer(UnarchivedBatchMixin, serializers.ModelSerializer):
     """
     Serializer for MortalityRecord model
     """
@@ -23,9 +23,24 @@ urlpatterns = [
         name="mortality_record_detail",
     ),
     path("dashboard/", views.health_dashboard_view, name="health_dashboard"),
+    path(
+        "vaccinations/calendar/",
+        views.vaccination_calendar_view,
+        name="vaccination_calendar",
+    ),
     path(
         "flock/<int:flock_id>/history/",
         views.flock_health_history_view,
         name="flock_health_history",
     ),
+    path(
+        "flock/<int:flock_id>/history/health-records/",
+        views.BatchHealthRecordHistoryView.as_view(),
+        name="flock_health_record_history",
+    ),
+    path(
+        "flock/<int:flock_id>/history/mortality-records/",
+        views.BatchMortalityRecordHistoryView.as_view(),
+        name="flock_mortality_record_history",
+    ),
 ]
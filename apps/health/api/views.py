@@ -1,19 +1,33 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count, Sum, Avg
+from django.db.models import Count, Q
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta
 from apps.birds.models.models import Batch
-from apps.health.models.models import HealthRecord, MortalityRecord
+from apps.birds.api.mixins import IncludeArchivedMixin
+from apps.birds.services.archive_service import batch_records
+from apps.health.services.mortality_rollup_service import mortality_summary
+from apps.health.services.mortality_service import open_mortality_alerts
+from apps.health.services.vaccination_service import (
+    MAX_CALENDAR_DAYS,
+    due_vaccinations,
+)
+from apps.health.models.models import DailyMortality, HealthRecord, MortalityRecord
 from .serializers import (
     HealthRecordSerializer,
     HealthRecordCreateSerializer,
     MortalityRecordSerializer,
 )
 from apps.users.permissions import IsOrganizationMember
+from core.pagination import KeysetPagination, OptionalKeysetPagination
 
 
 def _get_org(request):
@@ -55,11 +69,12 @@ class HealthRecordDetailView(generics.RetrieveUpdateDestroyAPIView):
         return HealthRecord.objects.filter(organization=org)
 
 
-class MortalityRecordListCreateView(generics.ListCreateAPIView):
+class MortalityRecordListCreateView(IncludeArchivedMixin, generics.ListCreateAPIView):
     """API view for listing and creating mortality records."""
 
     serializer_class = MortalityRecordSerializer
     permission_classes = [permissions.IsAuthenticated, IsOrganizationMember]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["cause_category", "batch", "date"]
     search_fields = ["specific_cause", "batch__batch_number"]
@@ -86,6 +101,18 @@ class MortalityRecordDetailView(generics.RetrieveUpdateDestroyAPIView):
         return MortalityRecord.objects.filter(organization=org)
 
 
+def _schedule_entry(entry):
+    return {
+        "id": entry.pk,
+        "vaccination_id": entry.vaccination_id,
+        "batch_id": entry.batch_id,
+        "batch_number": entry.batch.batch_number,
+        "vaccine_name": entry.vaccine_name,
+        "due_date": entry.due_date,
+        "reminder_id": entry.reminder_id,
+    }
+
+
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def health_dashboard_view(request):
@@ -103,62 +130,41 @@ def health_dashboard_view(request):
         organization=org, batch__in=batches
     ).order_by("-date")[:10]
 
-    # Upcoming vaccinations
-    upcoming_vaccinations = HealthRecord.objects.filter(
-        organization=org,
-        batch__in=batches,
-        record_type="vaccination",
-        vaccination_details__next_vaccination_date__gte=timezone.now().date(),
-        vaccination_details__next_vaccination_date__lte=timezone.now().date()
-        + timedelta(days=30),
-    ).order_by("vaccination_details__next_vaccination_date")
-
-    # Mortality statistics (last 30 days)
-    thirty_days_ago = timezone.now().date() - timedelta(days=30)
-    recent_mortality = MortalityRecord.objects.filter(
-        organization=org, batch__in=batches, date__gte=thirty_days_ago
-    )
+    # Upcoming vaccinations, from the maintained schedule
+    today = timezone.now().date()
+    upcoming_vaccinations = due_vaccinations(org, today, today + timedelta(days=30))
 
-    mortality_by_cause = list(
-        recent_mortality.values("cause_category")
-        .annotate(total_count=Sum("count"))
-        .order_by("-total_count")
+    # Mortality statistics (last 30 days), from the daily rollup
+    thirty_days_ago = timezone.now().date() - timedelta(days=30)
+    mortality = mortality_summary(
+        DailyMortality.objects.filter(
+            organization=org, batch__in=batches, date__gte=thirty_days_ago
+        )
     )
 
-    # Health alerts
-    alerts = []
-    for batch in batches:
-        batch_mortality = (
-            recent_mortality.filter(batch=batch).aggregate(total=Sum("count"))["total"]
-            or 0
-        )
-        if batch_mortality > 0 and batch.current_count > 0:
-            mortality_rate = (batch_mortality / batch.current_count) * 100
-            if mortality_rate > 5:
-                alerts.append(
-                    {
-                        "type": "high_mortality",
-                        "batch_id": batch.batch_number,
-                        "message": f"High mortality rate: {mortality_rate:.1f}% in last 30 days",
-                        "severity": "high" if mortality_rate > 10 else "medium",
-                    }
-                )
+    # Health alerts, precomputed by the evaluate_mortality_alerts task
+    alerts = [
+        {
+            "type": "high_mortality",
+            "batch_id": alert.batch.batch_number,
+            "message": alert.message,
+            "severity": alert.severity,
+        }
+        for alert in open_mortality_alerts(batches)
+    ]
 
     dashboard_data = {
         "recent_health_records": HealthRecordSerializer(recent_records, many=True).data,
-        "upcoming_vaccinations": HealthRecordSerializer(
-            upcoming_vaccinations, many=True
-        ).data,
+        "upcoming_vaccinations": [
+            _schedule_entry(entry) for entry in upcoming_vaccinations
+        ],
         "mortality_statistics": {
-            "total_deaths_30_days": recent_mortality.aggregate(total=Sum("count"))[
-                "total"
-            ]
-            or 0,
-            "by_cause": mortality_by_cause,
-            "average_age_at_death": recent_mortality.aggregate(avg=Avg("age_at_death"))[
-                "avg"
-            ]
-            or 0,
+            "total_deaths_30_days": mortality["total"],
+            "by_cause": [
+                {"cause_category": row["cause_category"], "total_count": row["total"]}
+                for row in mortality["by_cause"]
+            ],
+            "average_age_at_death": mortality["average_age_at_death"],
         },
         "health_alerts": alerts,
         "summary": {
@@ -180,50 +186,153 @@ def health_dashboard_view(request):
 
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
-def flock_health_history_view(request, flock_id):
-    """API view for getting complete health history of a batch."""
+def vaccination_calendar_view(request):
+    """
+    Scheduled vaccinations due between ``start`` and ``end`` (YYYY-MM-DD,
+    inclusive; default today and 30 days ahead), ordered by due date.
+    """
     org = _get_org(request)
     if not org:
         return Response(
             {"error": "No organization selected"}, status=status.HTTP_400_BAD_REQUEST
         )
 
+    today = timezone.now().date()
     try:
-        batch = Batch.objects.get(id=flock_id, organization=org)
+        start = request.query_params.get("start")
+        start = datetime.strptime(start, "%Y-%m-%d").date() if start else today
+        end = request.query_params.get("end")
+        end = (
+            datetime.strptime(end, "%Y-%m-%d").date()
+            if end
+            else start + timedelta(days=30)
+        )
+    except ValueError:
+        return Response(
+            {"error": "start and end must be dates in YYYY-MM-DD format"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if end < start or (end - start).days > MAX_CALENDAR_DAYS:
+        return Response(
+            {"error": f"end must be within {MAX_CALENDAR_DAYS} days after start"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-        health_records = batch.health_records.all().order_by("-date")
-        mortality_records = batch.mortality_records.all().order_by("-date")
-
-        total_vaccinations = health_records.filter(record_type="vaccination").count()
-        total_treatments = health_records.filter(record_type="treatment").count()
-        total_deaths = mortality_records.aggregate(total=Sum("count"))["total"] or 0
-
-        health_history = {
-            "batch": {
-                "id": batch.id,
-                "batch_id": batch.batch_number,
-                "current_count": batch.current_count,
-                "age_in_days": batch.age_in_days,
-            },
-            "health_records": HealthRecordSerializer(health_records, many=True).data,
-            "mortality_records": MortalityRecordSerializer(
-                mortality_records, many=True
-            ).data,
-            "health_metrics": {
-                "total_vaccinations": total_vaccinations,
-                "total_treatments": total_treatments,
-                "total_deaths": total_deaths,
-                "mortality_rate": (
-                    (total_deaths / batch.initial_count * 100)
-                    if batch.initial_count > 0
-                    else 0
-                ),
-                "health_cost": health_records.aggregate(total=Sum("cost"))["total"]
-                or 0,
-            },
+    return Response(
+        {
+            "start": start,
+            "end": end,
+            "results": [
+                _schedule_entry(entry) for entry in due_vaccinations(org, start, end)
+            ],
         }
+    )
 
-        return Response(health_history)
 
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def flock_health_history_view(request, flock_id):
+    """
+    API view for a batch's health metrics. The records themselves are served
+    by the paginated/streamable health-records and mortality-records views.
+    """
+    org = _get_org(request)
+    if not org:
+        return Response(
+            {"error": "No organization selected"}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        batch = Batch.objects.get(id=flock_id, organization=org)
     except Batch.DoesNotExist:
         return Response({"error": "Batch not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    counts = batch.health_records.aggregate(
+        total_vaccinations=Count("pk", filter=Q(record_type="vaccination")),
+        total_treatments=Count("pk", filter=Q(record_type="treatment")),
+    )
+    total_deaths = batch.deaths_total
+
+    health_history = {
+        "batch": {
+            "id": batch.id,
+            "batch_id": batch.batch_number,
+            "current_count": batch.current_count,
+            "age_in_days": batch.age_in_days,
+        },
+        "health_metrics": {
+            **counts,
+            "total_deaths": total_deaths,
+            "mortality_rate": (
+                (total_deaths / batch.initial_count * 100)
+                if batch.initial_count > 0
+                else 0
+            ),
+            "health_cost": batch.health_cost_total,
+        },
+    }
+
+    return Response(health_history)
+
+
+class BatchHistoryListView(generics.ListAPIView):
+    """
+    Base view for one batch's records, newest first. Cursor-paginated, or
+    streamed as NDJSON from a server-side cursor with ``?stream=ndjson``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsOrganizationMember]
+    pagination_class = KeysetPagination
+    stream_chunk_size = 500
+
+    def get_batch(self):
+        return get_object_or_404(
+            Batch, id=self.kwargs["flock_id"], organization=_get_org(self.request)
+        )
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("stream") != "ndjson":
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+
+        def lines():
+            for record in queryset.iterator(chunk_size=self.stream_chunk_size):
+                data = serializer_class(record, context=context).data
+                yield json.dumps(data, cls=DjangoJSONEncoder) + "\n"
+
+        return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
+
+
+class BatchHealthRecordHistoryView(BatchHistoryListView):
+    """API view for a batch's health records."""
+
+    serializer_class = HealthRecordSerializer
+
+    def get_queryset(self):
+        return (
+            self.get_batch()
+            .health_records.select_related(
+                "batch",
+                "veterinarian",
+                "created_by",
+                "vaccination_details",
+                "medication_details",
+            )
+            .order_by("-date", "-pk")
+        )
+
+
+class BatchMortalityRecordHistoryView(BatchHistoryListView):
+    """API view for a batch's mortality records, archived ones included."""
+
+    serializer_class = MortalityRecordSerializer
+
+    def get_queryset(self):
+        return (
+            batch_records(self.get_batch(), "mortality_records")
+            .select_related("batch", "recorded_by")
+            .order_by("-date", "-pk")
+        )
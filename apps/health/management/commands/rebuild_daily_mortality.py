@@ -0,0 +1,38 @@
+"""Rebuild the daily mortality rollup from the mortality record tables."""
+
+from django.core.management.base import BaseCommand
+
+from apps.birds.models.models import Batch
+from apps.health.services.mortality_rollup_service import (
+    REBUILD_CHUNK_SIZE,
+    rebuild_daily_mortality,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute DailyMortality rows from the hot and archived mortality "
+        "records, a chunk of batches per transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_CHUNK_SIZE,
+            help=f"Batches rebuilt per transaction (default: {REBUILD_CHUNK_SIZE}).",
+        )
+        parser.add_argument(
+            "--organization",
+            type=int,
+            help="Only rebuild the batches of this organization id.",
+        )
+
+    def handle(self, *args, batch_size, organization, **options):
+        batches = Batch.objects.all()
+        if organization is not None:
+            batches = batches.filter(organization_id=organization)
+        written = rebuild_daily_mortality(batches, chunk_size=batch_size)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} daily mortality row(s).")
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("health", "0002_mortalityrecord_organization"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mortalityrecord",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="mortality_r_organiz_ca0f9e_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0006_batch_archived_at"),
+        ("health", "0003_mortalityrecord_mortality_r_organiz_ca0f9e_idx"),
+        ("users", "0007_email_outbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedMortalityRecord",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                ("count", models.PositiveIntegerField()),
+                (
+                    "cause_category",
+                    models.CharField(
+                        choices=[
+                            ("disease", "Disease"),
+                            ("accident", "Accident"),
+                            ("predator", "Predator"),
+                            ("heat_stress", "Heat Stress"),
+                            ("cold_stress", "Cold Stress"),
+                            ("unknown", "Unknown"),
+                            ("culling", "Culling"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "specific_cause",
+                    models.CharField(blank=True, max_length=200, null=True),
+                ),
+                ("age_at_death", models.PositiveIntegerField(help_text="Age in days")),
+                ("notes", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_mortality_records",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "recorded_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Mortality Record",
+                "verbose_name_plural": "Archived Mortality Records",
+                "db_table": "archived_mortality_records",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "date", "id"],
+                        name="archived_mo_organiz_8535ab_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_organization(apps, schema_editor):
+    Batch = apps.get_model("birds", "Batch")
+    HealthRecord = apps.get_model("health", "HealthRecord")
+    HealthRecord.objects.filter(organization__isnull=True).update(
+        organization=Subquery(
+            Batch.objects.filter(pk=OuterRef("batch_id")).values("organization")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0006_batch_archived_at"),
+        ("health", "0004_archivedmortalityrecord"),
+        ("users", "0007_email_outbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="healthrecord",
+            name="organization",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="health_records",
+                to="users.organization",
+            ),
+        ),
+        migrations.RunPython(
+            backfill_organization, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="healthrecord",
+            index=models.Index(
+                fields=["organization", "date"], name="health_reco_organiz_bf6fed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="healthrecord",
+            index=models.Index(
+                fields=["batch", "record_type", "date"],
+                name="health_reco_batch_i_1c7bf8_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="healthrecord",
+            index=models.Index(
+                fields=["organization", "record_type", "date"],
+                name="health_reco_organiz_684c73_idx",
+            ),
+        ),
+    ]
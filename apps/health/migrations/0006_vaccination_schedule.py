@@ -0,0 +1,104 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_schedule(apps, schema_editor):
+    Vaccination = apps.get_model("health", "Vaccination")
+    VaccinationSchedule = apps.get_model("health", "VaccinationSchedule")
+    vaccinations = Vaccination.objects.filter(
+        next_vaccination_date__isnull=False,
+        health_record__batch__status="active",
+    ).select_related("health_record")
+    VaccinationSchedule.objects.bulk_create(
+        (
+            VaccinationSchedule(
+                vaccination=vaccination,
+                organization_id=vaccination.health_record.organization_id,
+                batch_id=vaccination.health_record.batch_id,
+                vaccine_name=vaccination.vaccine_name,
+                due_date=vaccination.next_vaccination_date,
+            )
+            for vaccination in vaccinations.iterator(chunk_size=1000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0006_batch_archived_at"),
+        ("health", "0005_healthrecord_organization"),
+        ("orders", "0002_chickorder_organization_reminder_organization"),
+        ("users", "0007_email_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VaccinationSchedule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("vaccine_name", models.CharField(max_length=200)),
+                ("due_date", models.DateField()),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vaccination_schedule",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vaccination_schedule",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "reminder",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="orders.reminder",
+                    ),
+                ),
+                (
+                    "vaccination",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="schedule",
+                        to="health.vaccination",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Scheduled Vaccination",
+                "verbose_name_plural": "Vaccination Schedule",
+                "db_table": "vaccination_schedule",
+                "ordering": ["due_date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "due_date"],
+                        name="vaccination_organiz_cc7e90_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_schedule, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,117 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_daily_mortality(apps, schema_editor):
+    DailyMortality = apps.get_model("health", "DailyMortality")
+    totals = {}
+    for name in ("MortalityRecord", "ArchivedMortalityRecord"):
+        rows = (
+            apps.get_model("health", name)
+            .objects.order_by()
+            .values("batch_id", "batch__organization_id", "date", "cause_category")
+            .annotate(
+                deaths=Sum("count"),
+                records=Count("pk"),
+                age_at_death_total=Sum("age_at_death"),
+            )
+        )
+        for row in rows:
+            key = (row["batch_id"], row["date"], row["cause_category"])
+            entry = totals.setdefault(
+                key,
+                DailyMortality(
+                    organization_id=row["batch__organization_id"],
+                    batch_id=row["batch_id"],
+                    date=row["date"],
+                    cause_category=row["cause_category"],
+                    deaths=0,
+                    records=0,
+                    age_at_death_total=0,
+                ),
+            )
+            entry.deaths += row["deaths"]
+            entry.records += row["records"]
+            entry.age_at_death_total += row["age_at_death_total"]
+    DailyMortality.objects.bulk_create(totals.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0006_batch_archived_at"),
+        ("health", "0006_vaccination_schedule"),
+        ("users", "0007_email_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyMortality",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "cause_category",
+                    models.CharField(
+                        choices=[
+                            ("disease", "Disease"),
+                            ("accident", "Accident"),
+                            ("predator", "Predator"),
+                            ("heat_stress", "Heat Stress"),
+                            ("cold_stress", "Cold Stress"),
+                            ("unknown", "Unknown"),
+                            ("culling", "Culling"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("deaths", models.PositiveIntegerField(default=0)),
+                ("records", models.PositiveIntegerField(default=0)),
+                ("age_at_death_total", models.PositiveIntegerField(default=0)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_mortality",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_mortality",
+                        to="users.organization",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Mortality",
+                "verbose_name_plural": "Daily Mortality",
+                "db_table": "daily_mortality",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "date"],
+                        name="daily_morta_organiz_8652f1_idx",
+                    )
+                ],
+                "unique_together": {("batch", "date", "cause_category")},
+            },
+        ),
+        migrations.RunPython(populate_daily_mortality, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from apps.birds.models.models import Batch
+from apps.birds.models.models import Batch, archive_model
 
 User = get_user_model()
 
@@ -19,6 +19,13 @@ class HealthRecord(models.Model):
         ("mortality", "Mortality Record"),
     ]
 
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        related_name="health_records",
+        null=True,
+        blank=True,
+    )
     batch = models.ForeignKey(
         Batch, on_delete=models.CASCADE, related_name="health_records"
     )
@@ -45,10 +52,21 @@ class HealthRecord(models.Model):
         verbose_name = "Health Record"
         verbose_name_plural = "Health Records"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["organization", "date"]),
+            models.Index(fields=["batch", "record_type", "date"]),
+            models.Index(fields=["organization", "record_type", "date"]),
+        ]
 
     def __str__(self):
         return f"{self.batch.batch_number} - {self.record_type} - {self.date.strftime('%Y-%m-%d')}"
 
+    def save(self, *args, **kwargs):
+        # Denormalized from the batch so tenant queries skip the join.
+        if self.organization_id is None and self.batch_id is not None:
+            self.organization_id = self.batch.organization_id
+        super().save(*args, **kwargs)
+
 
 class Vaccination(models.Model):
     """
@@ -75,6 +93,49 @@ class Vaccination(models.Model):
         return f"{self.vaccine_name} - {self.health_record.batch.batch_number}"
 
 
+class VaccinationSchedule(models.Model):
+    """
+    Due vaccinations per organization: one row per ``Vaccination`` with a
+    ``next_vaccination_date`` on an active batch, kept in sync by
+    ``vaccination_service`` so due lists are a single index range scan.
+    """
+
+    vaccination = models.OneToOneField(
+        Vaccination, on_delete=models.CASCADE, related_name="schedule"
+    )
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        related_name="vaccination_schedule",
+        null=True,
+        blank=True,
+    )
+    batch = models.ForeignKey(
+        Batch, on_delete=models.CASCADE, related_name="vaccination_schedule"
+    )
+    vaccine_name = models.CharField(max_length=200)
+    due_date = models.DateField()
+    reminder = models.ForeignKey(
+        "orders.Reminder",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        db_table = "vaccination_schedule"
+        verbose_name = "Scheduled Vaccination"
+        verbose_name_plural = "Vaccination Schedule"
+        ordering = ["due_date"]
+        indexes = [
+            models.Index(fields=["organization", "due_date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.vaccine_name} - {self.batch.batch_number} - {self.due_date}"
+
+
 class Medication(models.Model):
     """
     Model for tracking medications and treatments
@@ -144,6 +205,53 @@ class MortalityRecord(models.Model):
         verbose_name = "Mortality Record"
         verbose_name_plural = "Mortality Records"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.batch.batch_number} - {self.count} birds - {self.date}"
+
+
+# Cold table for mortality records of archived batches.
+ArchivedMortalityRecord = archive_model(MortalityRecord)
+
+
+class DailyMortality(models.Model):
+    """
+    Deaths per batch, day and cause, rolled up from ``MortalityRecord`` rows
+    (hot and archived) by ``mortality_rollup_service`` so mortality
+    summaries and trends never re-aggregate the raw records.
+    """
+
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        related_name="daily_mortality",
+        null=True,
+        blank=True,
+    )
+    batch = models.ForeignKey(
+        Batch, on_delete=models.CASCADE, related_name="daily_mortality"
+    )
+    date = models.DateField()
+    cause_category = models.CharField(
+        max_length=20, choices=MortalityRecord.CAUSE_CATEGORIES
+    )
+    deaths = models.PositiveIntegerField(default=0)
+    records = models.PositiveIntegerField(default=0)
+    # Sum of the records' age_at_death, for their unweighted average.
+    age_at_death_total = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "daily_mortality"
+        verbose_name = "Daily Mortality"
+        verbose_name_plural = "Daily Mortality"
+        ordering = ["-date"]
+        unique_together = ["batch", "date", "cause_category"]
+        indexes = [
+            models.Index(fields=["organization", "date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.batch.batch_number} - {self.cause_category} - {self.date}"
@@ -0,0 +1,149 @@
+"""Daily per-batch, per-cause mortality rollup and the summaries read from it."""
+
+import logging
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+logger = logging.getLogger(__name__)
+
+# Batches rebuilt per transaction by ``rebuild_daily_mortality``.
+REBUILD_CHUNK_SIZE = 200
+
+
+def _rollup_key(record):
+    return {
+        "batch_id": record.batch_id,
+        "date": record.date,
+        "cause_category": record.cause_category,
+    }
+
+
+def _apply(record, sign):
+    """Add (``sign=1``) or subtract (``sign=-1``) one *record* from the rollup."""
+    from apps.health.models.models import DailyMortality
+
+    changes = {
+        "deaths": F("deaths") + sign * record.count,
+        "records": F("records") + sign,
+        "age_at_death_total": F("age_at_death_total") + sign * record.age_at_death,
+    }
+    rows = DailyMortality.objects.filter(**_rollup_key(record))
+    if sign < 0:
+        rows.update(**changes)
+        rows.filter(records__lte=0).delete()
+        return
+
+    if rows.update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            DailyMortality.objects.create(
+                organization_id=record.batch.organization_id,
+                deaths=record.count,
+                records=1,
+                age_at_death_total=record.age_at_death,
+                **_rollup_key(record),
+            )
+    except IntegrityError:
+        # Another writer created the row first; add to it instead.
+        rows.update(**changes)
+
+
+def record_added(record):
+    """Fold a new ``MortalityRecord`` into the rollup."""
+    _apply(record, 1)
+
+
+def record_removed(record):
+    """Take a deleted ``MortalityRecord`` back out of the rollup."""
+    _apply(record, -1)
+
+
+def record_changed(previous, record):
+    """Move the rollup from the *previous* state of an edited record."""
+    _apply(previous, -1)
+    _apply(record, 1)
+
+
+def _aggregate(model, batch_ids):
+    return (
+        model.objects.filter(batch_id__in=batch_ids)
+        .order_by()
+        .values("batch_id", "batch__organization_id", "date", "cause_category")
+        .annotate(
+            deaths=Sum("count"),
+            records=Count("pk"),
+            age_at_death_total=Sum("age_at_death"),
+        )
+    )
+
+
+def rebuild_daily_mortality(batches, chunk_size=REBUILD_CHUNK_SIZE):
+    """
+    Recompute the rollup of the *batches* queryset from the hot and archived
+    mortality tables, *chunk_size* batches per transaction. Returns the
+    number of rollup rows written.
+    """
+    from apps.health.models.models import (
+        ArchivedMortalityRecord,
+        DailyMortality,
+        MortalityRecord,
+    )
+
+    batch_ids = list(batches.order_by("pk").values_list("pk", flat=True))
+    written = 0
+    for start in range(0, len(batch_ids), chunk_size):
+        chunk = batch_ids[start : start + chunk_size]
+        totals = {}
+        for model in (MortalityRecord, ArchivedMortalityRecord):
+            for row in _aggregate(model, chunk):
+                key = (row["batch_id"], row["date"], row["cause_category"])
+                entry = totals.setdefault(
+                    key,
+                    DailyMortality(
+                        organization_id=row["batch__organization_id"],
+                        batch_id=row["batch_id"],
+                        date=row["date"],
+                        cause_category=row["cause_category"],
+                    ),
+                )
+                entry.deaths += row["deaths"]
+                entry.records += row["records"]
+                entry.age_at_death_total += row["age_at_death_total"]
+
+        with transaction.atomic():
+            DailyMortality.objects.filter(batch_id__in=chunk).delete()
+            DailyMortality.objects.bulk_create(totals.values(), batch_size=1000)
+        written += len(totals)
+
+    logger.info(
+        "Rebuilt daily mortality for %s batch(es): %s row(s)", len(batch_ids), written
+    )
+    return written
+
+
+def mortality_summary(rollup):
+    """
+    Summarize a filtered ``DailyMortality`` queryset as total deaths, deaths
+    by cause (largest first) and the average age at death.
+    """
+    totals = rollup.aggregate(
+        deaths=Sum("deaths"),
+        records=Sum("records"),
+        age_at_death_total=Sum("age_at_death_total"),
+    )
+    by_cause = list(
+        rollup.order_by()
+        .values("cause_category")
+        .annotate(total=Sum("deaths"))
+        .order_by("-total")
+    )
+    records = totals["records"] or 0
+    return {
+        "total": totals["deaths"] or 0,
+        "by_cause": by_cause,
+        "average_age_at_death": (
+            totals["age_at_death_total"] / records if records else 0
+        ),
+    }
@@ -0,0 +1,132 @@
+"""High-mortality detection and the alerts persisted for it."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Days of mortality records considered by the high-mortality rule.
+MORTALITY_ALERT_WINDOW_DAYS = 30
+# Deaths in the window, as a percentage of current birds, that raise an alert.
+MORTALITY_ALERT_THRESHOLD = getattr(settings, "MORTALITY_ALERT_THRESHOLD", 5)
+# Percentage above which the alert is raised as "high" instead of "medium".
+MORTALITY_ALERT_HIGH_THRESHOLD = getattr(settings, "MORTALITY_ALERT_HIGH_THRESHOLD", 10)
+
+ALERT_TYPE = "mortality_high"
+
+
+def high_mortality_batches(batches, today=None):
+    """
+    Return ``(batch, deaths, rate)`` for every batch in *batches* whose deaths
+    over the alert window exceed ``MORTALITY_ALERT_THRESHOLD`` percent of its
+    current count, using one query with a grouped daily-rollup subquery.
+    """
+    from apps.health.models.models import DailyMortality
+
+    since = (today or timezone.now().date()) - timedelta(
+        days=MORTALITY_ALERT_WINDOW_DAYS
+    )
+    deaths = (
+        DailyMortality.objects.filter(batch=OuterRef("pk"), date__gte=since)
+        .order_by()
+        .values("batch")
+        .annotate(total=Sum("deaths"))
+        .values("total")
+    )
+    batches = batches.filter(current_count__gt=0).annotate(
+        recent_deaths=Coalesce(Subquery(deaths, output_field=IntegerField()), Value(0))
+    )
+
+    flagged = []
+    for batch in batches.filter(recent_deaths__gt=0):
+        rate = batch.recent_deaths / batch.current_count * 100
+        if rate > MORTALITY_ALERT_THRESHOLD:
+            flagged.append((batch, batch.recent_deaths, rate))
+    return flagged
+
+
+def _severity(rate):
+    return "high" if rate > MORTALITY_ALERT_HIGH_THRESHOLD else "medium"
+
+
+def _message(rate):
+    return (
+        f"High mortality rate: {rate:.1f}% in last "
+        f"{MORTALITY_ALERT_WINDOW_DAYS} days"
+    )
+
+
+def evaluate_mortality_alerts(organization=None):
+    """
+    Apply the high-mortality rule to every active batch (optionally of one
+    *organization*) and persist the result as ``Alert`` rows, keeping at most
+    one unresolved alert per batch. Open alerts of batches that are no longer
+    flagged, or no longer active, are resolved. Returns (created, updated,
+    resolved).
+    """
+    from apps.birds.models.models import Batch
+    from apps.reports.models.models import Alert
+
+    batches = Batch.objects.all()
+    if organization is not None:
+        batches = batches.filter(organization=organization)
+    flagged = high_mortality_batches(batches.filter(status="active"))
+    flagged_ids = [batch.pk for batch, _, _ in flagged]
+
+    open_alerts = Alert.objects.filter(alert_type=ALERT_TYPE, is_resolved=False)
+    resolved = (
+        open_alerts.filter(batch__in=batches)
+        .exclude(batch_id__in=flagged_ids)
+        .update(is_resolved=True, resolved_at=timezone.now())
+    )
+    existing = {
+        alert.batch_id: alert for alert in open_alerts.filter(batch_id__in=flagged_ids)
+    }
+
+    new_alerts, changed = [], []
+    for batch, _, rate in flagged:
+        severity, message = _severity(rate), _message(rate)
+        alert = existing.get(batch.pk)
+        if alert is None:
+            new_alerts.append(
+                Alert(
+                    organization_id=batch.organization_id,
+                    batch=batch,
+                    alert_type=ALERT_TYPE,
+                    severity=severity,
+                    title=f"High mortality in {batch.batch_number}",
+                    message=message,
+                )
+            )
+        elif (alert.severity, alert.message) != (severity, message):
+            alert.severity, alert.message = severity, message
+            changed.append(alert)
+
+    Alert.objects.bulk_create(new_alerts)
+    Alert.objects.bulk_update(changed, ["severity", "message"])
+    if new_alerts or changed or resolved:
+        logger.info(
+            "Mortality alerts: %s created, %s updated, %s resolved",
+            len(new_alerts),
+            len(changed),
+            resolved,
+        )
+    return len(new_alerts), len(changed), resolved
+
+
+def open_mortality_alerts(batches):
+    """Unresolved high-mortality alerts for *batches*, newest first."""
+    from apps.reports.models.models import Alert
+
+    return (
+        Alert.objects.filter(
+            alert_type=ALERT_TYPE, is_resolved=False, batch__in=batches
+        )
+        .select_related("batch")
+        .order_by("-created_at")
+    )
@@ -0,0 +1,122 @@
+"""Maintenance and queries for the due-vaccination schedule."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Days ahead of the due date that a vaccination reminder is created.
+VACCINATION_REMINDER_DAYS_AHEAD = getattr(
+    settings, "VACCINATION_REMINDER_DAYS_AHEAD", 3
+)
+# Longest date range served by one calendar request.
+MAX_CALENDAR_DAYS = 366
+
+
+def sync_vaccination(vaccination):
+    """
+    Create, update or remove the schedule row of *vaccination* after it was
+    saved. A changed due date clears the reminder so a new one is generated.
+    """
+    from apps.health.models.models import VaccinationSchedule
+
+    health_record = vaccination.health_record
+    batch = health_record.batch
+    if vaccination.next_vaccination_date is None or batch.status != "active":
+        VaccinationSchedule.objects.filter(vaccination=vaccination).delete()
+        return None
+
+    entry = VaccinationSchedule.objects.filter(vaccination=vaccination).first()
+    if entry is None:
+        return VaccinationSchedule.objects.create(
+            vaccination=vaccination,
+            organization_id=health_record.organization_id,
+            batch=batch,
+            vaccine_name=vaccination.vaccine_name,
+            due_date=vaccination.next_vaccination_date,
+        )
+
+    if entry.due_date != vaccination.next_vaccination_date:
+        entry.reminder = None
+    entry.organization_id = health_record.organization_id
+    entry.batch = batch
+    entry.vaccine_name = vaccination.vaccine_name
+    entry.due_date = vaccination.next_vaccination_date
+    entry.save()
+    return entry
+
+
+def clear_batch_schedule(batch):
+    """Drop the schedule rows of a batch that is no longer active."""
+    return clear_batch_schedules([batch.pk])
+
+
+def clear_batch_schedules(batch_ids):
+    """Drop the schedule rows of several closed batches in one query."""
+    from apps.health.models.models import VaccinationSchedule
+
+    return VaccinationSchedule.objects.filter(batch_id__in=batch_ids).delete()[0]
+
+
+def due_vaccinations(organization, start, end):
+    """Schedule rows of *organization* due between *start* and *end* inclusive."""
+    from apps.health.models.models import VaccinationSchedule
+
+    return (
+        VaccinationSchedule.objects.filter(
+            organization=organization, due_date__gte=start, due_date__lte=end
+        )
+        .select_related("batch")
+        .order_by("due_date", "pk")
+    )
+
+
+def generate_vaccination_reminders(days_ahead=None, today=None):
+    """
+    Create one ``Reminder`` for every scheduled vaccination due within
+    *days_ahead* days that has none yet. Returns the number created.
+    """
+    from apps.health.models.models import VaccinationSchedule
+    from apps.orders.models import Reminder
+
+    if days_ahead is None:
+        days_ahead = VACCINATION_REMINDER_DAYS_AHEAD
+    today = today or timezone.now().date()
+
+    with transaction.atomic():
+        entries = list(
+            VaccinationSchedule.objects.select_for_update(of=("self",))
+            .filter(
+                reminder__isnull=True,
+                due_date__gte=today,
+                due_date__lte=today + timedelta(days=days_ahead),
+            )
+            .select_related("batch")
+        )
+        if not entries:
+            return 0
+
+        reminders = Reminder.objects.bulk_create(
+            [
+                Reminder(
+                    organization_id=entry.organization_id,
+                    date=entry.due_date,
+                    title=f"Vaccination due: {entry.vaccine_name}",
+                    message=(
+                        f"{entry.vaccine_name} is due for batch "
+                        f"{entry.batch.batch_number} on {entry.due_date}."
+                    ),
+                )
+                for entry in entries
+            ]
+        )
+        for entry, reminder in zip(entries, reminders):
+            entry.reminder = reminder
+        VaccinationSchedule.objects.bulk_update(entries, ["reminder"])
+
+    logger.info("Created %s vaccination reminder(s)", len(reminders))
+    return len(reminders)
@@ -0,0 +1,36 @@
+"""Medication withdrawal periods and the per-batch date they clear on."""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+
+def clears_on(treated_at, duration_days, withdrawal_period):
+    """
+    First day birds treated from *treated_at* for *duration_days* are clear
+    of a *withdrawal_period*-day withdrawal after the last dose.
+    """
+    if timezone.is_aware(treated_at):
+        treated_at = timezone.localtime(treated_at)
+    return treated_at.date() + timedelta(days=duration_days + withdrawal_period)
+
+
+def compute_withdrawal_clears_on(batch_id):
+    """Latest clear date over every medication given to batch *batch_id*."""
+    from apps.health.models.models import Medication
+
+    treatments = Medication.objects.filter(
+        health_record__batch_id=batch_id
+    ).values_list("health_record__date", "duration_days", "withdrawal_period")
+    return max((clears_on(*treatment) for treatment in treatments), default=None)
+
+
+def refresh_batch_withdrawal(batch_id):
+    """Recompute and store ``Batch.withdrawal_clears_on`` for one batch."""
+    from apps.birds.models.models import Batch
+
+    if batch_id is None:
+        return None
+    value = compute_withdrawal_clears_on(batch_id)
+    Batch.objects.filter(pk=batch_id).update(withdrawal_clears_on=value)
+    return value
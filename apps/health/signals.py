@@ -0,0 +1,99 @@
+"""Signal handlers for the health app."""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.birds.models.models import Batch
+from apps.health.models.models import (
+    HealthRecord,
+    Medication,
+    MortalityRecord,
+    Vaccination,
+)
+from apps.health.services import (
+    mortality_rollup_service,
+    vaccination_service,
+    withdrawal_service,
+)
+from core.signals import deleted_with_batch, previous_state, remember_previous
+
+
+@receiver(post_save, sender=Vaccination)
+def vaccination_saved(sender, instance, raw=False, **kwargs):
+    """Keep the vaccination's schedule row in step with its due date."""
+    if raw:
+        return
+    vaccination_service.sync_vaccination(instance)
+
+
+@receiver(post_save, sender=Batch)
+def batch_saved(sender, instance, raw=False, **kwargs):
+    """Closed batches have nothing left to vaccinate."""
+    if raw or instance.status == "active":
+        return
+    vaccination_service.clear_batch_schedule(instance)
+
+
+@receiver(post_save, sender=MortalityRecord)
+def mortality_saved(sender, instance, created, raw=False, **kwargs):
+    """Apply a saved mortality record to the daily rollup."""
+    if raw:
+        return
+    previous = previous_state(instance)
+    if created or previous is None:
+        mortality_rollup_service.record_added(instance)
+    else:
+        mortality_rollup_service.record_changed(previous, instance)
+
+
+@receiver(post_delete, sender=MortalityRecord)
+def mortality_deleted(sender, instance, **kwargs):
+    """Remove a deleted mortality record from the daily rollup."""
+    if deleted_with_batch(kwargs.get("origin")):
+        # The batch's rollup rows are deleted along with it.
+        return
+    mortality_rollup_service.record_removed(instance)
+
+
+@receiver(post_save, sender=Medication)
+@receiver(post_delete, sender=Medication)
+def medication_changed(sender, instance, raw=False, **kwargs):
+    """Recompute the withdrawal clear date of the medicated batch."""
+    if raw or deleted_with_batch(kwargs.get("origin")):
+        return
+    withdrawal_service.refresh_batch_withdrawal(instance.health_record.batch_id)
+
+
+@receiver(post_save, sender=HealthRecord)
+def health_record_moved(sender, instance, raw=False, **kwargs):
+    """A vaccination moved to another batch takes its schedule row along."""
+    previous = previous_state(instance)
+    if raw or previous is None or previous.batch_id == instance.batch_id:
+        return
+    vaccination = (
+        Vaccination.objects.filter(health_record=instance)
+        .select_related("health_record__batch")
+        .first()
+    )
+    if vaccination is not None:
+        vaccination_service.sync_vaccination(vaccination)
+
+
+@receiver(post_save, sender=HealthRecord)
+def health_record_saved(sender, instance, raw=False, **kwargs):
+    """A medication moved in time or to another batch shifts its withdrawal."""
+    previous = previous_state(instance)
+    if raw or previous is None:
+        return
+    if (previous.batch_id, previous.date) == (instance.batch_id, instance.date):
+        return
+    if not Medication.objects.filter(health_record=instance).exists():
+        return
+    withdrawal_service.refresh_batch_withdrawal(instance.batch_id)
+    if previous.batch_id != instance.batch_id:
+        withdrawal_service.refresh_batch_withdrawal(previous.batch_id)
+
+
+# The same snapshots feed the running totals in the birds app.
+for model in (MortalityRecord, HealthRecord):
+    pre_save.connect(remember_previous, sender=model)
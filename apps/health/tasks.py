@@ -0,0 +1,17 @@
+"""Celery tasks for the health app."""
+
+from celery import shared_task
+
+from apps.health.services import mortality_service, vaccination_service
+
+
+@shared_task(ignore_result=True)
+def evaluate_mortality_alerts():
+    """Raise, refresh or resolve high-mortality alerts for every organization."""
+    return sum(mortality_service.evaluate_mortality_alerts())
+
+
+@shared_task(ignore_result=True)
+def generate_vaccination_reminders():
+    """Create reminders for scheduled vaccinations that are coming due."""
+    return vaccination_service.generate_vaccination_reminders()
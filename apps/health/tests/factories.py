@@ -0,0 +1,74 @@
+"""Shared test helpers and factories for the health app."""
+
+from django.utils import timezone
+
+from apps.health.models.models import (
+    HealthRecord,
+    Medication,
+    MortalityRecord,
+    Vaccination,
+)
+
+
+def create_health_record(batch, record_type="inspection", **kwargs):
+    """Create a health record for *batch*, dated now unless given."""
+    defaults = {
+        "date": timezone.now(),
+        "description": "Routine check",
+        "created_by": batch.created_by,
+    }
+    defaults.update(kwargs)
+    return HealthRecord.objects.create(batch=batch, record_type=record_type, **defaults)
+
+
+def create_mortality_record(batch, count=1, cause_category="disease", **kwargs):
+    """Create a mortality record for *batch*, dated today unless given."""
+    defaults = {
+        "date": timezone.localdate(),
+        "age_at_death": 10,
+        "recorded_by": batch.created_by,
+    }
+    defaults.update(kwargs)
+    return MortalityRecord.objects.create(
+        batch=batch,
+        organization=batch.organization,
+        count=count,
+        cause_category=cause_category,
+        **defaults,
+    )
+
+
+def create_vaccination(health_record, next_vaccination_date=None, **kwargs):
+    """Attach a vaccination to *health_record*."""
+    defaults = {
+        "vaccine_name": "Newcastle",
+        "manufacturer": "Vet Co",
+        "batch_number": "V-1",
+        "dosage": "1 drop",
+        "administration_method": "eye drop",
+        "birds_vaccinated": health_record.batch.current_count,
+    }
+    defaults.update(kwargs)
+    return Vaccination.objects.create(
+        health_record=health_record,
+        next_vaccination_date=next_vaccination_date,
+        **defaults,
+    )
+
+
+def create_medication(health_record, duration_days=3, withdrawal_period=5, **kwargs):
+    """Attach a medication to *health_record*."""
+    defaults = {
+        "medication_name": "Amoxicillin",
+        "manufacturer": "Vet Co",
+        "dosage": "1 g/l",
+        "administration_method": "water",
+        "birds_treated": health_record.batch.current_count,
+    }
+    defaults.update(kwargs)
+    return Medication.objects.create(
+        health_record=health_record,
+        duration_days=duration_days,
+        withdrawal_period=withdrawal_period,
+        **defaults,
+    )
@@ -0,0 +1,160 @@
+"""Tests for a batch's health history metrics and record streams."""
+
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.models.models import Batch
+from apps.birds.services.archive_service import archive_batch
+from apps.birds.tests.factories import create_batch
+from apps.health.tests.factories import create_health_record, create_mortality_record
+from apps.users.tests.factories import create_organization, create_user
+
+# The health API is not mounted in core.urls; route it for these tests only.
+urlpatterns = [path("api/health/", include("apps.health.api.urls"))]
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+def _ids(resp):
+    return [row["id"] for row in resp.data["results"]]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class BatchHistoryTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="history@test.com", username="history")
+        self.org = create_organization(self.user, name="History Org")
+        self.client = get_auth_client(self.user, self.org)
+        self.batch = create_batch(self.org, initial_count=200)
+        now = timezone.now()
+        self.health_records = [
+            create_health_record(self.batch, "vaccination", date=now),
+            create_health_record(
+                self.batch,
+                "treatment",
+                date=now - timedelta(days=1),
+                cost=Decimal("15"),
+            ),
+            create_health_record(self.batch, "inspection", date=now),
+            create_health_record(
+                self.batch,
+                "vaccination",
+                date=now - timedelta(days=2),
+                cost=Decimal("5"),
+            ),
+        ]
+        # Newest first, ties broken on id.
+        self.expected_health = [
+            record.pk
+            for record in sorted(
+                self.health_records, key=lambda r: (r.date, r.pk), reverse=True
+            )
+        ]
+
+    def _url(self, name, batch=None):
+        return reverse(name, kwargs={"flock_id": (batch or self.batch).pk})
+
+    def test_summary_payload(self):
+        create_mortality_record(self.batch, count=4)
+        create_mortality_record(self.batch, count=6)
+
+        resp = self.client.get(self._url("flock_health_history"))
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(resp.data), {"batch", "health_metrics"})
+        self.assertEqual(
+            resp.data["batch"],
+            {
+                "id": self.batch.pk,
+                "batch_id": self.batch.batch_number,
+                "current_count": 200,
+                "age_in_days": 0,
+            },
+        )
+        self.assertEqual(
+            resp.data["health_metrics"],
+            {
+                "total_vaccinations": 2,
+                "total_treatments": 1,
+                "total_deaths": 10,
+                "mortality_rate": 5.0,
+                "health_cost": Decimal("20"),
+            },
+        )
+
+    def test_summary_of_unknown_batch(self):
+        other = create_batch(
+            create_organization(
+                create_user(email="stranger@test.com", username="stranger"),
+                name="Stranger Org",
+            )
+        )
+
+        resp = self.client.get(self._url("flock_health_history", other))
+
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_health_records_page_by_cursor(self):
+        url = self._url("flock_health_record_history")
+
+        resp = self.client.get(url, {"page_size": 3})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIsNone(resp.data["previous"])
+        first = _ids(resp)
+        resp = self.client.get(resp.data["next"])
+
+        self.assertEqual(first + _ids(resp), self.expected_health)
+        self.assertIsNone(resp.data["next"])
+        back = self.client.get(resp.data["previous"])
+        self.assertEqual(_ids(back), first)
+
+    def test_health_records_stream_as_ndjson(self):
+        resp = self.client.get(
+            self._url("flock_health_record_history"), {"stream": "ndjson"}
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp["Content-Type"], "application/x-ndjson")
+        lines = b"".join(resp.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["id"] for row in rows], self.expected_health)
+        self.assertEqual(rows[0]["batch"], self.batch.pk)
+
+    def test_mortality_records_fall_back_to_the_archive(self):
+        today = timezone.localdate()
+        records = [
+            create_mortality_record(self.batch, count=1, date=today - timedelta(days=d))
+            for d in (0, 2, 1)
+        ]
+        Batch.objects.filter(pk=self.batch.pk).update(status="sold")
+        archive_batch(self.batch)
+        url = self._url("flock_mortality_record_history")
+        expected = [records[0].pk, records[2].pk, records[1].pk]
+
+        resp = self.client.get(url, {"page_size": 2})
+        second = self.client.get(resp.data["next"])
+        streamed = self.client.get(url, {"stream": "ndjson"})
+
+        self.assertEqual(_ids(resp) + _ids(second), expected)
+        lines = b"".join(streamed.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines], expected)
@@ -0,0 +1,134 @@
+"""Tests for the daily mortality rollup kept current by record signals."""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.birds.models.models import Batch
+from apps.birds.tests.factories import create_batch
+from apps.health.models.models import DailyMortality
+from apps.health.services.mortality_rollup_service import (
+    mortality_summary,
+    rebuild_daily_mortality,
+)
+from apps.health.tests.factories import create_mortality_record
+from apps.users.tests.factories import create_organization, create_user
+
+
+class DailyMortalityTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="rollup@test.com", username="rollup")
+        self.org = create_organization(self.user, name="Rollup Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.today = timezone.localdate()
+
+    def _rollup(self, *batches):
+        return sorted(
+            DailyMortality.objects.filter(batch__in=batches).values_list(
+                "batch_id",
+                "date",
+                "cause_category",
+                "deaths",
+                "records",
+                "age_at_death_total",
+            )
+        )
+
+    def assertMatchesRebuild(self, *batches):
+        expected = self._rollup(*batches)
+        rebuild_daily_mortality(
+            Batch.objects.filter(pk__in=[batch.pk for batch in batches])
+        )
+        self.assertEqual(self._rollup(*batches), expected)
+
+    def test_create_groups_by_day_and_cause(self):
+        create_mortality_record(self.batch, count=2, age_at_death=10)
+        create_mortality_record(self.batch, count=3, age_at_death=20)
+        create_mortality_record(self.batch, count=1, cause_category="predator")
+
+        self.assertEqual(
+            self._rollup(self.batch),
+            [
+                (self.batch.pk, self.today, "disease", 5, 2, 30),
+                (self.batch.pk, self.today, "predator", 1, 1, 10),
+            ],
+        )
+        summary = mortality_summary(DailyMortality.objects.filter(batch=self.batch))
+        self.assertEqual(summary["total"], 6)
+        self.assertEqual(summary["by_cause"][0]["cause_category"], "disease")
+        self.assertEqual(summary["average_age_at_death"], 40 / 3)
+        self.assertMatchesRebuild(self.batch)
+
+    def test_edit_moves_the_record_between_rows(self):
+        record = create_mortality_record(self.batch, count=2)
+        create_mortality_record(self.batch, count=1)
+
+        record.count = 4
+        record.cause_category = "heat_stress"
+        record.date = self.today - timedelta(days=1)
+        record.save()
+
+        self.assertEqual(
+            self._rollup(self.batch),
+            [
+                (self.batch.pk, record.date, "heat_stress", 4, 1, 10),
+                (self.batch.pk, self.today, "disease", 1, 1, 10),
+            ],
+        )
+        self.assertMatchesRebuild(self.batch)
+
+    def test_edit_reads_the_stored_row_once(self):
+        record = create_mortality_record(self.batch, count=2)
+        record.count = 3
+        with CaptureQueriesContext(connection) as queries:
+            record.save()
+
+        reads = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "mortality_records"' in query["sql"]
+            and '"mortality_records"."id" =' in query["sql"]
+        ]
+        self.assertEqual(len(reads), 1)
+
+    def test_move_between_batches(self):
+        record = create_mortality_record(self.batch, count=2)
+
+        record.batch = self.other
+        record.save()
+
+        self.assertEqual(
+            self._rollup(self.batch, self.other),
+            [(self.other.pk, self.today, "disease", 2, 1, 10)],
+        )
+        self.assertMatchesRebuild(self.batch, self.other)
+
+    def test_delete_removes_empty_rows(self):
+        record = create_mortality_record(self.batch, count=2)
+        create_mortality_record(self.batch, count=1, cause_category="predator")
+
+        record.delete()
+
+        self.assertEqual(
+            self._rollup(self.batch),
+            [(self.batch.pk, self.today, "predator", 1, 1, 10)],
+        )
+        self.assertMatchesRebuild(self.batch)
+
+    def test_batch_delete_cascades(self):
+        create_mortality_record(self.batch, count=2)
+        create_mortality_record(self.other, count=1)
+
+        self.batch.delete()
+
+        self.assertEqual(
+            self._rollup(self.other),
+            [(self.other.pk, self.today, "disease", 1, 1, 10)],
+        )
+        self.assertFalse(DailyMortality.objects.filter(batch_id=self.batch.pk).exists())
@@ -0,0 +1,105 @@
+"""Tests for the organization denormalized onto health records."""
+
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.tests.factories import create_batch
+from apps.health.models.models import HealthRecord
+from apps.health.tests.factories import create_health_record
+from apps.users.tests.factories import create_organization, create_user
+
+# The health API is not mounted in core.urls; route it for these tests only.
+urlpatterns = [path("api/health/", include("apps.health.api.urls"))]
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class HealthRecordOrganizationTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="tenant@test.com", username="tenant")
+        self.org = create_organization(self.user, name="Tenant Org")
+        self.client = get_auth_client(self.user, self.org)
+        self.batch = create_batch(self.org)
+        self.other_org = create_organization(
+            create_user(email="neighbour@test.com", username="neighbour"),
+            name="Neighbour Org",
+        )
+        self.other_batch = create_batch(self.other_org)
+
+    def test_orm_create_takes_the_batch_organization(self):
+        record = create_health_record(self.batch)
+
+        self.assertEqual(record.organization_id, self.org.pk)
+        self.assertEqual(
+            HealthRecord.objects.get(pk=record.pk).organization_id, self.org.pk
+        )
+
+    def test_api_create_takes_the_batch_organization(self):
+        resp = self.client.post(
+            reverse("health_record_list_create"),
+            {
+                "batch": self.batch.pk,
+                "record_type": "inspection",
+                "date": timezone.now().isoformat(),
+                "description": "Weekly check",
+            },
+            format="json",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        record = HealthRecord.objects.get(batch=self.batch)
+        self.assertEqual(record.organization_id, self.org.pk)
+
+    def test_list_filters_on_the_organization_column(self):
+        own = create_health_record(self.batch)
+        create_health_record(self.other_batch)
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(reverse("health_record_list_create"))
+
+        self.assertEqual([row["id"] for row in resp.data["results"]], [own.pk])
+        column = f'"{HealthRecord._meta.db_table}"."organization_id"'
+        listing = [
+            query["sql"]
+            for query in queries
+            if f'FROM "{HealthRecord._meta.db_table}"' in query["sql"]
+        ]
+        self.assertTrue(listing)
+        for sql in listing:
+            self.assertIn(column, sql)
+            self.assertNotIn('INNER JOIN "batches"', sql)
+
+    def test_migration_backfills_from_the_batch(self):
+        own = create_health_record(self.batch)
+        other = create_health_record(self.other_batch)
+        HealthRecord.objects.update(organization=None)
+
+        migration = import_module(
+            "apps.health.migrations.0005_healthrecord_organization"
+        )
+        migration.backfill_organization(apps, None)
+
+        self.assertEqual(
+            dict(HealthRecord.objects.values_list("pk", "organization_id")),
+            {own.pk: self.org.pk, other.pk: self.other_org.pk},
+        )
@@ -0,0 +1,83 @@
+"""Tests for the persisted high-mortality alerts."""
+
+from django.test import TestCase
+
+from apps.birds.tests.factories import create_batch
+from apps.health.services.mortality_service import (
+    ALERT_TYPE,
+    evaluate_mortality_alerts,
+    open_mortality_alerts,
+)
+from apps.health.tests.factories import create_mortality_record
+from apps.reports.models.models import Alert
+from apps.users.tests.factories import create_organization, create_user
+
+
+class EvaluateMortalityAlertsTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="alerts@test.com", username="alerts")
+        self.org = create_organization(self.user, name="Alerts Org")
+        self.batch = create_batch(self.org, initial_count=100)
+
+    def test_raises_one_alert_per_flagged_batch(self):
+        create_mortality_record(self.batch, count=6)
+        create_batch(self.org, initial_count=100)
+
+        self.assertEqual(evaluate_mortality_alerts(), (1, 0, 0))
+        self.assertEqual(evaluate_mortality_alerts(), (0, 0, 0))
+
+        alert = Alert.objects.get(alert_type=ALERT_TYPE)
+        self.assertEqual(alert.batch, self.batch)
+        self.assertEqual(alert.organization, self.org)
+        self.assertEqual(alert.severity, "medium")
+
+    def test_refreshes_severity_of_open_alert(self):
+        create_mortality_record(self.batch, count=6)
+        evaluate_mortality_alerts()
+
+        create_mortality_record(self.batch, count=6)
+        self.assertEqual(evaluate_mortality_alerts(), (0, 1, 0))
+
+        alert = Alert.objects.get(alert_type=ALERT_TYPE)
+        self.assertEqual(alert.severity, "high")
+        self.assertIn("12.0%", alert.message)
+
+    def test_resolves_alerts_of_recovered_batches(self):
+        record = create_mortality_record(self.batch, count=6)
+        evaluate_mortality_alerts()
+
+        record.delete()
+        self.assertEqual(evaluate_mortality_alerts(), (0, 0, 1))
+
+        alert = Alert.objects.get(alert_type=ALERT_TYPE)
+        self.assertTrue(alert.is_resolved)
+        self.assertIsNotNone(alert.resolved_at)
+        self.assertFalse(open_mortality_alerts([self.batch]).exists())
+
+        # A relapse raises a fresh alert next to the resolved one.
+        create_mortality_record(self.batch, count=6)
+        self.assertEqual(evaluate_mortality_alerts(), (1, 0, 0))
+        self.assertEqual(open_mortality_alerts([self.batch]).count(), 1)
+
+    def test_resolves_alerts_of_batches_no_longer_active(self):
+        create_mortality_record(self.batch, count=6)
+        evaluate_mortality_alerts()
+
+        self.batch.status = "sold"
+        self.batch.save()
+
+        self.assertEqual(evaluate_mortality_alerts(organization=self.org), (0, 0, 1))
+        self.assertFalse(open_mortality_alerts([self.batch]).exists())
+
+    def test_scoped_run_leaves_other_organizations_alone(self):
+        other_org = create_organization(
+            create_user(email="other@test.com", username="other"), name="Other Org"
+        )
+        other = create_batch(other_org, initial_count=100)
+        record = create_mortality_record(other, count=6)
+        evaluate_mortality_alerts()
+        record.delete()
+
+        self.assertEqual(evaluate_mortality_alerts(organization=self.org), (0, 0, 0))
+        self.assertTrue(open_mortality_alerts([other]).exists())
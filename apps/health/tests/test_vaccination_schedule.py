@@ -0,0 +1,111 @@
+"""Tests for the due-vaccination schedule kept current by signals."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.birds.tests.factories import create_batch
+from apps.health.models.models import VaccinationSchedule
+from apps.health.services.vaccination_service import (
+    due_vaccinations,
+    generate_vaccination_reminders,
+)
+from apps.health.tests.factories import create_health_record, create_vaccination
+from apps.orders.models import Reminder
+from apps.users.tests.factories import create_organization, create_user
+
+
+class VaccinationScheduleTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="schedule@test.com", username="schedule")
+        self.org = create_organization(self.user, name="Schedule Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.today = timezone.localdate()
+
+    def _vaccinate(self, batch, due_in=None):
+        record = create_health_record(batch, "vaccination")
+        due = None if due_in is None else self.today + timedelta(days=due_in)
+        return create_vaccination(record, next_vaccination_date=due)
+
+    def _schedule(self):
+        return list(
+            VaccinationSchedule.objects.order_by("due_date").values_list(
+                "batch_id", "due_date"
+            )
+        )
+
+    def test_only_vaccinations_with_a_due_date_are_scheduled(self):
+        self._vaccinate(self.batch)
+        self._vaccinate(self.batch, due_in=7)
+
+        self.assertEqual(
+            self._schedule(), [(self.batch.pk, self.today + timedelta(days=7))]
+        )
+        entry = VaccinationSchedule.objects.get()
+        self.assertEqual(entry.organization, self.org)
+
+    def test_editing_the_due_date_resets_the_reminder(self):
+        vaccination = self._vaccinate(self.batch, due_in=2)
+        self.assertEqual(generate_vaccination_reminders(days_ahead=3), 1)
+        self.assertEqual(generate_vaccination_reminders(days_ahead=3), 0)
+
+        vaccination.next_vaccination_date = self.today + timedelta(days=3)
+        vaccination.save()
+
+        entry = VaccinationSchedule.objects.get()
+        self.assertEqual(entry.due_date, self.today + timedelta(days=3))
+        self.assertIsNone(entry.reminder)
+        self.assertEqual(generate_vaccination_reminders(days_ahead=3), 1)
+        self.assertEqual(Reminder.objects.filter(organization=self.org).count(), 2)
+
+        vaccination.next_vaccination_date = None
+        vaccination.save()
+        self.assertEqual(self._schedule(), [])
+
+    def test_moving_the_health_record_moves_the_entry(self):
+        vaccination = self._vaccinate(self.batch, due_in=7)
+
+        record = vaccination.health_record
+        record.batch = self.other
+        record.save()
+
+        self.assertEqual(
+            self._schedule(), [(self.other.pk, self.today + timedelta(days=7))]
+        )
+
+    def test_delete_removes_the_entry(self):
+        vaccination = self._vaccinate(self.batch, due_in=7)
+        self._vaccinate(self.batch, due_in=9).health_record.delete()
+
+        vaccination.delete()
+
+        self.assertEqual(self._schedule(), [])
+
+    def test_closing_or_deleting_the_batch_removes_its_entries(self):
+        self._vaccinate(self.batch, due_in=7)
+        self._vaccinate(self.other, due_in=8)
+
+        self.batch.status = "sold"
+        self.batch.save()
+        self.assertEqual(
+            self._schedule(), [(self.other.pk, self.today + timedelta(days=8))]
+        )
+
+        self.other.delete()
+        self.assertEqual(self._schedule(), [])
+
+    def test_due_vaccinations_filters_by_organization_and_range(self):
+        other_org = create_organization(
+            create_user(email="other@test.com", username="other"), name="Other Org"
+        )
+        self._vaccinate(self.batch, due_in=1)
+        self._vaccinate(self.batch, due_in=30)
+        self._vaccinate(create_batch(other_org), due_in=1)
+
+        due = due_vaccinations(self.org, self.today, self.today + timedelta(days=7))
+        self.assertEqual(
+            [entry.due_date for entry in due], [self.today + timedelta(days=1)]
+        )
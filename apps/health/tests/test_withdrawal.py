@@ -0,0 +1,89 @@
+"""Tests for the withdrawal clear date kept on Batch."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.birds.models.models import Batch
+from apps.birds.tests.factories import create_batch
+from apps.health.services.withdrawal_service import compute_withdrawal_clears_on
+from apps.health.tests.factories import create_health_record, create_medication
+from apps.users.tests.factories import create_organization, create_user
+
+
+class WithdrawalClearsOnTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="withdrawal@test.com", username="withdrawal")
+        self.org = create_organization(self.user, name="Withdrawal Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.now = timezone.now()
+        self.today = timezone.localdate(self.now)
+
+    def _clears_on(self, batch):
+        batch.refresh_from_db()
+        self.assertEqual(
+            batch.withdrawal_clears_on, compute_withdrawal_clears_on(batch.pk)
+        )
+        return batch.withdrawal_clears_on
+
+    def _medicate(self, batch, days_ago=0, **kwargs):
+        record = create_health_record(
+            batch, "medication", date=self.now - timedelta(days=days_ago)
+        )
+        return create_medication(record, **kwargs)
+
+    def test_latest_medication_wins(self):
+        self._medicate(self.batch, duration_days=3, withdrawal_period=5)
+        self._medicate(self.batch, days_ago=2, duration_days=1, withdrawal_period=2)
+
+        self.assertEqual(self._clears_on(self.batch), self.today + timedelta(days=8))
+        self.assertEqual(
+            list(Batch.objects.under_withdrawal(self.today + timedelta(days=7))),
+            [self.batch],
+        )
+        self.assertFalse(
+            Batch.objects.under_withdrawal(self.today + timedelta(days=8)).exists()
+        )
+
+    def test_editing_the_medication_or_its_date(self):
+        medication = self._medicate(self.batch, duration_days=3, withdrawal_period=5)
+
+        medication.withdrawal_period = 10
+        medication.save()
+        self.assertEqual(self._clears_on(self.batch), self.today + timedelta(days=13))
+
+        record = medication.health_record
+        record.date = self.now - timedelta(days=3)
+        record.save()
+        self.assertEqual(self._clears_on(self.batch), self.today + timedelta(days=10))
+
+    def test_moving_the_health_record_refreshes_both_batches(self):
+        medication = self._medicate(self.batch)
+
+        record = medication.health_record
+        record.batch = self.other
+        record.save()
+
+        self.assertIsNone(self._clears_on(self.batch))
+        self.assertEqual(self._clears_on(self.other), self.today + timedelta(days=8))
+
+    def test_delete_clears_the_date(self):
+        kept = self._medicate(self.batch, days_ago=5)
+        medication = self._medicate(self.batch)
+
+        medication.delete()
+        self.assertEqual(self._clears_on(self.batch), self.today + timedelta(days=3))
+
+        kept.health_record.delete()
+        self.assertIsNone(self._clears_on(self.batch))
+
+    def test_batch_delete_cascades(self):
+        self._medicate(self.batch)
+        self._medicate(self.other, days_ago=1)
+
+        self.batch.delete()
+
+        self.assertEqual(self._clears_on(self.other), self.today + timedelta(days=7))
@@ -1,14 +1,18 @@
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from apps.birds.api.serializers import UnarchivedBatchMixin
+from apps.birds.models.models import Batch
 from apps.production.models.models import (
     FeedRecord,
     EggProduction,
     WeightRecord,
     EnvironmentalRecord,
+    EnvironmentalReading,
 )
 from apps.users.api.serializers import UserSerializer
 
 
-class FeedRecordSerializer(serializers.ModelSerializer):
+class FeedRecordSerializer(UnarchivedBatchMixin, serializers.ModelSerializer):
     """
     Serializer for FeedRecord model
     """
@@ -46,7 +50,7 @@ class FeedRecordSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class EggProductionSerializer(serializers.ModelSerializer):
+class EggProductionSerializer(UnarchivedBatchMixin, serializers.ModelSerializer):
     """
     Serializer for EggProduction model
     """
@@ -102,7 +106,7 @@ class EggProductionSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class WeightRecordSerializer(serializers.ModelSerializer):
+class WeightRecordSerializer(UnarchivedBatchMixin, serializers.ModelSerializer):
     """
     Serializer for WeightRecord model
     """
@@ -160,7 +164,7 @@ class WeightRecordSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class EnvironmentalRecordSerializer(serializers.ModelSerializer):
+class EnvironmentalRecordSerializer(UnarchivedBatchMixin, serializers.ModelSerializer):
     """
     Serializer for EnvironmentalRecord model
     """
@@ -194,3 +198,82 @@ class EnvironmentalRecordSerializer(serializers.ModelSerializer):
         validated_data["recorded_by"] = request.user
         validated_data["organization"] = getattr(request, "organization", None)
         return super().create(validated_data)
+
+
+class PrefetchedBatchField(serializers.PrimaryKeyRelatedField):
+    """
+    Batch primary key resolved against ``context["batches"]``, a dict of the
+    organization's batches fetched once per chunk of bulk rows, instead of
+    one query per row.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        batch = self.context["batches"].get(pk)
+        if batch is None:
+            self.fail("does_not_exist", pk_value=data)
+        return batch
+
+
+class BulkRecordSerializerMixin(serializers.Serializer):
+    """
+    Row serializer for bulk ingestion. Uniqueness is checked per chunk by
+    ``ingest_service`` rather than by per-row validators.
+    """
+
+    batch = PrefetchedBatchField(queryset=Batch.objects.none())
+
+
+class BulkFeedRecordSerializer(BulkRecordSerializerMixin, FeedRecordSerializer):
+    class Meta(FeedRecordSerializer.Meta):
+        validators = []
+
+
+class BulkEggProductionSerializer(BulkRecordSerializerMixin, EggProductionSerializer):
+    class Meta(EggProductionSerializer.Meta):
+        validators = []
+
+
+class BulkWeightRecordSerializer(BulkRecordSerializerMixin, WeightRecordSerializer):
+    class Meta(WeightRecordSerializer.Meta):
+        validators = []
+
+
+class BulkEnvironmentalRecordSerializer(
+    BulkRecordSerializerMixin, EnvironmentalRecordSerializer
+):
+    class Meta(EnvironmentalRecordSerializer.Meta):
+        validators = []
+
+
+class EnvironmentalReadingSerializer(
+    BulkRecordSerializerMixin, serializers.ModelSerializer
+):
+    """
+    Sensor reading row. Besides an object, a row may be the compact array
+    ``[batch, date, temperature, humidity, ammonia_level]``.
+    """
+
+    class Meta:
+        model = EnvironmentalReading
+        fields = ["batch", "date", "temperature", "humidity", "ammonia_level"]
+        validators = []
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            if len(data) > len(self.Meta.fields):
+                raise serializers.ValidationError(
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: [
+                            f"Expected at most {len(self.Meta.fields)} values "
+                            "per reading."
+                        ]
+                    }
+                )
+            data = dict(zip(self.Meta.fields, data))
+        return super().to_internal_value(data)
@@ -7,21 +7,46 @@ urlpatterns = [
         views.FeedRecordListCreateView.as_view(),
         name="feed_record_list_create",
     ),
+    path(
+        "feed/bulk/",
+        views.FeedRecordBulkCreateView.as_view(),
+        name="feed_record_bulk_create",
+    ),
     path(
         "eggs/",
         views.EggProductionListCreateView.as_view(),
         name="egg_production_list_create",
     ),
+    path(
+        "eggs/bulk/",
+        views.EggProductionBulkCreateView.as_view(),
+        name="egg_production_bulk_create",
+    ),
     path(
         "weights/",
         views.WeightRecordListCreateView.as_view(),
         name="weight_record_list_create",
     ),
+    path(
+        "weights/bulk/",
+        views.WeightRecordBulkCreateView.as_view(),
+        name="weight_record_bulk_create",
+    ),
     path(
         "environmental/",
         views.EnvironmentalRecordListCreateView.as_view(),
         name="environmental_record_list_create",
     ),
+    path(
+        "environmental/bulk/",
+        views.EnvironmentalRecordBulkCreateView.as_view(),
+        name="environmental_record_bulk_create",
+    ),
+    path(
+        "environmental/readings/",
+        views.EnvironmentalReadingIngestView.as_view(),
+        name="environmental_reading_ingest",
+    ),
     path("dashboard/", views.production_dashboard_view, name="production_dashboard"),
     path(
         "batch/<int:batch_id>/analysis/",
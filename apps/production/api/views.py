@@ -1,5 +1,6 @@
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
@@ -7,29 +8,51 @@ from django.db.models import Sum, Avg
 from django.utils import timezone
 from datetime import timedelta
 from apps.birds.models.models import Batch
+from apps.birds.api.mixins import IncludeArchivedMixin
+from apps.birds.services.archive_service import batch_records
+from apps.birds.services.growth_service import (
+    GROWTH_CURVE_DEFAULT_POINTS,
+    largest_triangle_three_buckets,
+)
 from apps.production.models.models import (
     FeedRecord,
     EggProduction,
     WeightRecord,
     EnvironmentalRecord,
+    EnvironmentalRollup,
 )
 from apps.production.api.serializers import (
     FeedRecordSerializer,
     EggProductionSerializer,
     WeightRecordSerializer,
     EnvironmentalRecordSerializer,
+    BulkFeedRecordSerializer,
+    BulkEggProductionSerializer,
+    BulkWeightRecordSerializer,
+    BulkEnvironmentalRecordSerializer,
+    EnvironmentalReadingSerializer,
+)
+from apps.production.services.environment_service import environment_summary
+from apps.production.services.ingest_service import (
+    IngestError,
+    csv_rows,
+    ingest_records,
+    json_rows,
+    ndjson_rows,
 )
+from core.pagination import OptionalKeysetPagination
 
 
 def _get_org(request):
     return getattr(request, "organization", None)
 
 
-class FeedRecordListCreateView(generics.ListCreateAPIView):
+class FeedRecordListCreateView(IncludeArchivedMixin, generics.ListCreateAPIView):
     """API view for listing and creating feed records."""
 
     serializer_class = FeedRecordSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["feed_type", "batch", "date", "brand"]
     search_fields = ["brand", "supplier", "batch__batch_id"]
@@ -43,11 +66,12 @@ class FeedRecordListCreateView(generics.ListCreateAPIView):
         return FeedRecord.objects.filter(organization=org)
 
 
-class EggProductionListCreateView(generics.ListCreateAPIView):
+class EggProductionListCreateView(IncludeArchivedMixin, generics.ListCreateAPIView):
     """API view for listing and creating egg production records."""
 
     serializer_class = EggProductionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["batch", "date"]
     search_fields = ["batch__batch_id"]
@@ -61,11 +85,12 @@ class EggProductionListCreateView(generics.ListCreateAPIView):
         return EggProduction.objects.filter(organization=org)
 
 
-class WeightRecordListCreateView(generics.ListCreateAPIView):
+class WeightRecordListCreateView(IncludeArchivedMixin, generics.ListCreateAPIView):
     """API view for listing and creating weight records."""
 
     serializer_class = WeightRecordSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["batch", "date"]
     search_fields = ["batch__batch_id"]
@@ -79,11 +104,14 @@ class WeightRecordListCreateView(generics.ListCreateAPIView):
         return WeightRecord.objects.filter(organization=org)
 
 
-class EnvironmentalRecordListCreateView(generics.ListCreateAPIView):
+class EnvironmentalRecordListCreateView(
+    IncludeArchivedMixin, generics.ListCreateAPIView
+):
     """API view for listing and creating environmental records."""
 
     serializer_class = EnvironmentalRecordSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["batch", "date"]
     search_fields = ["batch__batch_id"]
@@ -97,6 +125,89 @@ class EnvironmentalRecordListCreateView(generics.ListCreateAPIView):
         return EnvironmentalRecord.objects.filter(organization=org)
 
 
+class BulkRecordCreateView(generics.GenericAPIView):
+    """
+    Create many records in one POST: a JSON array, a CSV file with a header
+    row (``text/csv``) or one JSON object per line (``application/x-ndjson``).
+    CSV and NDJSON bodies are streamed. Nothing is saved unless every row is
+    valid; otherwise the response lists the failing rows.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [JSONParser]
+    ndjson_content_types = ("application/x-ndjson", "application/jsonl")
+
+    def get_rows(self, request):
+        content_type = request.content_type.split(";")[0].strip().lower()
+        if content_type == "text/csv":
+            return csv_rows(request.stream)
+        if content_type in self.ndjson_content_types:
+            return ndjson_rows(request.stream)
+        return json_rows(request.data)
+
+    def get_record_defaults(self):
+        return {"recorded_by": self.request.user}
+
+    def post(self, request, *args, **kwargs):
+        org = _get_org(request)
+        if not org:
+            return Response(
+                {"error": "No organization selected"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            created, errors, error_count = ingest_records(
+                self.get_serializer_class(),
+                self.get_rows(request),
+                org,
+                **self.get_record_defaults(),
+            )
+        except IngestError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        applied = not error_count
+        return Response(
+            {
+                "applied": applied,
+                "created_count": created,
+                "error_count": error_count,
+                "errors": errors,
+            },
+            status=status.HTTP_201_CREATED if applied else status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class FeedRecordBulkCreateView(BulkRecordCreateView):
+    serializer_class = BulkFeedRecordSerializer
+
+
+class EggProductionBulkCreateView(BulkRecordCreateView):
+    serializer_class = BulkEggProductionSerializer
+
+
+class WeightRecordBulkCreateView(BulkRecordCreateView):
+    serializer_class = BulkWeightRecordSerializer
+
+
+class EnvironmentalRecordBulkCreateView(BulkRecordCreateView):
+    serializer_class = BulkEnvironmentalRecordSerializer
+
+
+class EnvironmentalReadingIngestView(BulkRecordCreateView):
+    """
+    Sensor feed: readings as objects or compact
+    ``[batch, date, temperature, humidity, ammonia_level]`` arrays, in any
+    of the bulk formats. Hourly and daily rollups are updated in the same
+    transaction.
+    """
+
+    serializer_class = EnvironmentalReadingSerializer
+
+    def get_record_defaults(self):
+        return {}
+
+
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def production_dashboard_view(request):
@@ -141,21 +252,16 @@ def production_dashboard_view(request):
         "records_count": recent_weights.count(),
     }
 
-    # Environmental conditions
-    recent_environmental = EnvironmentalRecord.objects.filter(
-        organization=org, batch__in=batches, date__gte=thirty_days_ago
+    # Environmental conditions, from the daily rollups of records and readings
+    environmental_stats = environment_summary(
+        EnvironmentalRollup.objects.filter(
+            organization=org,
+            batch__in=batches,
+            period="day",
+            period_start__date__gte=thirty_days_ago,
+        )
     )
 
-    environmental_stats = {
-        "average_temperature": recent_environmental.aggregate(avg=Avg("temperature"))[
-            "avg"
-        ]
-        or 0,
-        "average_humidity": recent_environmental.aggregate(avg=Avg("humidity"))["avg"]
-        or 0,
-        "records_count": recent_environmental.count(),
-    }
-
     dashboard_data = {
         "feed_consumption": feed_stats,
         "weight_tracking": weight_stats,
@@ -182,12 +288,9 @@ def batch_production_analysis_view(request, batch_number):
     try:
         batch = Batch.objects.get(id=batch_number, organization=org)
 
-        # Feed consumption analysis
-        feed_records = batch.feed_records.all().order_by("date")
-        total_feed_consumed = (
-            feed_records.aggregate(total=Sum("quantity_kg"))["total"] or 0
-        )
-        total_feed_cost = sum(record.total_cost for record in feed_records)
+        # Feed consumption analysis (running totals kept on the batch)
+        total_feed_consumed = batch.feed_kg_total
+        total_feed_cost = batch.feed_cost_total
 
         # # Egg production analysis (if applicable)
         # egg_data = {}
@@ -210,7 +313,7 @@ def batch_production_analysis_view(request, batch_number):
         #     }
 
         # Weight tracking analysis
-        weight_records = batch.weight_records.all().order_by("date")
+        weight_records = batch_records(batch, "weight_records").order_by("date")
         weight_trend = [
             {
                 "date": record.date,
@@ -219,21 +322,21 @@ def batch_production_analysis_view(request, batch_number):
             }
             for record in weight_records
         ]
+        weight_records_count = len(weight_trend)
+        weight_trend = largest_triangle_three_buckets(
+            weight_trend,
+            GROWTH_CURVE_DEFAULT_POINTS,
+            key=lambda point: (point["age_in_days"], float(point["average_weight"])),
+        )
 
         # Feed conversion ratio (if weight data available)
         fcr = None
-        if weight_records.exists() and total_feed_consumed > 0:
-            latest_weight = weight_records.last()
-            if latest_weight:
-                weight_gain = latest_weight.average_weight - (
-                    weight_records.first().average_weight
-                    if weight_records.first()
-                    else 0
-                )
-                if weight_gain > 0:
-                    fcr = total_feed_consumed / (
-                        weight_gain * batch.current_count / 1000
-                    )  # Convert to kg
+        if weight_trend and total_feed_consumed > 0:
+            weight_gain = batch.last_weight_g - weight_trend[0]["average_weight"]
+            if weight_gain > 0:
+                fcr = total_feed_consumed / (
+                    weight_gain * batch.current_count / 1000
+                )  # Convert to kg
 
         analysis_data = {
             "batch_info": {
@@ -259,13 +362,9 @@ def batch_production_analysis_view(request, batch_number):
             },
             # 'egg_production': egg_data,
             "weight_tracking": {
-                "records_count": weight_records.count(),
+                "records_count": weight_records_count,
                 "weight_trend": weight_trend,
-                "current_average_weight": (
-                    weight_records.last().average_weight
-                    if weight_records.exists()
-                    else None
-                ),
+                "current_average_weight": batch.last_weight_g,
             },
             "performance_indicators": {
                 "survival_rate": (
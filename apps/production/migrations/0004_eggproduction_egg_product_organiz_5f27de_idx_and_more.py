@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("production", "0003_eggproduction_organization_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="eggproduction",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="egg_product_organiz_5f27de_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="environmentalrecord",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="environment_organiz_37d9b8_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedrecord",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="feed_record_organiz_89cfc7_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="weightrecord",
+            index=models.Index(
+                fields=["organization", "date", "id"],
+                name="weight_reco_organiz_a3fb8a_idx",
+            ),
+        ),
+    ]
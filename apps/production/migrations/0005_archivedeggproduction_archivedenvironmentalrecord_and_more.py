@@ -0,0 +1,301 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0006_batch_archived_at"),
+        ("production", "0004_eggproduction_egg_product_organiz_5f27de_idx_and_more"),
+        ("users", "0007_email_outbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedEggProduction",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                ("total_eggs", models.PositiveIntegerField()),
+                ("grade_a_eggs", models.PositiveIntegerField(default=0)),
+                ("grade_b_eggs", models.PositiveIntegerField(default=0)),
+                ("grade_c_eggs", models.PositiveIntegerField(default=0)),
+                ("cracked_eggs", models.PositiveIntegerField(default=0)),
+                ("dirty_eggs", models.PositiveIntegerField(default=0)),
+                (
+                    "average_weight",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Average egg weight in grams",
+                        max_digits=5,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_egg_productions",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "recorded_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Egg Production",
+                "verbose_name_plural": "Archived Egg Productions",
+                "db_table": "archived_egg_productions",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "date", "id"],
+                        name="archived_eg_organiz_6d6894_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedEnvironmentalRecord",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("date", models.DateTimeField()),
+                (
+                    "temperature",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Temperature in Celsius",
+                        max_digits=5,
+                    ),
+                ),
+                (
+                    "humidity",
+                    models.DecimalField(
+                        decimal_places=2, help_text="Humidity percentage", max_digits=5
+                    ),
+                ),
+                (
+                    "ammonia_level",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Ammonia level in ppm",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "ventilation_rate",
+                    models.CharField(blank=True, max_length=100, null=True),
+                ),
+                (
+                    "lighting_hours",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=4, null=True
+                    ),
+                ),
+                ("notes", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_environmental_records",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "recorded_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Environmental Record",
+                "verbose_name_plural": "Archived Environmental Records",
+                "db_table": "archived_environmental_records",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "date", "id"],
+                        name="archived_en_organiz_ff3479_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedFeedRecord",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                (
+                    "feed_type",
+                    models.CharField(
+                        choices=[
+                            ("starter", "Starter Feed"),
+                            ("grower", "Grower Feed"),
+                            ("finisher", "Finisher Feed"),
+                            ("mash", "Mixed Mash Maize Crumbs"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("brand", models.CharField(max_length=200)),
+                ("quantity_kg", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("cost_per_kg", models.DecimalField(decimal_places=2, max_digits=8)),
+                ("supplier", models.CharField(max_length=200)),
+                (
+                    "batch_number",
+                    models.CharField(blank=True, max_length=100, null=True),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_feed_records",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "recorded_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Feed Record",
+                "verbose_name_plural": "Archived Feed Records",
+                "db_table": "archived_feed_records",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "date", "id"],
+                        name="archived_fe_organiz_84e59b_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedWeightRecord",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                (
+                    "sample_size",
+                    models.PositiveIntegerField(help_text="Number of birds weighed"),
+                ),
+                (
+                    "average_weight",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Average weight in grams",
+                        max_digits=6,
+                    ),
+                ),
+                (
+                    "min_weight",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Minimum weight in grams",
+                        max_digits=6,
+                    ),
+                ),
+                (
+                    "max_weight",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Maximum weight in grams",
+                        max_digits=6,
+                    ),
+                ),
+                ("age_in_days", models.PositiveIntegerField()),
+                ("notes", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_weight_records",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="users.organization",
+                    ),
+                ),
+                (
+                    "recorded_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Weight Record",
+                "verbose_name_plural": "Archived Weight Records",
+                "db_table": "archived_weight_records",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "date", "id"],
+                        name="archived_we_organiz_571b40_idx",
+                    )
+                ],
+            },
+        ),
+    ]
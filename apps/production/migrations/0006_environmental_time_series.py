@@ -0,0 +1,285 @@
+# Generated by Django 5.1.4 on 2026-10-17 00:27
+
+from datetime import date, timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+PARTITIONED_READINGS_SQL = [
+    """
+    CREATE TABLE "environmental_readings" (
+        "id" bigint GENERATED BY DEFAULT AS IDENTITY,
+        "date" timestamp with time zone NOT NULL,
+        "temperature" numeric(5, 2) NOT NULL,
+        "humidity" numeric(5, 2) NOT NULL,
+        "ammonia_level" numeric(5, 2) NULL,
+        "batch_id" bigint NOT NULL
+            REFERENCES "batches" ("id") DEFERRABLE INITIALLY DEFERRED,
+        "organization_id" bigint NULL
+            REFERENCES "organizations" ("id") DEFERRABLE INITIALLY DEFERRED,
+        PRIMARY KEY ("id", "date")
+    ) PARTITION BY RANGE ("date")
+    """,
+    'CREATE TABLE "environmental_readings_default" '
+    'PARTITION OF "environmental_readings" DEFAULT',
+    'CREATE INDEX "env_readings_batch_date_idx" '
+    'ON "environmental_readings" ("batch_id", "date")',
+    'CREATE INDEX "env_readings_date_brin" '
+    'ON "environmental_readings" USING brin ("date")',
+]
+
+
+def create_readings_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.create_model(apps.get_model("production", "EnvironmentalReading"))
+        return
+
+    for statement in PARTITIONED_READINGS_SQL:
+        schema_editor.execute(statement)
+    # This month and the next two; the periodic task keeps adding months.
+    today = timezone.localdate()
+    month = date(today.year, today.month, 1)
+    for _ in range(3):
+        following = (month + timedelta(days=32)).replace(day=1)
+        schema_editor.execute(
+            f'CREATE TABLE "environmental_readings_{month:%Y_%m}" '
+            'PARTITION OF "environmental_readings" '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+        )
+        month = following
+
+
+def drop_readings_table(apps, schema_editor):
+    schema_editor.delete_model(apps.get_model("production", "EnvironmentalReading"))
+
+
+def backfill_rollups(apps, schema_editor):
+    EnvironmentalRecord = apps.get_model("production", "EnvironmentalRecord")
+    EnvironmentalRollup = apps.get_model("production", "EnvironmentalRollup")
+    buckets = {}
+    records = EnvironmentalRecord.objects.order_by().values_list(
+        "organization_id",
+        "batch_id",
+        "date",
+        "temperature",
+        "humidity",
+        "ammonia_level",
+    )
+    for organization_id, batch_id, moment, temperature, humidity, ammonia in records:
+        hour = timezone.localtime(moment).replace(minute=0, second=0, microsecond=0)
+        for period, start in (("hour", hour), ("day", hour.replace(hour=0))):
+            rollup = buckets.get((batch_id, period, start))
+            if rollup is None:
+                rollup = buckets[(batch_id, period, start)] = EnvironmentalRollup(
+                    organization_id=organization_id,
+                    batch_id=batch_id,
+                    period=period,
+                    period_start=start,
+                    samples=0,
+                    temperature_min=temperature,
+                    temperature_max=temperature,
+                    temperature_sum=0,
+                    humidity_min=humidity,
+                    humidity_max=humidity,
+                    humidity_sum=0,
+                    ammonia_samples=0,
+                )
+            rollup.samples += 1
+            rollup.temperature_min = min(rollup.temperature_min, temperature)
+            rollup.temperature_max = max(rollup.temperature_max, temperature)
+            rollup.temperature_sum += temperature
+            rollup.humidity_min = min(rollup.humidity_min, humidity)
+            rollup.humidity_max = max(rollup.humidity_max, humidity)
+            rollup.humidity_sum += humidity
+            if ammonia is not None:
+                rollup.ammonia_samples += 1
+                if rollup.ammonia_sum is None:
+                    rollup.ammonia_min = rollup.ammonia_max = ammonia
+                    rollup.ammonia_sum = 0
+                rollup.ammonia_min = min(rollup.ammonia_min, ammonia)
+                rollup.ammonia_max = max(rollup.ammonia_max, ammonia)
+                rollup.ammonia_sum += ammonia
+    EnvironmentalRollup.objects.bulk_create(buckets.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("birds", "0007_batch_withdrawal_clears_on"),
+        (
+            "production",
+            "0005_archivedeggproduction_archivedenvironmentalrecord_and_more",
+        ),
+        ("users", "0007_email_outbox"),
+    ]
+
+    operations = [
+        # On PostgreSQL the readings table is range partitioned by month, which
+        # Django cannot express, so the model is added to the state only and
+        # create_readings_table writes its DDL by hand there.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="EnvironmentalReading",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        ("date", models.DateTimeField()),
+                        (
+                            "temperature",
+                            models.DecimalField(
+                                decimal_places=2,
+                                help_text="Temperature in Celsius",
+                                max_digits=5,
+                            ),
+                        ),
+                        (
+                            "humidity",
+                            models.DecimalField(
+                                decimal_places=2,
+                                help_text="Humidity percentage",
+                                max_digits=5,
+                            ),
+                        ),
+                        (
+                            "ammonia_level",
+                            models.DecimalField(
+                                blank=True,
+                                decimal_places=2,
+                                help_text="Ammonia level in ppm",
+                                max_digits=5,
+                                null=True,
+                            ),
+                        ),
+                        (
+                            "batch",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="environmental_readings",
+                                to="birds.batch",
+                            ),
+                        ),
+                        (
+                            "organization",
+                            models.ForeignKey(
+                                blank=True,
+                                null=True,
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="environmental_readings",
+                                to="users.organization",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Environmental Reading",
+                        "verbose_name_plural": "Environmental Readings",
+                        "db_table": "environmental_readings",
+                        "ordering": ["-date"],
+                        "indexes": [
+                            models.Index(
+                                fields=["batch", "date"],
+                                name="env_readings_batch_date_idx",
+                            )
+                        ],
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_readings_table, drop_readings_table),
+        migrations.CreateModel(
+            name="EnvironmentalRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")], max_length=4
+                    ),
+                ),
+                ("period_start", models.DateTimeField()),
+                ("samples", models.PositiveIntegerField(default=0)),
+                (
+                    "temperature_min",
+                    models.DecimalField(decimal_places=2, max_digits=5),
+                ),
+                (
+                    "temperature_max",
+                    models.DecimalField(decimal_places=2, max_digits=5),
+                ),
+                (
+                    "temperature_sum",
+                    models.DecimalField(decimal_places=2, max_digits=14),
+                ),
+                ("humidity_min", models.DecimalField(decimal_places=2, max_digits=5)),
+                ("humidity_max", models.DecimalField(decimal_places=2, max_digits=5)),
+                ("humidity_sum", models.DecimalField(decimal_places=2, max_digits=14)),
+                ("ammonia_samples", models.PositiveIntegerField(default=0)),
+                (
+                    "ammonia_min",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=5, null=True
+                    ),
+                ),
+                (
+                    "ammonia_max",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=5, null=True
+                    ),
+                ),
+                (
+                    "ammonia_sum",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=14, null=True
+                    ),
+                ),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="environmental_rollups",
+                        to="birds.batch",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="environmental_rollups",
+                        to="users.organization",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Environmental Rollup",
+                "verbose_name_plural": "Environmental Rollups",
+                "db_table": "environmental_rollups",
+                "ordering": ["-period_start"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "period", "period_start"],
+                        name="environment_organiz_5b90cf_idx",
+                    )
+                ],
+                "unique_together": {("batch", "period", "period_start")},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from apps.birds.models.models import Batch
+from apps.birds.models.models import Batch, archive_model
 from decimal import Decimal
 
 User = get_user_model()
@@ -45,6 +45,9 @@ class FeedRecord(models.Model):
         verbose_name = "Feed Record"
         verbose_name_plural = "Feed Records"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.batch.batch_number} - {self.feed_type} - {self.quantity_kg}kg"
@@ -100,6 +103,9 @@ class EggProduction(models.Model):
         verbose_name_plural = "Egg Productions"
         ordering = ["-date"]
         unique_together = ["batch", "date"]
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.batch.batch_number} - {self.date} - {self.total_eggs} eggs"
@@ -149,6 +155,9 @@ class WeightRecord(models.Model):
         verbose_name = "Weight Record"
         verbose_name_plural = "Weight Records"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.batch.batch_number} - {self.date} - {self.average_weight}g avg"
@@ -198,6 +207,118 @@ class EnvironmentalRecord(models.Model):
         verbose_name = "Environmental Record"
         verbose_name_plural = "Environmental Records"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["organization", "date", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.batch.batch_number} - {self.date.strftime('%Y-%m-%d %H:%M')} - {self.temperature}°C"
+
+
+# Cold tables for records of archived batches (see ``archive_service``).
+ArchivedFeedRecord = archive_model(FeedRecord)
+ArchivedEggProduction = archive_model(EggProduction)
+ArchivedWeightRecord = archive_model(WeightRecord)
+ArchivedEnvironmentalRecord = archive_model(EnvironmentalRecord)
+
+
+class EnvironmentalReading(models.Model):
+    """
+    High-frequency house sensor sample. On PostgreSQL the table is range
+    partitioned by month on ``date`` with a BRIN index (see migration 0006
+    and ``environment_service.ensure_reading_partitions``); readings are
+    written in bulk and summarized by ``EnvironmentalRollup``.
+    """
+
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        related_name="environmental_readings",
+        null=True,
+        blank=True,
+    )
+    batch = models.ForeignKey(
+        Batch, on_delete=models.CASCADE, related_name="environmental_readings"
+    )
+    date = models.DateTimeField()
+    temperature = models.DecimalField(
+        max_digits=5, decimal_places=2, help_text="Temperature in Celsius"
+    )
+    humidity = models.DecimalField(
+        max_digits=5, decimal_places=2, help_text="Humidity percentage"
+    )
+    ammonia_level = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="Ammonia level in ppm",
+    )
+
+    class Meta:
+        db_table = "environmental_readings"
+        verbose_name = "Environmental Reading"
+        verbose_name_plural = "Environmental Readings"
+        ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["batch", "date"], name="env_readings_batch_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.batch.batch_number} - {self.date} - {self.temperature}°C"
+
+
+class EnvironmentalRollup(models.Model):
+    """
+    Hourly and daily min/max/sum of environmental samples per batch, from
+    sensor readings and manual records alike. Averages are ``sum / samples``
+    so new samples merge in without rereading the raw rows.
+    """
+
+    PERIODS = [
+        ("hour", "Hour"),
+        ("day", "Day"),
+    ]
+
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        related_name="environmental_rollups",
+        null=True,
+        blank=True,
+    )
+    batch = models.ForeignKey(
+        Batch, on_delete=models.CASCADE, related_name="environmental_rollups"
+    )
+    period = models.CharField(max_length=4, choices=PERIODS)
+    period_start = models.DateTimeField()
+    samples = models.PositiveIntegerField(default=0)
+    temperature_min = models.DecimalField(max_digits=5, decimal_places=2)
+    temperature_max = models.DecimalField(max_digits=5, decimal_places=2)
+    temperature_sum = models.DecimalField(max_digits=14, decimal_places=2)
+    humidity_min = models.DecimalField(max_digits=5, decimal_places=2)
+    humidity_max = models.DecimalField(max_digits=5, decimal_places=2)
+    humidity_sum = models.DecimalField(max_digits=14, decimal_places=2)
+    ammonia_samples = models.PositiveIntegerField(default=0)
+    ammonia_min = models.DecimalField(
+        max_digits=5, decimal_places=2, null=True, blank=True
+    )
+    ammonia_max = models.DecimalField(
+        max_digits=5, decimal_places=2, null=True, blank=True
+    )
+    ammonia_sum = models.DecimalField(
+        max_digits=14, decimal_places=2, null=True, blank=True
+    )
+
+    class Meta:
+        db_table = "environmental_rollups"
+        verbose_name = "Environmental Rollup"
+        verbose_name_plural = "Environmental Rollups"
+        ordering = ["-period_start"]
+        unique_together = ["batch", "period", "period_start"]
+        indexes = [
+            models.Index(fields=["organization", "period", "period_start"]),
+        ]
+
+    def __str__(self):
+        return f"{self.batch.batch_number} - {self.period} - {self.period_start}"
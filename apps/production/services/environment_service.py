@@ -0,0 +1,266 @@
+"""Sensor reading partitions and the hourly/daily environmental rollups."""
+
+import logging
+from datetime import date, timedelta
+from decimal import Decimal
+from operator import add
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Max, Min, Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+READINGS_TABLE = "environmental_readings"
+# Monthly reading partitions kept ready beyond the current month.
+READING_PARTITION_MONTHS_AHEAD = 2
+# Record models whose rows are summarized by EnvironmentalRollup.
+ROLLUP_SOURCES = ["production.EnvironmentalRecord", "production.EnvironmentalReading"]
+# Measurements summarized per rollup bucket: rollup prefix -> sample field.
+MEASUREMENTS = {
+    "temperature": "temperature",
+    "humidity": "humidity",
+    "ammonia": "ammonia_level",
+}
+PERIOD_LENGTHS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+ROLLUP_VALUE_FIELDS = ["samples", "ammonia_samples"] + [
+    f"{prefix}_{suffix}" for prefix in MEASUREMENTS for suffix in ("min", "max", "sum")
+]
+
+
+def _month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def _next_month(day):
+    return (day + timedelta(days=32)).replace(day=1)
+
+
+def ensure_reading_partitions(months_ahead=READING_PARTITION_MONTHS_AHEAD, today=None):
+    """
+    Create the monthly partitions of the readings table from the current
+    month up to *months_ahead* months on. Readings outside them land in the
+    default partition. A no-op off PostgreSQL. Returns the tables created.
+    """
+    if connection.vendor != "postgresql":
+        return []
+
+    quote = connection.ops.quote_name
+    month = _month_start(today or timezone.localdate())
+    created = []
+    with connection.cursor() as cursor:
+        for _ in range(months_ahead + 1):
+            following = _next_month(month)
+            name = f"{READINGS_TABLE}_{month:%Y_%m}"
+            cursor.execute("SELECT to_regclass(%s)", [name])
+            if cursor.fetchone()[0] is None:
+                cursor.execute(
+                    f"CREATE TABLE {quote(name)} PARTITION OF {quote(READINGS_TABLE)} "
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{following.isoformat()}')"
+                )
+                created.append(name)
+            month = following
+    if created:
+        logger.info("Created reading partition(s): %s", ", ".join(created))
+    return created
+
+
+def bucket_starts(moment):
+    """Return ``{"hour": ..., "day": ...}`` bucket starts for *moment*."""
+    if timezone.is_aware(moment):
+        moment = timezone.localtime(moment)
+    hour = moment.replace(minute=0, second=0, microsecond=0)
+    return {"hour": hour, "day": hour.replace(hour=0)}
+
+
+def _bucket_end(period, start):
+    # Add wall-clock time so a day bucket ends at the next local midnight.
+    end = start.replace(tzinfo=None) + PERIOD_LENGTHS[period]
+    return end.replace(tzinfo=start.tzinfo)
+
+
+def _decimal(value):
+    return None if value is None else Decimal(str(value))
+
+
+def _sample_rollup(sample, period, start):
+    """An unsaved EnvironmentalRollup holding just *sample*."""
+    from apps.production.models.models import EnvironmentalRollup
+
+    rollup = EnvironmentalRollup(
+        organization_id=sample.organization_id,
+        batch_id=sample.batch_id,
+        period=period,
+        period_start=start,
+        samples=1,
+    )
+    for prefix, source in MEASUREMENTS.items():
+        value = _decimal(getattr(sample, source))
+        setattr(rollup, f"{prefix}_min", value)
+        setattr(rollup, f"{prefix}_max", value)
+        setattr(rollup, f"{prefix}_sum", value)
+    rollup.ammonia_samples = int(rollup.ammonia_sum is not None)
+    return rollup
+
+
+def _combine(first, second, operation):
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return operation(first, second)
+
+
+def _merge(target, other):
+    """Fold the samples of rollup *other* into rollup *target*."""
+    target.samples += other.samples
+    target.ammonia_samples += other.ammonia_samples
+    for prefix in MEASUREMENTS:
+        for suffix, operation in (("min", min), ("max", max), ("sum", add)):
+            name = f"{prefix}_{suffix}"
+            setattr(
+                target,
+                name,
+                _combine(getattr(target, name), getattr(other, name), operation),
+            )
+
+
+def _write_rollups(buckets):
+    from apps.production.models.models import EnvironmentalRollup
+
+    keys = list(buckets)
+    existing = {
+        (rollup.batch_id, rollup.period, rollup.period_start): rollup
+        for rollup in EnvironmentalRollup.objects.select_for_update().filter(
+            batch_id__in={key[0] for key in keys},
+            period__in={key[1] for key in keys},
+            period_start__in={key[2] for key in keys},
+        )
+    }
+    new, changed = [], []
+    for key, bucket in buckets.items():
+        rollup = existing.get(key)
+        if rollup is None:
+            new.append(bucket)
+        else:
+            _merge(rollup, bucket)
+            changed.append(rollup)
+    EnvironmentalRollup.objects.bulk_update(changed, ROLLUP_VALUE_FIELDS)
+    EnvironmentalRollup.objects.bulk_create(new)
+
+
+def add_to_rollups(samples):
+    """
+    Merge newly inserted readings or environmental records into their hourly
+    and daily rollups: one locking read and one bulk write per call.
+    """
+    buckets = {}
+    for sample in samples:
+        for period, start in bucket_starts(sample.date).items():
+            rollup = _sample_rollup(sample, period, start)
+            key = (sample.batch_id, period, start)
+            if key in buckets:
+                _merge(buckets[key], rollup)
+            else:
+                buckets[key] = rollup
+    if not buckets:
+        return
+
+    try:
+        with transaction.atomic():
+            _write_rollups(buckets)
+    except IntegrityError:
+        # A concurrent writer created one of the buckets; it is locked now.
+        with transaction.atomic():
+            _write_rollups(buckets)
+
+
+def _aggregate_bucket(model, batch_id, start, end):
+    aggregates = {"samples": Count("pk")}
+    for prefix, source in MEASUREMENTS.items():
+        aggregates[f"{prefix}_min"] = Min(source)
+        aggregates[f"{prefix}_max"] = Max(source)
+        aggregates[f"{prefix}_sum"] = Sum(source)
+    aggregates["ammonia_samples"] = Count("ammonia_level")
+    return model.objects.filter(
+        batch_id=batch_id, date__gte=start, date__lt=end
+    ).aggregate(**aggregates)
+
+
+def rebuild_rollups(batch_id, moments):
+    """
+    Recompute from the raw rows the hourly and daily buckets of *batch_id*
+    containing *moments*; used after records are edited or deleted.
+    """
+    from django.apps import apps
+
+    from apps.birds.models.models import Batch
+    from apps.production.models.models import EnvironmentalRollup
+
+    buckets = {
+        (period, start)
+        for moment in moments
+        if moment is not None
+        for period, start in bucket_starts(moment).items()
+    }
+    organization_id = (
+        Batch.objects.filter(pk=batch_id).values_list("organization_id", flat=True)
+    ).first()
+    for period, start in buckets:
+        end = _bucket_end(period, start)
+        total = EnvironmentalRollup(samples=0, ammonia_samples=0)
+        for label in ROLLUP_SOURCES:
+            row = _aggregate_bucket(apps.get_model(label), batch_id, start, end)
+            _merge(total, EnvironmentalRollup(**row))
+        values = {field: getattr(total, field) for field in ROLLUP_VALUE_FIELDS}
+
+        rollups = EnvironmentalRollup.objects.filter(
+            batch_id=batch_id, period=period, period_start=start
+        )
+        if not values["samples"]:
+            rollups.delete()
+            continue
+        updated = rollups.update(**values)
+        if not updated:
+            EnvironmentalRollup.objects.create(
+                organization_id=organization_id,
+                batch_id=batch_id,
+                period=period,
+                period_start=start,
+                **values,
+            )
+
+
+def environment_summary(rollups):
+    """
+    Summarize a filtered EnvironmentalRollup queryset (of one period) as
+    sample-weighted averages and overall extremes.
+    """
+    totals = rollups.aggregate(
+        samples=Sum("samples"),
+        temperature_sum=Sum("temperature_sum"),
+        temperature_min=Min("temperature_min"),
+        temperature_max=Max("temperature_max"),
+        humidity_sum=Sum("humidity_sum"),
+        humidity_min=Min("humidity_min"),
+        humidity_max=Max("humidity_max"),
+        ammonia_samples=Sum("ammonia_samples"),
+        ammonia_sum=Sum("ammonia_sum"),
+    )
+    samples = totals["samples"] or 0
+    ammonia_samples = totals["ammonia_samples"] or 0
+
+    def average(total, count):
+        return round(total / count, 2) if count else None
+
+    return {
+        "average_temperature": average(totals["temperature_sum"], samples) or 0,
+        "min_temperature": totals["temperature_min"],
+        "max_temperature": totals["temperature_max"],
+        "average_humidity": average(totals["humidity_sum"], samples) or 0,
+        "min_humidity": totals["humidity_min"],
+        "max_humidity": totals["humidity_max"],
+        "average_ammonia_level": average(totals["ammonia_sum"], ammonia_samples),
+        "records_count": samples,
+    }
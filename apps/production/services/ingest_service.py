@@ -0,0 +1,231 @@
+"""Bulk ingestion of production records from JSON, CSV and NDJSON uploads."""
+
+import csv
+import json
+import logging
+from itertools import islice
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Rows validated and inserted per round trip.
+INGEST_CHUNK_SIZE = 500
+# Upper bound on rows accepted by one upload.
+MAX_INGEST_ROWS = 50000
+# Row errors echoed back; the rest are only counted.
+MAX_REPORTED_ERRORS = 100
+
+
+class IngestError(Exception):
+    """The upload as a whole cannot be read."""
+
+
+def json_rows(data):
+    """Yield ``(row_number, row, error)`` for an already parsed JSON array."""
+    if not isinstance(data, list):
+        raise IngestError("Expected a JSON array of records.")
+    for number, row in enumerate(data, start=1):
+        yield number, row, None
+
+
+def ndjson_rows(stream):
+    """Yield ``(row_number, row, error)`` for each line of an NDJSON *stream*."""
+    for number, line in enumerate(stream or (), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line), None
+        except ValueError:
+            yield number, None, {"non_field_errors": ["Invalid JSON."]}
+
+
+def csv_rows(stream):
+    """
+    Yield ``(row_number, row, error)`` for a CSV *stream* with a header line.
+    Empty cells are left out so the field's default or required check applies.
+    """
+    try:
+        lines = (line.decode("utf-8-sig") for line in stream or ())
+        reader = csv.DictReader(lines)
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+        for row in reader:
+            values = {
+                name: value.strip()
+                for name, value in row.items()
+                if name and isinstance(value, str) and value.strip()
+            }
+            if values:
+                yield reader.line_num, values, None
+    except UnicodeDecodeError:
+        raise IngestError("File must be UTF-8 encoded.")
+    except csv.Error as exc:
+        raise IngestError(f"Malformed CSV: {exc}")
+
+
+def _chunks(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _batch_ids(chunk):
+    ids = set()
+    for _, row, error in chunk:
+        if error is not None:
+            continue
+        if isinstance(row, dict):
+            batch = row.get("batch")
+        elif isinstance(row, list) and row:
+            # Compact array rows lead with the batch.
+            batch = row[0]
+        else:
+            continue
+        try:
+            ids.add(int(batch))
+        except (TypeError, ValueError):
+            pass
+    return ids
+
+
+def _unique_errors(model, instances, seen):
+    """
+    Map instance index to an error for rows clashing with the model's
+    ``unique_together`` sets, either in the table or earlier in the upload.
+    """
+    errors = {}
+    for fields in model._meta.unique_together:
+        attnames = [model._meta.get_field(name).attname for name in fields]
+        keys = [tuple(getattr(obj, name) for name in attnames) for obj in instances]
+        if not keys:
+            continue
+        lookups = {
+            f"{name}__in": {key[position] for key in keys}
+            for position, name in enumerate(attnames)
+        }
+        existing = set(model.objects.filter(**lookups).values_list(*attnames))
+        taken = seen.setdefault(tuple(fields), set())
+        for index, key in enumerate(keys):
+            if key in existing or key in taken:
+                errors[index] = {
+                    "non_field_errors": [
+                        f"A record with this {', '.join(fields)} already exists."
+                    ]
+                }
+            taken.add(key)
+    return errors
+
+
+def _validate_chunk(serializer_class, chunk, organization, defaults, seen):
+    """Return ``(instances, errors)`` for one chunk of raw rows."""
+    from apps.birds.models.models import Batch
+
+    model = serializer_class.Meta.model
+    context = {
+        "batches": Batch.objects.filter(organization=organization).in_bulk(
+            _batch_ids(chunk)
+        )
+    }
+
+    numbers, instances, errors = [], [], []
+    for number, row, error in chunk:
+        if error is None:
+            serializer = serializer_class(data=row, context=context)
+            if serializer.is_valid():
+                numbers.append(number)
+                instances.append(
+                    model(
+                        **serializer.validated_data,
+                        **defaults,
+                        organization=organization,
+                    )
+                )
+                continue
+            error = serializer.errors
+        errors.append({"row": number, "errors": error})
+
+    clashes = _unique_errors(model, instances, seen)
+    if clashes:
+        errors.extend(
+            {"row": numbers[index], "errors": error} for index, error in clashes.items()
+        )
+        instances = [obj for index, obj in enumerate(instances) if index not in clashes]
+        errors.sort(key=lambda error: error["row"])
+    return instances, errors
+
+
+def _chunk_inserted(model, instances):
+    """Fold a freshly written chunk into the rollups fed by its model."""
+    from apps.production.services.environment_service import (
+        ROLLUP_SOURCES,
+        add_to_rollups,
+    )
+
+    if model._meta.label in ROLLUP_SOURCES:
+        add_to_rollups(instances)
+
+
+def _records_inserted(model, batch_ids):
+    """Do the bookkeeping the skipped per-row save signals would have done."""
+    from apps.birds.models.models import Batch
+    from apps.birds.services.batch_service import (
+        RUNNING_TOTALS,
+        recalculate_running_totals,
+    )
+    from apps.birds.services.growth_service import invalidate_growth_curve
+
+    if model._meta.label in RUNNING_TOTALS:
+        recalculate_running_totals(Batch.objects.filter(pk__in=batch_ids))
+    for batch_id in batch_ids:
+        invalidate_growth_curve(batch_id)
+
+
+def ingest_records(
+    serializer_class, rows, organization, chunk_size=INGEST_CHUNK_SIZE, **defaults
+):
+    """
+    Validate and insert *rows* (from one of the ``*_rows`` readers) as
+    records of ``serializer_class.Meta.model`` for *organization*, with
+    *defaults* (e.g. ``recorded_by``) set on every record.
+
+    Rows are consumed lazily, *chunk_size* at a time: each chunk's batches
+    and unique keys are looked up with one query apiece, then the chunk is
+    written with ``bulk_create``. Everything runs in one transaction that
+    is rolled back if any row is invalid. Returns (created, errors,
+    error_count) where *errors* lists the first ``MAX_REPORTED_ERRORS``.
+    """
+    model = serializer_class.Meta.model
+    created = error_count = rows_seen = 0
+    errors, batch_ids, seen = [], set(), {}
+
+    with transaction.atomic():
+        for chunk in _chunks(rows, chunk_size):
+            rows_seen += len(chunk)
+            if rows_seen > MAX_INGEST_ROWS:
+                raise IngestError(f"At most {MAX_INGEST_ROWS} rows per upload.")
+
+            instances, chunk_errors = _validate_chunk(
+                serializer_class, chunk, organization, defaults, seen
+            )
+            error_count += len(chunk_errors)
+            errors.extend(chunk_errors[: MAX_REPORTED_ERRORS - len(errors)])
+            if error_count:
+                # Keep validating to report errors, but stop writing.
+                continue
+            model.objects.bulk_create(instances)
+            _chunk_inserted(model, instances)
+            created += len(instances)
+            batch_ids.update(obj.batch_id for obj in instances)
+
+        if error_count:
+            transaction.set_rollback(True)
+            return 0, errors, error_count
+        _records_inserted(model, batch_ids)
+
+    logger.info(
+        "Ingested %s %s row(s) for org id=%s",
+        created,
+        model._meta.verbose_name,
+        organization.pk,
+    )
+    return created, [], 0
@@ -0,0 +1,39 @@
+"""Signal handlers for the production app."""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from apps.production.models.models import EnvironmentalRecord
+from apps.production.services import environment_service
+from core.signals import deleted_with_batch, previous_state, remember_previous
+
+# Models whose single-row writes feed EnvironmentalRollup. Sensor readings
+# reach the rollups through bulk ingestion only, and are left without
+# delete receivers so a batch's readings still cascade in one DELETE.
+ROLLUP_SENDERS = [EnvironmentalRecord]
+
+
+def sample_saved(sender, instance, created, raw=False, **kwargs):
+    """Merge a new sample into its rollups, or rebuild the buckets it left."""
+    if raw:
+        return
+    previous = previous_state(instance)
+    if created or previous is None:
+        environment_service.add_to_rollups([instance])
+        return
+    environment_service.rebuild_rollups(instance.batch_id, [instance.date])
+    if (previous.batch_id, previous.date) != (instance.batch_id, instance.date):
+        environment_service.rebuild_rollups(previous.batch_id, [previous.date])
+
+
+def sample_deleted(sender, instance, **kwargs):
+    """Rebuild the rollup buckets a deleted sample belonged to."""
+    if deleted_with_batch(kwargs.get("origin")):
+        # The batch's rollups are deleted along with it.
+        return
+    environment_service.rebuild_rollups(instance.batch_id, [instance.date])
+
+
+for model in ROLLUP_SENDERS:
+    pre_save.connect(remember_previous, sender=model)
+    post_save.connect(sample_saved, sender=model)
+    post_delete.connect(sample_deleted, sender=model)
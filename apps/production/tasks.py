@@ -0,0 +1,11 @@
+"""Celery tasks for the production app."""
+
+from celery import shared_task
+
+from apps.production.services import environment_service
+
+
+@shared_task(ignore_result=True)
+def ensure_reading_partitions():
+    """Create the upcoming monthly partitions of the sensor readings table."""
+    return len(environment_service.ensure_reading_partitions())
@@ -0,0 +1,62 @@
+"""Shared test helpers and factories for the production app."""
+
+from decimal import Decimal
+
+from django.utils import timezone
+
+from apps.production.models.models import (
+    EnvironmentalRecord,
+    FeedRecord,
+    WeightRecord,
+)
+
+
+def create_feed_record(batch, quantity_kg="10", cost_per_kg="2", **kwargs):
+    """Create a feed record for *batch*, dated today unless given."""
+    defaults = {
+        "date": timezone.localdate(),
+        "feed_type": "starter",
+        "brand": "Test Feeds",
+        "supplier": "Test Mill",
+        "recorded_by": batch.created_by,
+    }
+    defaults.update(kwargs)
+    return FeedRecord.objects.create(
+        batch=batch,
+        organization=batch.organization,
+        quantity_kg=Decimal(quantity_kg),
+        cost_per_kg=Decimal(cost_per_kg),
+        **defaults,
+    )
+
+
+def create_weight_record(batch, average_weight="500", **kwargs):
+    """Create a weight record for *batch*, dated today unless given."""
+    defaults = {
+        "date": timezone.localdate(),
+        "sample_size": 10,
+        "min_weight": Decimal("100"),
+        "max_weight": Decimal("900"),
+        "age_in_days": 14,
+        "recorded_by": batch.created_by,
+    }
+    defaults.update(kwargs)
+    return WeightRecord.objects.create(
+        batch=batch,
+        organization=batch.organization,
+        average_weight=Decimal(average_weight),
+        **defaults,
+    )
+
+
+def create_environmental_record(batch, temperature="30", humidity="60", **kwargs):
+    """Create an environmental record for *batch*, taken now unless given."""
+    defaults = {"date": timezone.now(), "recorded_by": batch.created_by}
+    defaults.update(kwargs)
+    return EnvironmentalRecord.objects.create(
+        batch=batch,
+        organization=batch.organization,
+        temperature=Decimal(temperature),
+        humidity=Decimal(humidity),
+        **defaults,
+    )
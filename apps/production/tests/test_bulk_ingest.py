@@ -0,0 +1,265 @@
+"""Tests for the bulk record ingestion endpoints."""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.tests.factories import create_batch
+from apps.production.models.models import (
+    EggProduction,
+    EnvironmentalRecord,
+    EnvironmentalRollup,
+    FeedRecord,
+    WeightRecord,
+)
+from apps.production.services import ingest_service
+from apps.users.tests.factories import create_organization, create_user
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+class BulkIngestViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(email="ingest@test.com", username="ingest")
+        self.org = create_organization(self.user, name="Ingest Org")
+        self.client = get_auth_client(self.user, self.org)
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.today = timezone.localdate()
+
+    def _day(self, days_ago):
+        return (self.today - timedelta(days=days_ago)).isoformat()
+
+    def _feed(self, batch, days_ago=0, quantity_kg="10", cost_per_kg="2"):
+        return {
+            "batch": batch.pk,
+            "date": self._day(days_ago),
+            "feed_type": "starter",
+            "brand": "Test Feeds",
+            "supplier": "Test Mill",
+            "quantity_kg": quantity_kg,
+            "cost_per_kg": cost_per_kg,
+        }
+
+    def _eggs(self, batch, days_ago=0, total=10):
+        return {
+            "batch": batch.pk,
+            "date": self._day(days_ago),
+            "total_eggs": total,
+            "grade_a_eggs": total,
+            "average_weight": "60",
+        }
+
+    def _post(self, name, data, **kwargs):
+        if "content_type" not in kwargs:
+            kwargs["format"] = "json"
+        return self.client.post(reverse(name), data, **kwargs)
+
+    def _assert_rejected(self, resp, rows):
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(resp.data["applied"])
+        self.assertEqual(resp.data["created_count"], 0)
+        self.assertEqual(resp.data["error_count"], len(rows))
+        self.assertEqual([error["row"] for error in resp.data["errors"]], rows)
+
+    def test_json_array_updates_batch_totals(self):
+        resp = self._post(
+            "feed_record_bulk_create",
+            [
+                self._feed(self.batch, 2, "10", "2"),
+                self._feed(self.batch, 1, "5", "3"),
+                self._feed(self.other, 0, "4", "1"),
+            ],
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            resp.data,
+            {"applied": True, "created_count": 3, "error_count": 0, "errors": []},
+        )
+        record = FeedRecord.objects.filter(batch=self.batch).first()
+        self.assertEqual(record.recorded_by, self.user)
+        self.assertEqual(record.organization, self.org)
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.feed_kg_total, Decimal("15"))
+        self.assertEqual(self.batch.feed_cost_total, Decimal("35"))
+        self.assertEqual(self.batch.last_feed_date, self.today - timedelta(days=1))
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.feed_kg_total, Decimal("4"))
+
+    def test_csv_upload(self):
+        body = (
+            "Batch,Date,Sample_Size,Average_Weight,Min_Weight,Max_Weight,Age_In_Days\n"
+            f"{self.batch.pk},{self._day(7)},10,300,200,400,7\n"
+            "\n"
+            f"{self.batch.pk},{self._day(0)},10,450,300,600,14\n"
+        )
+
+        resp = self._post(
+            "weight_record_bulk_create", body.encode(), content_type="text/csv"
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["created_count"], 2)
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.last_weight_g, Decimal("450"))
+        self.assertEqual(self.batch.last_weight_date, self.today)
+
+    def test_ndjson_upload(self):
+        now = timezone.now()
+        body = "\n".join(
+            [
+                f'{{"batch": {self.batch.pk}, "date": "{now.isoformat()}", '
+                '"temperature": "30", "humidity": "60"}',
+                "",
+                f'{{"batch": {self.batch.pk}, "date": '
+                f'"{(now - timedelta(minutes=5)).isoformat()}", '
+                '"temperature": "28", "humidity": "55"}',
+            ]
+        )
+
+        resp = self._post(
+            "environmental_record_bulk_create",
+            body.encode(),
+            content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["created_count"], 2)
+        self.assertEqual(EnvironmentalRecord.objects.count(), 2)
+        self.assertEqual(
+            sum(
+                EnvironmentalRollup.objects.filter(
+                    batch=self.batch, period="day"
+                ).values_list("samples", flat=True)
+            ),
+            2,
+        )
+
+    def test_invalid_ndjson_line_is_reported(self):
+        body = f'{{"batch": {self.batch.pk}}}\nnot json\n'
+
+        resp = self._post(
+            "egg_production_bulk_create",
+            body.encode(),
+            content_type="application/x-ndjson",
+        )
+
+        self._assert_rejected(resp, [1, 2])
+        self.assertEqual(
+            resp.data["errors"][1]["errors"], {"non_field_errors": ["Invalid JSON."]}
+        )
+
+    def test_mixed_upload_writes_nothing(self):
+        foreign = create_batch(
+            create_organization(
+                create_user(email="foreign@test.com", username="foreign"),
+                name="Foreign Org",
+            )
+        )
+        rows = [
+            self._feed(self.batch, 3),
+            self._feed(self.batch, 2, quantity_kg="lots"),
+            self._feed(self.batch, 1),
+            self._feed(foreign, 0),
+        ]
+
+        resp = self._post("feed_record_bulk_create", rows)
+
+        self._assert_rejected(resp, [2, 4])
+        self.assertIn("quantity_kg", resp.data["errors"][0]["errors"])
+        self.assertIn("batch", resp.data["errors"][1]["errors"])
+        self.assertFalse(FeedRecord.objects.exists())
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.feed_kg_total, 0)
+
+    def test_later_chunk_errors_roll_back_earlier_chunks(self):
+        rows = [self._feed(self.batch, days) for days in range(5)]
+        rows[-1]["quantity_kg"] = "lots"
+
+        with mock.patch(
+            "apps.production.services.ingest_service.INGEST_CHUNK_SIZE", 2
+        ), mock.patch.object(ingest_service.ingest_records, "__defaults__", (2,)):
+            resp = self._post("feed_record_bulk_create", rows)
+
+        self._assert_rejected(resp, [5])
+        self.assertFalse(FeedRecord.objects.exists())
+
+    def test_duplicate_rows_within_one_upload(self):
+        resp = self._post(
+            "egg_production_bulk_create",
+            [
+                self._eggs(self.batch, 1),
+                self._eggs(self.batch, 0),
+                self._eggs(self.batch, 1, total=12),
+                self._eggs(self.other, 1),
+            ],
+        )
+
+        self._assert_rejected(resp, [3])
+        self.assertEqual(
+            resp.data["errors"][0]["errors"],
+            {"non_field_errors": ["A record with this batch, date already exists."]},
+        )
+        self.assertFalse(EggProduction.objects.exists())
+
+    def test_duplicate_of_an_existing_row(self):
+        self.assertEqual(
+            self._post(
+                "egg_production_bulk_create", [self._eggs(self.batch, 1)]
+            ).status_code,
+            status.HTTP_201_CREATED,
+        )
+
+        resp = self._post(
+            "egg_production_bulk_create",
+            [self._eggs(self.batch, 0), self._eggs(self.batch, 1)],
+        )
+
+        self._assert_rejected(resp, [2])
+        self.assertEqual(EggProduction.objects.count(), 1)
+
+    def test_row_limit(self):
+        rows = [self._feed(self.batch, days) for days in range(3)]
+
+        with mock.patch.object(ingest_service, "MAX_INGEST_ROWS", 2):
+            resp = self._post("feed_record_bulk_create", rows)
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data, {"error": "At most 2 rows per upload."})
+        self.assertFalse(FeedRecord.objects.exists())
+
+    def test_reported_errors_are_capped(self):
+        rows = [{"batch": self.batch.pk} for _ in range(5)]
+
+        with mock.patch.object(ingest_service, "MAX_REPORTED_ERRORS", 3):
+            resp = self._post("weight_record_bulk_create", rows)
+
+        self.assertEqual(resp.data["error_count"], 5)
+        self.assertEqual([error["row"] for error in resp.data["errors"]], [1, 2, 3])
+        self.assertFalse(WeightRecord.objects.exists())
+
+    def test_body_must_be_an_array(self):
+        resp = self._post("feed_record_bulk_create", self._feed(self.batch))
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data, {"error": "Expected a JSON array of records."})
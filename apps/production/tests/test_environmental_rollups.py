@@ -0,0 +1,179 @@
+"""Tests for the hourly and daily environmental rollups."""
+
+from datetime import timedelta
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.birds.tests.factories import create_batch
+from apps.production.api.serializers import EnvironmentalReadingSerializer
+from apps.production.models.models import EnvironmentalReading, EnvironmentalRollup
+from apps.production.services.environment_service import (
+    bucket_starts,
+    environment_summary,
+)
+from apps.production.services.ingest_service import ingest_records, json_rows
+from apps.production.tests.factories import create_environmental_record
+from apps.users.tests.factories import create_organization, create_user
+
+ROLLUP_FIELDS = [
+    "batch_id",
+    "period",
+    "period_start",
+    "samples",
+    "temperature_min",
+    "temperature_max",
+    "temperature_sum",
+    "humidity_min",
+    "humidity_max",
+    "humidity_sum",
+    "ammonia_samples",
+    "ammonia_min",
+    "ammonia_max",
+    "ammonia_sum",
+]
+
+
+class EnvironmentalRollupTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="rollups@test.com", username="rollups")
+        self.org = create_organization(self.user, name="Rollups Org")
+        self.batch = create_batch(self.org)
+        self.other = create_batch(self.org)
+        self.hour = bucket_starts(timezone.now() - timedelta(days=1))["hour"]
+
+    def _rollups(self, *batches):
+        return sorted(
+            EnvironmentalRollup.objects.filter(batch__in=batches).values_list(
+                *ROLLUP_FIELDS
+            )
+        )
+
+    def _hour(self, batch, start=None):
+        return EnvironmentalRollup.objects.get(
+            batch=batch, period="hour", period_start=start or self.hour
+        )
+
+    def _record(self, batch, minutes=0, **kwargs):
+        return create_environmental_record(
+            batch, date=self.hour + timedelta(minutes=minutes), **kwargs
+        )
+
+    def test_records_merge_into_hour_and_day(self):
+        self._record(self.batch, 5, temperature="20", ammonia_level=Decimal("0"))
+        self._record(self.batch, 50, temperature="30", ammonia_level=Decimal("8"))
+        self._record(self.batch, 70, temperature="25")
+
+        hour = self._hour(self.batch)
+        self.assertEqual(hour.samples, 2)
+        self.assertEqual(
+            (hour.temperature_min, hour.temperature_max, hour.temperature_sum),
+            (Decimal("20"), Decimal("30"), Decimal("50")),
+        )
+        self.assertEqual(
+            (hour.ammonia_samples, hour.ammonia_min, hour.ammonia_max),
+            (2, Decimal("0"), Decimal("8")),
+        )
+        day_start = bucket_starts(self.hour)["day"]
+        days = EnvironmentalRollup.objects.filter(batch=self.batch, period="day")
+        self.assertEqual(sum(day.samples for day in days), 3)
+        self.assertTrue(days.filter(period_start=day_start).exists())
+
+    def test_edit_rebuilds_old_and_new_buckets(self):
+        self._record(self.batch, 5, temperature="20")
+        record = self._record(self.batch, 10, temperature="30")
+
+        record.temperature = Decimal("22")
+        record.save()
+        self.assertEqual(self._hour(self.batch).temperature_max, Decimal("22"))
+
+        record.date = self.hour + timedelta(hours=1, minutes=10)
+        record.save()
+        self.assertEqual(self._hour(self.batch).samples, 1)
+        later = self._hour(self.batch, self.hour + timedelta(hours=1))
+        self.assertEqual(later.temperature_sum, Decimal("22"))
+
+    def test_move_between_batches(self):
+        record = self._record(self.batch, 5)
+
+        record.batch = self.other
+        record.save()
+
+        self.assertFalse(EnvironmentalRollup.objects.filter(batch=self.batch).exists())
+        self.assertEqual(self._hour(self.other).samples, 1)
+
+    def test_delete_drops_empty_buckets(self):
+        kept = self._record(self.batch, 5, temperature="20")
+        record = self._record(self.batch, 10, temperature="30")
+
+        record.delete()
+        self.assertEqual(self._hour(self.batch).temperature_max, Decimal("20"))
+
+        kept.delete()
+        self.assertFalse(EnvironmentalRollup.objects.filter(batch=self.batch).exists())
+
+    def test_batch_delete_cascades(self):
+        self._record(self.batch, 5)
+        self._record(self.other, 5)
+        before = self._rollups(self.other)
+
+        self.batch.delete()
+
+        self.assertFalse(
+            EnvironmentalRollup.objects.filter(batch_id=self.batch.pk).exists()
+        )
+        self.assertEqual(self._rollups(self.other), before)
+
+    def test_reading_ingestion_feeds_rollups(self):
+        rows = [
+            [self.batch.pk, (self.hour + timedelta(minutes=m)).isoformat(), 20 + m, 60]
+            for m in range(3)
+        ] + [
+            {
+                "batch": self.batch.pk,
+                "date": self.hour.isoformat(),
+                "temperature": "19",
+                "humidity": "50",
+                "ammonia_level": "0",
+            }
+        ]
+
+        created, errors, error_count = ingest_records(
+            EnvironmentalReadingSerializer, json_rows(rows), self.org, chunk_size=2
+        )
+
+        self.assertEqual((created, errors, error_count), (4, [], 0))
+        self.assertEqual(EnvironmentalReading.objects.count(), 4)
+        hour = self._hour(self.batch)
+        self.assertEqual(hour.samples, 4)
+        self.assertEqual(
+            (hour.temperature_min, hour.temperature_max, hour.temperature_sum),
+            (Decimal("19"), Decimal("22"), Decimal("82")),
+        )
+        self.assertEqual((hour.ammonia_samples, hour.ammonia_min), (1, Decimal("0")))
+
+        summary = environment_summary(
+            EnvironmentalRollup.objects.filter(batch=self.batch, period="hour")
+        )
+        self.assertEqual(summary["records_count"], 4)
+        self.assertEqual(summary["average_temperature"], Decimal("20.50"))
+        self.assertEqual(summary["average_ammonia_level"], Decimal("0"))
+
+    def test_backfill_matches_live_rollups(self):
+        self._record(self.batch, 5, ammonia_level=Decimal("0"))
+        self._record(self.batch, 10, ammonia_level=Decimal("5"))
+        self._record(self.batch, 15)
+        self._record(self.other, 70, temperature="18", ammonia_level=Decimal("3"))
+        expected = self._rollups(self.batch, self.other)
+
+        EnvironmentalRollup.objects.all().delete()
+        migration = import_module(
+            "apps.production.migrations.0006_environmental_time_series"
+        )
+        migration.backfill_rollups(apps, None)
+
+        self.assertEqual(self._rollups(self.batch, self.other), expected)
@@ -0,0 +1,111 @@
+"""Tests for the opt-in keyset pagination of record list endpoints."""
+
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.birds.tests.factories import create_batch
+from apps.production.tests.factories import create_feed_record
+from apps.users.tests.factories import create_organization, create_user
+from core.pagination import KeysetPagination
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+def _ids(resp):
+    return [row["id"] for row in resp.data["results"]]
+
+
+class KeysetPaginationTests(TestCase):
+
+    def setUp(self):
+        self.url = reverse("feed_record_list_create")
+        self.user = create_user(email="keyset@test.com", username="keyset")
+        self.org = create_organization(self.user, name="Keyset Org")
+        self.client = get_auth_client(self.user, self.org)
+        batch = create_batch(self.org)
+        today = timezone.localdate()
+        # Several rows share each date, so pages must break ties on id.
+        records = [
+            create_feed_record(batch, date=today - timedelta(days=days))
+            for days in (1, 0, 1, 0, 0, 2, 1)
+        ]
+        self.expected = [
+            record.pk
+            for record in sorted(records, key=lambda r: (r.date, r.pk), reverse=True)
+        ]
+
+    def test_pages_forward_then_back(self):
+        resp = self.client.get(self.url, {"pagination": "cursor", "page_size": 3})
+        self.assertIsNone(resp.data["previous"])
+        self.assertNotIn("count", resp.data)
+
+        pages = [_ids(resp)]
+        while resp.data["next"]:
+            resp = self.client.get(resp.data["next"])
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            pages.append(_ids(resp))
+        self.assertEqual(
+            pages, [self.expected[:3], self.expected[3:6], self.expected[6:]]
+        )
+
+        back = []
+        while resp.data["previous"]:
+            resp = self.client.get(resp.data["previous"])
+            back.append(_ids(resp))
+        self.assertEqual(back, [pages[1], pages[0]])
+        self.assertIsNone(resp.data["previous"])
+        self.assertIsNotNone(resp.data["next"])
+
+    def test_cursor_parameter_alone_opts_in(self):
+        first = self.client.get(self.url, {"pagination": "cursor", "page_size": 2})
+        cursor = parse_qs(urlparse(first.data["next"]).query)["cursor"][0]
+
+        resp = self.client.get(self.url, {"cursor": cursor, "page_size": 2})
+
+        self.assertEqual(_ids(resp), self.expected[2:4])
+
+    def test_invalid_cursor_is_not_found(self):
+        for cursor in ("not-base64!", "WzEsMl0=", "WzAsICJub3QgYSBkYXRlIiwgMV0="):
+            with self.subTest(cursor=cursor):
+                resp = self.client.get(self.url, {"cursor": cursor})
+                self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_size_is_clamped(self):
+        resp = self.client.get(self.url, {"pagination": "cursor", "page_size": 0})
+        self.assertEqual(_ids(resp), self.expected[:1])
+
+        with mock.patch.object(KeysetPagination, "max_page_size", 4):
+            resp = self.client.get(self.url, {"pagination": "cursor", "page_size": 50})
+        self.assertEqual(_ids(resp), self.expected[:4])
+
+        resp = self.client.get(self.url, {"pagination": "cursor", "page_size": "x"})
+        self.assertEqual(_ids(resp), self.expected)
+
+    def test_page_numbers_stay_the_default(self):
+        resp = self.client.get(self.url)
+
+        self.assertEqual(resp.data["count"], len(self.expected))
+
+    def test_union_querysets_are_refused(self):
+        resp = self.client.get(
+            self.url, {"pagination": "cursor", "include_archived": "true"}
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
@@ -15,6 +15,7 @@ from apps.reports.api.serializers import (
     AlertUpdateSerializer,
 )
 from apps.users.permissions import IsOrganizationMember
+from core.pagination import OptionalKeysetPagination
 
 
 def _get_org(request):
@@ -61,6 +62,8 @@ class AlertListView(generics.ListAPIView):
 
     serializer_class = AlertSerializer
     permission_classes = [permissions.IsAuthenticated, IsOrganizationMember]
+    pagination_class = OptionalKeysetPagination
+    keyset_field = "created_at"
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["alert_type", "severity", "is_read", "is_resolved"]
     search_fields = ["title", "message"]
@@ -177,28 +180,24 @@ def analytics_dashboard_view(request):
     }
 
     # Health analytics
-    from apps.health.models.models import HealthRecord, MortalityRecord
+    from apps.health.models.models import DailyMortality, HealthRecord
+    from apps.health.services.mortality_rollup_service import mortality_summary
 
     recent_health = HealthRecord.objects.filter(
         organization=org, batch__in=batches, date__gte=last_30_days
     )
-    recent_mortality = MortalityRecord.objects.filter(
-        organization=org, batch__in=batches, date__gte=last_30_days
+    recent_mortality = mortality_summary(
+        DailyMortality.objects.filter(
+            organization=org, batch__in=batches, date__gte=last_30_days
+        )
     )
 
     health_analytics = {
         "total_health_records_30_days": recent_health.count(),
         "vaccinations_30_days": recent_health.filter(record_type="vaccination").count(),
         "treatments_30_days": recent_health.filter(record_type="treatment").count(),
-        "total_mortality_30_days": recent_mortality.aggregate(total=Sum("count"))[
-            "total"
-        ]
-        or 0,
-        "mortality_by_cause": list(
-            recent_mortality.values("cause_category")
-            .annotate(total=Sum("count"))
-            .order_by("-total")
-        ),
+        "total_mortality_30_days": recent_mortality["total"],
+        "mortality_by_cause": recent_mortality["by_cause"],
         "health_cost_30_days": recent_health.aggregate(total=Sum("cost"))["total"] or 0,
     }
 
@@ -324,13 +323,20 @@ def generate_report_view(request):
             }
 
         elif report_type == "health":
-            from apps.health.models.models import HealthRecord, MortalityRecord
+            from apps.health.models.models import DailyMortality, HealthRecord
+            from apps.health.services.mortality_rollup_service import (
+                mortality_summary,
+            )
 
             health_records = HealthRecord.objects.filter(
                 organization=org, batch__in=batches, date__range=[start_date, end_date]
             )
-            mortality_records = MortalityRecord.objects.filter(
-                organization=org, batch__in=batches, date__range=[start_date, end_date]
+            mortality = mortality_summary(
+                DailyMortality.objects.filter(
+                    organization=org,
+                    batch__in=batches,
+                    date__range=[start_date, end_date],
+                )
             )
 
             report_data = {
@@ -339,17 +345,10 @@ def generate_report_view(request):
                     record_type="vaccination"
                 ).count(),
                 "treatments": health_records.filter(record_type="treatment").count(),
-                "total_mortality": mortality_records.aggregate(total=Sum("count"))[
-                    "total"
-                ]
-                or 0,
+                "total_mortality": mortality["total"],
                 "health_costs": health_records.aggregate(total=Sum("cost"))["total"]
                 or 0,
-                "mortality_by_cause": list(
-                    mortality_records.values("cause_category")
-                    .annotate(total=Sum("count"))
-                    .order_by("-total")
-                ),
+                "mortality_by_cause": mortality["by_cause"],
                 "batches_included": batches.count(),
                 "date_range": f"{start_date} to {end_date}",
             }
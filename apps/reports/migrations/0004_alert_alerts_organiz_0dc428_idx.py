@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reports", "0003_alert_organization_report_organization"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="alert",
+            index=models.Index(
+                fields=["organization", "created_at", "id"],
+                name="alerts_organiz_0dc428_idx",
+            ),
+        ),
+    ]
@@ -117,6 +117,9 @@ class Alert(models.Model):
         verbose_name = "Alert"
         verbose_name_plural = "Alerts"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["organization", "created_at", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.severity}"
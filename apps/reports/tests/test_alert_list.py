@@ -0,0 +1,88 @@
+"""Tests for the alert list endpoint."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.reports.models.models import Alert
+from apps.users.tests.factories import create_organization, create_user
+
+
+def get_auth_client(user, org):
+    """Return an APIClient with JWT and X-Organization-ID headers."""
+    client = APIClient()
+    token = RefreshToken.for_user(user)
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token.access_token}",
+        HTTP_X_ORGANIZATION_ID=str(org.pk),
+    )
+    return client
+
+
+def _ids(resp):
+    return [row["id"] for row in resp.data["results"]]
+
+
+class AlertListPaginationTests(TestCase):
+
+    def setUp(self):
+        self.url = reverse("alert_list")
+        self.user = create_user(email="alerts@test.com", username="alerts")
+        self.org = create_organization(self.user, name="Alerts Org")
+        self.client = get_auth_client(self.user, self.org)
+        now = timezone.now()
+        alerts = []
+        for minutes in (0, 5, 0, 5, 10):
+            alert = Alert.objects.create(
+                organization=self.org,
+                alert_type="system",
+                severity="low",
+                title="Alert",
+                message="Something happened",
+            )
+            # Pairs of alerts share a creation time.
+            Alert.objects.filter(pk=alert.pk).update(
+                created_at=now - timedelta(minutes=minutes)
+            )
+            alert.refresh_from_db()
+            alerts.append(alert)
+        self.expected = [
+            alert.pk
+            for alert in sorted(
+                alerts, key=lambda a: (a.created_at, a.pk), reverse=True
+            )
+        ]
+
+    def test_pages_forward_then_back_on_created_at(self):
+        resp = self.client.get(self.url, {"pagination": "cursor", "page_size": 2})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        pages = [_ids(resp)]
+        while resp.data["next"]:
+            resp = self.client.get(resp.data["next"])
+            pages.append(_ids(resp))
+        self.assertEqual(
+            pages, [self.expected[:2], self.expected[2:4], self.expected[4:]]
+        )
+
+        back = []
+        while resp.data["previous"]:
+            resp = self.client.get(resp.data["previous"])
+            back.append(_ids(resp))
+        self.assertEqual(back, [pages[1], pages[0]])
+
+    def test_filters_apply_to_cursor_pages(self):
+        Alert.objects.filter(pk__in=self.expected[1:3]).update(is_read=True)
+
+        resp = self.client.get(
+            self.url, {"pagination": "cursor", "page_size": 1, "is_read": "true"}
+        )
+        second = self.client.get(resp.data["next"])
+
+        self.assertEqual(_ids(resp) + _ids(second), self.expected[1:3])
+        self.assertIsNone(second.data["next"])
@@ -6,6 +6,7 @@ from apps.users.models.organization import (
     OrganizationMembership,
     OrganizationInvitation,
 )
+from apps.users.models.outbox import EmailOutbox
 
 
 @admin.register(User)
@@ -91,3 +92,11 @@ class OrganizationInvitationAdmin(admin.ModelAdmin):
     list_filter = ("status", "role")
     search_fields = ("organization__name", "email")
     readonly_fields = ("token",)
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ("to_email", "subject", "status", "attempts", "created_at")
+    list_filter = ("status",)
+    search_fields = ("to_email", "subject")
+    readonly_fields = ("created_at", "sent_at", "last_error")
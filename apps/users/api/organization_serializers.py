@@ -1,5 +1,9 @@
 """Serializers for Organization management."""
 
+import csv
+import io
+
+from django.conf import settings
 from rest_framework import serializers
 from apps.users.models.organization import (
     Organization,
@@ -14,6 +18,7 @@ class OrganizationSerializer(serializers.ModelSerializer):
 
     owner = UserSerializer(read_only=True)
     member_count = serializers.ReadOnlyField()
+    current_user_role = serializers.CharField(read_only=True, default=None)
 
     class Meta:
         model = Organization
@@ -24,6 +29,7 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "description",
             "owner",
             "member_count",
+            "current_user_role",
             "is_active",
             "created_at",
             "updated_at",
@@ -88,6 +94,70 @@ class InviteMemberSerializer(serializers.Serializer):
     role = serializers.ChoiceField(choices=["admin", "worker"], default="worker")
 
 
+class BulkInviteMemberSerializer(serializers.Serializer):
+    """
+    Serializer for inviting several members at once, either as a JSON list
+    (``invitations``) or as an uploaded CSV ``file`` with an ``email`` column
+    and an optional ``role`` column.
+    """
+
+    invitations = InviteMemberSerializer(many=True, required=False)
+    file = serializers.FileField(required=False)
+    role = serializers.ChoiceField(choices=["admin", "worker"], default="worker")
+
+    def validate(self, attrs):
+        if bool(attrs.get("invitations")) == bool(attrs.get("file")):
+            raise serializers.ValidationError(
+                "Provide either an 'invitations' list or a CSV 'file'."
+            )
+        if attrs.get("file"):
+            attrs["invitations"] = self._parse_csv(attrs.pop("file"), attrs["role"])
+
+        limit = getattr(settings, "ORGANIZATION_MEMBER_LIMIT", 50)
+        if len(attrs["invitations"]) > limit:
+            raise serializers.ValidationError(
+                f"At most {limit} invitations can be sent at once."
+            )
+        return attrs
+
+    def _parse_csv(self, upload, default_role):
+        try:
+            text = upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise serializers.ValidationError({"file": "File must be UTF-8 encoded."})
+
+        reader = csv.DictReader(io.StringIO(text))
+        fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+        if "email" not in fieldnames:
+            raise serializers.ValidationError(
+                {"file": "CSV must have an 'email' column."}
+            )
+        reader.fieldnames = fieldnames
+
+        rows = []
+        for row in reader:
+            if None in row:
+                # DictReader files the cells past the header under ``None``.
+                raise serializers.ValidationError(
+                    {
+                        "file": f"Line {reader.line_num} has more columns "
+                        "than the header."
+                    }
+                )
+            if not any((value or "").strip() for value in row.values()):
+                continue
+            rows.append(
+                {
+                    "email": (row.get("email") or "").strip(),
+                    "role": (row.get("role") or "").strip().lower() or default_role,
+                }
+            )
+        serializer = InviteMemberSerializer(data=rows, many=True)
+        if not serializer.is_valid():
+            raise serializers.ValidationError({"file": serializer.errors})
+        return serializer.validated_data
+
+
 class InvitationSerializer(serializers.ModelSerializer):
     """Read serializer for invitations."""
 
@@ -109,3 +179,12 @@ class InvitationSerializer(serializers.ModelSerializer):
             "accepted_at",
         )
         read_only_fields = fields
+
+
+class InvitationSummarySerializer(serializers.ModelSerializer):
+    """Compact invitation serializer used in bulk responses."""
+
+    class Meta:
+        model = OrganizationInvitation
+        fields = ("id", "email", "role", "token", "status", "expires_at")
+        read_only_fields = fields
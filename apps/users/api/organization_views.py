@@ -2,6 +2,8 @@
 
 import logging
 
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -17,9 +19,15 @@ from apps.users.api.organization_serializers import (
     MembershipSerializer,
     UpdateMemberRoleSerializer,
     InviteMemberSerializer,
+    BulkInviteMemberSerializer,
     InvitationSerializer,
+    InvitationSummarySerializer,
 )
 from apps.users.permissions import IsOrganizationOwner, IsOrganizationAdmin
+from apps.users.services.membership_service import (
+    get_membership,
+    invalidate_organization,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,39 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+def _active_member_count():
+    """Subquery expression counting an organization's active members."""
+    active_members = (
+        OrganizationMembership.objects.filter(
+            organization=OuterRef("pk"), is_active=True
+        )
+        .order_by()
+        .values("organization")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(active_members, output_field=IntegerField()), Value(0))
+
+
+def _annotated_organizations(user):
+    """
+    The user's organizations with the owner joined and the active member
+    count and the user's own role annotated, so listing costs one query.
+    """
+    own_role = OrganizationMembership.objects.filter(
+        organization=OuterRef("pk"), user=user, is_active=True
+    ).values("role")[:1]
+
+    return (
+        user.get_organizations()
+        .select_related("owner")
+        .annotate(
+            active_member_count=_active_member_count(),
+            current_user_role=Subquery(own_role),
+        )
+    )
+
+
 class OrganizationListCreateView(generics.ListCreateAPIView):
     """
     GET  /api/organizations/           – list user's organizations
@@ -43,7 +84,7 @@ class OrganizationListCreateView(generics.ListCreateAPIView):
         return OrganizationSerializer
 
     def get_queryset(self):
-        return self.request.user.get_organizations()
+        return _annotated_organizations(self.request.user)
 
 
 class OrganizationDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -61,7 +102,7 @@ class OrganizationDetailView(generics.RetrieveUpdateDestroyAPIView):
         return OrganizationSerializer
 
     def get_queryset(self):
-        return self.request.user.get_organizations()
+        return _annotated_organizations(self.request.user)
 
     def get_permissions(self):
         if self.request.method == "DELETE":
@@ -70,9 +111,14 @@ class OrganizationDetailView(generics.RetrieveUpdateDestroyAPIView):
             return [permissions.IsAuthenticated(), IsOrganizationAdmin()]
         return [permissions.IsAuthenticated()]
 
+    def perform_update(self, serializer):
+        instance = serializer.save()
+        invalidate_organization(instance)
+
     def perform_destroy(self, instance):
         instance.is_active = False
         instance.save(update_fields=["is_active", "updated_at"])
+        invalidate_organization(instance)
         logger.info("Organization '%s' soft-deleted", instance.name)
 
 
@@ -91,17 +137,25 @@ class OrganizationMembersView(generics.ListAPIView):
 
     def get_queryset(self):
         org_pk = self.kwargs["pk"]
-        return OrganizationMembership.objects.filter(
-            organization_id=org_pk,
-            organization__memberships__user=self.request.user,
-            organization__memberships__is_active=True,
-            is_active=True,
-        ).select_related("user")
+        # The caller's own membership is usually already resolved for the request.
+        if get_membership(self.request.user, org_pk) is None:
+            return OrganizationMembership.objects.none()
+        return (
+            OrganizationMembership.objects.filter(
+                organization_id=org_pk, is_active=True
+            )
+            .select_related("user")
+            .order_by("joined_at", "pk")
+        )
 
 
 class InviteMemberView(APIView):
     """
     POST /api/organizations/<pk>/members/invite/
+
+    Accepts a single ``{"email", "role"}``, a JSON list
+    ``{"invitations": [{"email", "role"}, ...]}`` or a multipart CSV
+    ``file`` (``email`` and optional ``role`` columns).
     """
 
     permission_classes = [permissions.IsAuthenticated, IsOrganizationAdmin]
@@ -109,7 +163,11 @@ class InviteMemberView(APIView):
     def post(self, request, pk):
         from apps.users.services.organization_service import invite_member
 
-        serializer = InviteMemberSerializer(data=request.data)
+        bulk = "invitations" in request.data or "file" in request.data
+        if bulk:
+            serializer = BulkInviteMemberSerializer(data=request.data)
+        else:
+            serializer = InviteMemberSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         try:
@@ -127,6 +185,9 @@ class InviteMemberView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
+        if bulk:
+            return self._bulk_invite(request, organization, serializer.validated_data)
+
         invitation, error = invite_member(
             organization,
             serializer.validated_data["email"],
@@ -142,6 +203,29 @@ class InviteMemberView(APIView):
             status=status.HTTP_201_CREATED,
         )
 
+    def _bulk_invite(self, request, organization, validated_data):
+        from apps.users.services.organization_service import invite_members
+
+        invitations, skipped, error = invite_members(
+            organization,
+            [(item["email"], item["role"]) for item in validated_data["invitations"]],
+            request.user,
+        )
+
+        if error:
+            return Response(
+                {"error": error, "skipped": skipped},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "invited": InvitationSummarySerializer(invitations, many=True).data,
+                "skipped": skipped,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class UpdateMemberRoleView(APIView):
     """
@@ -151,6 +235,8 @@ class UpdateMemberRoleView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsOrganizationOwner]
 
     def patch(self, request, pk, user_id):
+        from apps.users.services.organization_service import update_member_role
+
         serializer = UpdateMemberRoleSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -164,16 +250,11 @@ class UpdateMemberRoleView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        if membership.role == "owner":
-            return Response(
-                {
-                    "error": "Cannot change the owner's role. Transfer ownership instead."
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        membership.role = serializer.validated_data["role"]
-        membership.save(update_fields=["role", "updated_at"])
+        membership, error = update_member_role(
+            membership, serializer.validated_data["role"]
+        )
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(MembershipSerializer(membership).data)
 
@@ -247,9 +328,16 @@ class PendingInvitationsView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return OrganizationInvitation.objects.filter(
-            email=self.request.user.email, status="pending"
-        ).select_related("organization", "invited_by")
+        organizations = Organization.objects.select_related("owner").annotate(
+            active_member_count=_active_member_count()
+        )
+        return (
+            OrganizationInvitation.objects.filter(
+                email=self.request.user.email, status="pending"
+            )
+            .select_related("invited_by")
+            .prefetch_related(Prefetch("organization", queryset=organizations))
+        )
 
 
 class RevokeInvitationView(APIView):
@@ -3,7 +3,9 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from apps.users.models.models import User
+from apps.users.tokens import OrganizationRefreshToken
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -139,3 +141,12 @@ class ChangePasswordSerializer(serializers.Serializer):
         if not user.check_password(value):
             raise serializers.ValidationError("Old password is incorrect")
         return value
+
+
+class OrganizationTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that rotates ``OrganizationRefreshToken``s, so the
+    blacklist check and rotation use the cache-backed blacklist store.
+    """
+
+    token_class = OrganizationRefreshToken
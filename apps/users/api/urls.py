@@ -7,6 +7,11 @@ urlpatterns = [
     path("register/", views.RegisterView.as_view(), name="register"),
     path("login/", views.login_view, name="login"),
     path("logout/", views.logout_view, name="logout"),
+    path(
+        "token/refresh/",
+        views.OrganizationTokenRefreshView.as_view(),
+        name="token_refresh",
+    ),
     path("profile/", views.ProfileView.as_view(), name="profile"),
     path("change-password/", views.change_password_view, name="change_password"),
     path("users/", views.UserListView.as_view(), name="user_list"),
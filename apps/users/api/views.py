@@ -5,22 +5,29 @@ import logging
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.views import TokenRefreshView
+from django.conf import settings
 from django.contrib.auth import login, logout
+from django.contrib.auth.signals import user_logged_in
 from apps.users.models.models import User
+from apps.users.tokens import OrganizationRefreshToken
 from apps.users.api.serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserSerializer,
     UserUpdateSerializer,
     ChangePasswordSerializer,
+    OrganizationTokenRefreshSerializer,
 )
 
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Also start a Django session on API login (only needed for session-based clients).
+LOGIN_CREATES_SESSION = getattr(settings, "API_LOGIN_CREATES_SESSION", False)
+
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -38,7 +45,7 @@ class RegisterView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
 
-        refresh = RefreshToken.for_user(user)
+        refresh = OrganizationRefreshToken.for_user(user)
         logger.info(
             "User registered: id=%s, email=%s",
             getattr(user, "id", None),
@@ -68,7 +75,7 @@ class EmailVerificationView(generics.GenericAPIView):
 
     def get(self, request, *args, **kwargs):
         """Link-based verification (user clicked the email link)."""
-        from apps.users.services.otp_service import verify_token
+        from apps.users.services.otp_service import get_user_for_token, verify_token
 
         token_str = request.query_params.get("token")
         if not token_str:
@@ -76,9 +83,8 @@ class EmailVerificationView(generics.GenericAPIView):
                 {"error": "Token is required."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            user = User.objects.get(email_verification_token=token_str)
-        except (User.DoesNotExist, Exception):
+        user = get_user_for_token(token_str)
+        if user is None:
             return Response(
                 {"error": "Invalid token."}, status=status.HTTP_400_BAD_REQUEST
             )
@@ -172,14 +178,20 @@ class ResendVerificationEmailView(generics.GenericAPIView):
 @permission_classes([permissions.AllowAny])
 def login_view(request):
     """
-    API view for user login
+    API view for user login.
+    Token-only by default: no session row or CSRF rotation, since API clients
+    authenticate with the bearer token. ``user_logged_in`` is still sent so
+    ``last_login`` and other receivers behave as with ``login()``.
     """
     serializer = UserLoginSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.validated_data["user"]
-        login(request, user)
+        if LOGIN_CREATES_SESSION:
+            login(request, user)
+        else:
+            user_logged_in.send(sender=user.__class__, request=request, user=user)
 
-        refresh = RefreshToken.for_user(user)
+        refresh = OrganizationRefreshToken.for_user(user)
 
         response_data = {
             "user": UserSerializer(user).data,
@@ -205,9 +217,18 @@ def login_view(request):
 def logout_view(request):
     """
     API view for user logout.
-    Client should handle token invalidation.
-    Optionally, you can implement token blacklisting here.
+    Blacklists the refresh token passed as ``refresh``, if any; the client
+    should discard its access token.
     """
+    refresh = request.data.get("refresh")
+    if refresh:
+        try:
+            OrganizationRefreshToken(refresh).blacklist()
+        except TokenError:
+            return Response(
+                {"error": "Invalid refresh token"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
     try:
         # The following line is for Django's session-based authentication
         # and is not strictly necessary for a stateless JWT setup, but doesn't harm.
@@ -221,6 +242,15 @@ def logout_view(request):
         )
 
 
+class OrganizationTokenRefreshView(TokenRefreshView):
+    """
+    API view for rotating a refresh token.
+    The presented token is blacklisted by JTI until it expires.
+    """
+
+    serializer_class = OrganizationTokenRefreshSerializer
+
+
 class ProfileView(generics.RetrieveUpdateAPIView):
     """
     API view for user profile
@@ -259,7 +289,7 @@ def change_password_view(request):
         user.save()
 
         # Create new JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = OrganizationRefreshToken.for_user(user)
         logger.info("Password changed for user id=%s", getattr(user, "id", None))
 
         return Response(
@@ -19,3 +19,5 @@ class UsersConfig(AppConfig):
         sites.AdminSite.site_header = _("HukuMan Administration")
         sites.AdminSite.site_title = _("HukuMan Admin Portal")
         sites.AdminSite.index_title = _("Welcome to HukuMan Admin")
+
+        from apps.users import signals  # noqa: F401
@@ -0,0 +1,114 @@
+"""DRF authentication classes for the users app."""
+
+import logging
+
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.users.services.membership_service import attach_organization
+from apps.users.tokens import user_from_claims
+
+logger = logging.getLogger(__name__)
+
+
+class OrganizationJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that also resolves the organization context.
+
+    The user, the active membership and its organization are fetched in one
+    joined query (honouring ``X-Organization-ID``, or the first active
+    organization otherwise) and attached to the request the same way
+    ``OrganizationMiddleware`` does for session users. Only views that
+    actually authenticate pay for it, so the schema, admin and static routes
+    skip it entirely.
+
+    When ``ORGANIZATION_TOKEN_CLAIMS`` is enabled and the token carries a
+    current organization claim, the user and membership are built from the
+    claim instead and the request costs no database round-trips.
+    """
+
+    def authenticate(self, request):
+        self._organization_header = request.headers.get("X-Organization-ID")
+        self._membership = None
+
+        result = super().authenticate(request)
+        if result is None:
+            return None
+
+        user, validated_token = result
+        attach_organization(request, user, self._membership)
+        return user, validated_token
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        resolved = user_from_claims(validated_token, self._organization_header)
+        if resolved is not None:
+            user, self._membership = resolved
+            return user
+
+        membership = self._get_membership(user_id)
+        if membership is None:
+            # No usable organization: fall back to the plain user lookup.
+            return super().get_user(validated_token)
+
+        user = membership.user
+        self._check_user(user, validated_token)
+        self._membership = membership
+        return user
+
+    def _get_membership(self, user_id):
+        from apps.users.models.organization import OrganizationMembership
+
+        if api_settings.USER_ID_FIELD != "id":
+            return None
+
+        filters = {
+            "user_id": user_id,
+            "is_active": True,
+            "organization__is_active": True,
+        }
+        if self._organization_header:
+            try:
+                filters["organization_id"] = int(self._organization_header)
+            except (TypeError, ValueError):
+                logger.debug(
+                    "Ignoring malformed X-Organization-ID=%r",
+                    self._organization_header,
+                )
+                return None
+
+        return (
+            OrganizationMembership.objects.select_related("user", "organization")
+            .filter(**filters)
+            .first()
+        )
+
+    @staticmethod
+    def _check_user(user, validated_token):
+        """Apply the same checks as ``JWTAuthentication.get_user``."""
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+
+class OrganizationJWTScheme(SimpleJWTScheme):
+    """Document ``OrganizationJWTAuthentication`` as the standard bearer scheme."""
+
+    target_class = "apps.users.authentication.OrganizationJWTAuthentication"
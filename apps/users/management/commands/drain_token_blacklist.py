@@ -0,0 +1,61 @@
+"""Move the token_blacklist tables into the blacklist store and empty them."""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from apps.users.services.token_blacklist_service import blacklist_jti
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy unexpired blacklisted refresh tokens into the configured "
+        "blacklist store, then delete all OutstandingToken/BlacklistedToken rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows copied or deleted per query (default: 1000).",
+        )
+        parser.add_argument(
+            "--keep-tables",
+            action="store_true",
+            help="Only copy into the store; leave the tables untouched.",
+        )
+
+    def handle(self, *args, batch_size, keep_tables, **options):
+        copied = 0
+        live = (
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+            .values_list("token__jti", "token__expires_at")
+            .order_by("pk")
+        )
+        for jti, expires_at in live.iterator(chunk_size=batch_size):
+            blacklist_jti(jti, expires_at.timestamp())
+            copied += 1
+        self.stdout.write(f"Copied {copied} blacklisted token(s) to the store.")
+
+        if keep_tables:
+            return
+
+        # Blacklist rows cascade with their outstanding token.
+        deleted = 0
+        while True:
+            pks = list(
+                OutstandingToken.objects.order_by("pk").values_list("pk", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not pks:
+                break
+            OutstandingToken.objects.filter(pk__in=pks).delete()
+            deleted += len(pks)
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} outstanding token row(s).")
+        )
@@ -2,14 +2,26 @@
 
 import logging
 
-logger = logging.getLogger(__name__)
+from django.conf import settings
 
+from apps.users.services.membership_service import (
+    attach_organization,
+    get_default_membership,
+    get_membership,
+)
 
-def _get_membership_model():
-    """Lazy import to avoid circular/premature model imports during Django setup."""
-    from apps.users.models.organization import OrganizationMembership
+logger = logging.getLogger(__name__)
 
-    return OrganizationMembership
+# Routes that never need organization context.
+EXEMPT_PATH_PREFIXES = tuple(
+    getattr(
+        settings,
+        "ORGANIZATION_CONTEXT_EXEMPT_PATHS",
+        ("/admin/", "/api/schema/", "/api/docs/", "/api/redoc/"),
+    )
+) + tuple(
+    url for url in (settings.STATIC_URL, settings.MEDIA_URL) if url and url != "/"
+)
 
 
 class OrganizationMiddleware:
@@ -17,52 +29,49 @@ class OrganizationMiddleware:
     Reads ``X-Organization-ID`` from the request header (or falls back to the
     user's first active organization) and attaches:
 
-    - ``request.organization``       – the Organization instance (or None)
-    - ``request.organization_role``   – the user's role string (or None)
+    - ``request.organization``            – the Organization instance (or None)
+    - ``request.organization_role``       – the user's role string (or None)
+    - ``request.organization_membership`` – the resolved membership (or None)
+
+    Only session-authenticated users are resolved here; JWT requests are
+    resolved by ``OrganizationJWTAuthentication`` once DRF knows the user.
+    The membership is memoised on ``request.user`` so the organization
+    permission classes and ``User.is_*_of`` helpers reuse it.
     """
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        request.organization = None
-        request.organization_role = None
-
-        if hasattr(request, "user") and request.user.is_authenticated:
-            OrganizationMembership = _get_membership_model()
-            org_id = request.headers.get("X-Organization-ID")
-
-            if org_id:
-                try:
-                    membership = OrganizationMembership.objects.select_related(
-                        "organization"
-                    ).get(
-                        organization_id=org_id,
-                        user=request.user,
-                        is_active=True,
-                        organization__is_active=True,
-                    )
-                    request.organization = membership.organization
-                    request.organization_role = membership.role
-                except OrganizationMembership.DoesNotExist:
-                    logger.debug(
-                        "User id=%s has no active membership in org id=%s",
-                        request.user.pk,
-                        org_id,
-                    )
-            else:
-                # Auto-select first active organization
-                first = (
-                    OrganizationMembership.objects.filter(
-                        user=request.user,
-                        is_active=True,
-                        organization__is_active=True,
-                    )
-                    .select_related("organization")
-                    .first()
-                )
-                if first:
-                    request.organization = first.organization
-                    request.organization_role = first.role
+        attach_organization(request, None, None)
+
+        if (
+            not request.path.startswith(EXEMPT_PATH_PREFIXES)
+            and hasattr(request, "user")
+            and request.user.is_authenticated
+        ):
+            membership = self._resolve(request)
+            attach_organization(request, request.user, membership)
 
         return self.get_response(request)
+
+    @staticmethod
+    def _resolve(request):
+        org_id = request.headers.get("X-Organization-ID")
+        if not org_id:
+            # Auto-select first active organization
+            return get_default_membership(request.user)
+
+        try:
+            membership = get_membership(request.user, int(org_id))
+        except (TypeError, ValueError):
+            membership = None
+
+        if membership is None or not membership.organization.is_active:
+            logger.debug(
+                "User id=%s has no active membership in org id=%s",
+                request.user.pk,
+                org_id,
+            )
+            return None
+        return membership
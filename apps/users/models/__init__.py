@@ -5,3 +5,5 @@ from apps.users.models.organization import (
     OrganizationMembership,
     OrganizationInvitation,
 )
+from apps.users.models.outbox import EmailOutbox
+from apps.users.models.token_blacklist import RevokedToken
@@ -29,6 +29,10 @@ class User(AbstractUser):
     verification_attempts = models.PositiveSmallIntegerField(default=0)
     last_otp_sent_at = models.DateTimeField(blank=True, null=True)
 
+    # Bumped whenever the user's memberships or system role change;
+    # invalidates role claims embedded in previously issued access tokens.
+    membership_version = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -64,16 +68,16 @@ class User(AbstractUser):
         )
 
     def get_role_in_organization(self, organization):
-        """Return the user's role in *organization*, or ``None``."""
-        from apps.users.models.organization import OrganizationMembership
-
-        try:
-            membership = OrganizationMembership.objects.get(
-                organization=organization, user=self, is_active=True
-            )
-            return membership.role
-        except OrganizationMembership.DoesNotExist:
-            return None
+        """
+        Return the user's role in *organization*, or ``None``.
+
+        Resolved through the membership service, so repeated checks within a
+        request (and, when enabled, across requests) do not hit the database.
+        """
+        from apps.users.services.membership_service import get_membership
+
+        membership = get_membership(self, organization)
+        return membership.role if membership else None
 
     def is_owner_of(self, organization):
         return self.get_role_in_organization(organization) == "owner"
@@ -39,6 +39,9 @@ class Organization(models.Model):
 
     @property
     def member_count(self):
+        # Querysets annotated with ``active_member_count`` avoid a COUNT per row.
+        if hasattr(self, "active_member_count"):
+            return self.active_member_count
         return self.memberships.filter(is_active=True).count()
 
 
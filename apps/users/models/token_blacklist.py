@@ -0,0 +1,18 @@
+"""Revoked refresh tokens for the database-backed blacklist store."""
+
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    """A blacklisted refresh-token JTI, kept until the token expires."""
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "revoked_tokens"
+        verbose_name = "Revoked Token"
+        verbose_name_plural = "Revoked Tokens"
+
+    def __str__(self):
+        return self.jti
@@ -57,6 +57,22 @@ class CanViewReports(permissions.BasePermission):
 # ---------------------------------------------------------------------------
 
 
+def _role_in(request, organization):
+    """
+    Return the requesting user's role in *organization*, reusing the
+    membership resolved by ``OrganizationMiddleware`` when it matches.
+    """
+    from apps.users.models.organization import OrganizationMembership
+
+    membership = getattr(request, "organization_membership", None)
+    if (
+        isinstance(membership, OrganizationMembership)
+        and membership.organization_id == organization.pk
+    ):
+        return membership.role
+    return request.user.get_role_in_organization(organization)
+
+
 class IsOrganizationMember(permissions.BasePermission):
     """User must be an active member of the request's organization."""
 
@@ -64,7 +80,7 @@ class IsOrganizationMember(permissions.BasePermission):
         organization = getattr(request, "organization", None)
         if not organization:
             return False
-        return request.user.is_member_of(organization)
+        return _role_in(request, organization) is not None
 
 
 class IsOrganizationAdmin(permissions.BasePermission):
@@ -73,7 +89,7 @@ class IsOrganizationAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
         organization = getattr(request, "organization", None)
         if organization:
-            return request.user.is_admin_of(organization)
+            return _role_in(request, organization) in ("owner", "admin")
         # Fall through to object-level check
         return True
 
@@ -84,7 +100,7 @@ class IsOrganizationAdmin(permissions.BasePermission):
         from apps.users.models.organization import Organization
 
         if isinstance(organization, Organization):
-            return request.user.is_admin_of(organization)
+            return _role_in(request, organization) in ("owner", "admin")
         return False
 
 
@@ -94,7 +110,7 @@ class IsOrganizationOwner(permissions.BasePermission):
     def has_permission(self, request, view):
         organization = getattr(request, "organization", None)
         if organization:
-            return request.user.is_owner_of(organization)
+            return _role_in(request, organization) == "owner"
         return True
 
     def has_object_permission(self, request, view, obj):
@@ -104,5 +120,5 @@ class IsOrganizationOwner(permissions.BasePermission):
         from apps.users.models.organization import Organization
 
         if isinstance(organization, Organization):
-            return request.user.is_owner_of(organization)
+            return _role_in(request, organization) == "owner"
         return False
@@ -1,10 +1,13 @@
 """Email delivery helpers for verification and invitations."""
 
 import logging
+from datetime import timedelta
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.db import transaction
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.utils.html import strip_tags
 
 logger = logging.getLogger(__name__)
@@ -12,6 +15,65 @@ logger = logging.getLogger(__name__)
 FRONTEND_URL = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
 FROM_EMAIL = getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@minija.com")
 
+# Queue emails in the outbox table for the Celery worker instead of sending inline.
+EMAIL_OUTBOX_ENABLED = getattr(settings, "EMAIL_OUTBOX_ENABLED", False)
+EMAIL_OUTBOX_BATCH_SIZE = getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50)
+EMAIL_OUTBOX_MAX_ATTEMPTS = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+# Retry delay after the first failure; doubles with every further attempt.
+EMAIL_OUTBOX_RETRY_DELAY_SECONDS = getattr(
+    settings, "EMAIL_OUTBOX_RETRY_DELAY_SECONDS", 60
+)
+# Claimed rows become due again after this long if a worker dies mid-batch.
+EMAIL_OUTBOX_LEASE_SECONDS = 5 * 60
+
+
+def _deliver(subject, message, recipient, html_message=None):
+    """
+    Send the email now, or queue it when the outbox is enabled. Returns
+    ``"sent"`` or ``"queued"`` accordingly, for logging.
+    """
+    if EMAIL_OUTBOX_ENABLED:
+        queue_email(recipient, subject, message, html_message)
+        return "queued"
+
+    send_mail(
+        subject=subject,
+        message=message,
+        from_email=FROM_EMAIL,
+        recipient_list=[recipient],
+        html_message=html_message,
+        fail_silently=False,
+    )
+    return "sent"
+
+
+def _schedule_delivery():
+    from apps.users.tasks import deliver_outbox
+
+    try:
+        deliver_outbox.delay()
+    except Exception:
+        # The periodic sweep picks the row up once the broker is back.
+        logger.exception("Could not schedule outbox delivery")
+
+
+def queue_email(to_email, subject, message, html_message=None):
+    """
+    Store an email in the outbox and wake the delivery worker once the
+    surrounding transaction commits. Returns the ``EmailOutbox`` row.
+    """
+    from apps.users.models.outbox import EmailOutbox
+
+    email = EmailOutbox.objects.create(
+        to_email=to_email,
+        subject=subject,
+        body=message,
+        html_body=html_message,
+    )
+    transaction.on_commit(_schedule_delivery)
+    logger.debug("Queued email id=%s to %s", email.pk, to_email)
+    return email
+
 
 def send_verification_email(user, otp_code, token, request=None):
     """
@@ -40,21 +102,14 @@ def send_verification_email(user, otp_code, token, request=None):
         )
         html_message = None
 
-    send_mail(
-        subject="Verify Your Minija Account",
-        message=plain_message,
-        from_email=FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=html_message,
-        fail_silently=False,
+    outcome = _deliver(
+        "Verify Your Minija Account", plain_message, user.email, html_message
     )
-    logger.info("Verification email sent to %s", user.email)
+    logger.info("Verification email %s for %s", outcome, user.email)
 
 
-def send_invitation_email(invitation):
-    """
-    Send an organization invitation email.
-    """
+def _build_invitation_email(invitation):
+    """Return ``(subject, plain_message, html_message)`` for *invitation*."""
     accept_link = f"{FRONTEND_URL}/invitations/{invitation.token}/accept"
 
     context = {
@@ -78,16 +133,143 @@ def send_invitation_email(invitation):
         )
         html_message = None
 
-    send_mail(
-        subject=f"Invitation to join {invitation.organization.name} on Minija",
-        message=plain_message,
-        from_email=FROM_EMAIL,
-        recipient_list=[invitation.email],
-        html_message=html_message,
-        fail_silently=False,
-    )
+    subject = f"Invitation to join {invitation.organization.name} on Minija"
+    return subject, plain_message, html_message
+
+
+def send_invitation_email(invitation):
+    """
+    Send an organization invitation email.
+    """
+    subject, plain_message, html_message = _build_invitation_email(invitation)
+    outcome = _deliver(subject, plain_message, invitation.email, html_message)
     logger.info(
-        "Invitation email sent to %s for org=%s",
+        "Invitation email %s for %s, org=%s",
+        outcome,
         invitation.email,
         invitation.organization.name,
     )
+
+
+def send_invitation_emails(invitations):
+    """
+    Send invitation emails for many *invitations* at once: one outbox insert
+    when the outbox is enabled, otherwise one SMTP connection for the batch.
+    """
+    from apps.users.models.outbox import EmailOutbox
+
+    if not invitations:
+        return
+
+    built = [
+        (invitation.email, *_build_invitation_email(invitation))
+        for invitation in invitations
+    ]
+
+    if EMAIL_OUTBOX_ENABLED:
+        EmailOutbox.objects.bulk_create(
+            [
+                EmailOutbox(
+                    to_email=to_email,
+                    subject=subject,
+                    body=message,
+                    html_body=html_message,
+                )
+                for to_email, subject, message, html_message in built
+            ]
+        )
+        transaction.on_commit(_schedule_delivery)
+        outcome = "queued"
+    else:
+        messages = []
+        for to_email, subject, message, html_message in built:
+            email = EmailMultiAlternatives(subject, message, FROM_EMAIL, [to_email])
+            if html_message:
+                email.attach_alternative(html_message, "text/html")
+            messages.append(email)
+        get_connection(fail_silently=False).send_messages(messages)
+        outcome = "sent"
+
+    logger.info("%s invitation email(s) %s", len(built), outcome)
+
+
+def _record_failure(email, exc, now):
+    email.attempts += 1
+    email.last_error = str(exc)[:1000]
+    if email.attempts >= EMAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = "failed"
+        logger.error(
+            "Giving up on outbox email id=%s after %s attempts: %s",
+            email.pk,
+            email.attempts,
+            exc,
+        )
+    else:
+        delay = EMAIL_OUTBOX_RETRY_DELAY_SECONDS * 2 ** (email.attempts - 1)
+        email.next_attempt_at = now + timedelta(seconds=delay)
+
+
+def send_outbox_batch(batch_size=None):
+    """
+    Claim up to *batch_size* due outbox emails and send them over a single
+    SMTP connection. Failed emails are retried with exponential backoff until
+    ``EMAIL_OUTBOX_MAX_ATTEMPTS`` is reached.
+    Returns (claimed: int, sent: int).
+    """
+    from apps.users.models.outbox import EmailOutbox
+
+    batch_size = batch_size or EMAIL_OUTBOX_BATCH_SIZE
+    now = timezone.now()
+
+    with transaction.atomic():
+        emails = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "pk")[:batch_size]
+        )
+        if not emails:
+            return 0, 0
+        EmailOutbox.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=now + timedelta(seconds=EMAIL_OUTBOX_LEASE_SECONDS)
+        )
+
+    sent = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning("Could not open mail connection: %s", exc)
+        for email in emails:
+            _record_failure(email, exc, now)
+    else:
+        try:
+            for email in emails:
+                message = EmailMultiAlternatives(
+                    subject=email.subject,
+                    body=email.body,
+                    from_email=FROM_EMAIL,
+                    to=[email.to_email],
+                    connection=connection,
+                )
+                if email.html_body:
+                    message.attach_alternative(email.html_body, "text/html")
+                try:
+                    message.send()
+                except Exception as exc:
+                    logger.warning("Outbox email id=%s failed: %s", email.pk, exc)
+                    _record_failure(email, exc, now)
+                else:
+                    email.status = "sent"
+                    email.sent_at = timezone.now()
+                    sent += 1
+                    logger.info(
+                        "Outbox email id=%s sent to %s", email.pk, email.to_email
+                    )
+        finally:
+            connection.close()
+
+    EmailOutbox.objects.bulk_update(
+        emails, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+    )
+    logger.info("Outbox batch: %s claimed, %s sent", len(emails), sent)
+    return len(emails), sent
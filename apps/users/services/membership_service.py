@@ -0,0 +1,227 @@
+"""Request-scoped and cached resolution of organization memberships."""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+# Seconds a resolved membership is kept in the shared cache; 0 disables it.
+MEMBERSHIP_CACHE_TIMEOUT = getattr(settings, "ORGANIZATION_MEMBERSHIP_CACHE_TIMEOUT", 0)
+
+# Seconds a user's membership version is cached for token-claim checks.
+MEMBERSHIP_VERSION_CACHE_TIMEOUT = 60 * 60
+
+# Cached marker for "no active membership" so misses are cached too.
+_NO_MEMBERSHIP = "none"
+_DEFAULT = "default"
+
+
+def _cache_key(user_id, organization_id):
+    return f"org_membership:{user_id}:{organization_id}"
+
+
+def _version_key(user_id):
+    return f"org_membership_version:{user_id}"
+
+
+def _local_memo(user):
+    """Return the per-instance memo dict, creating it on first use."""
+    memo = getattr(user, "_membership_memo", None)
+    if memo is None:
+        memo = {}
+        user._membership_memo = memo
+    return memo
+
+
+def _cache_get(key):
+    if not MEMBERSHIP_CACHE_TIMEOUT:
+        return None
+    return cache.get(key)
+
+
+def _cache_set(key, membership):
+    if not MEMBERSHIP_CACHE_TIMEOUT:
+        return
+    cache.set(
+        key,
+        membership if membership is not None else _NO_MEMBERSHIP,
+        MEMBERSHIP_CACHE_TIMEOUT,
+    )
+
+
+def remember_membership(user, membership, organization_id=None):
+    """
+    Record *membership* as the user's resolved membership for its organization
+    (or record a miss for *organization_id* when *membership* is ``None``).
+    """
+    if membership is not None:
+        organization_id = membership.organization_id
+    if organization_id is None:
+        return
+    _local_memo(user)[int(organization_id)] = membership
+
+
+def attach_organization(request, user, membership):
+    """
+    Expose *membership* on *request* as the organization context
+    (``organization``, ``organization_role`` and ``organization_membership``).
+
+    Attributes are set on the underlying ``HttpRequest`` so both Django and
+    DRF request objects see them.
+    """
+    target = getattr(request, "_request", request)
+    target.organization = membership.organization if membership else None
+    target.organization_role = membership.role if membership else None
+    target.organization_membership = membership
+    if membership is not None:
+        remember_membership(user, membership)
+
+
+def get_membership(user, organization):
+    """
+    Return the user's active ``OrganizationMembership`` in *organization*
+    (an instance or a primary key) with the organization pre-loaded, or ``None``.
+
+    Lookups are memoised on the user instance for the rest of the request and,
+    when ``ORGANIZATION_MEMBERSHIP_CACHE_TIMEOUT`` is set, in the shared cache.
+    """
+    from apps.users.models.organization import OrganizationMembership
+
+    if not getattr(user, "is_authenticated", False) or organization is None:
+        return None
+
+    organization_id = int(getattr(organization, "pk", organization))
+    memo = _local_memo(user)
+    if organization_id in memo:
+        return memo[organization_id]
+
+    key = _cache_key(user.pk, organization_id)
+    cached = _cache_get(key)
+    if cached is not None:
+        membership = None if cached == _NO_MEMBERSHIP else cached
+    else:
+        membership = (
+            OrganizationMembership.objects.select_related("organization")
+            .filter(organization_id=organization_id, user_id=user.pk, is_active=True)
+            .first()
+        )
+        _cache_set(key, membership)
+
+    memo[organization_id] = membership
+    return membership
+
+
+def get_default_membership(user):
+    """
+    Return the user's first active membership in an active organization,
+    used when the client does not send ``X-Organization-ID``.
+    """
+    from apps.users.models.organization import OrganizationMembership
+
+    if not getattr(user, "is_authenticated", False):
+        return None
+
+    memo = _local_memo(user)
+    if _DEFAULT in memo:
+        return memo[_DEFAULT]
+
+    key = _cache_key(user.pk, _DEFAULT)
+    cached = _cache_get(key)
+    if cached is not None:
+        membership = None if cached == _NO_MEMBERSHIP else cached
+    else:
+        membership = (
+            OrganizationMembership.objects.filter(
+                user_id=user.pk,
+                is_active=True,
+                organization__is_active=True,
+            )
+            .select_related("organization")
+            .first()
+        )
+        _cache_set(key, membership)
+
+    memo[_DEFAULT] = membership
+    if membership is not None:
+        memo[membership.organization_id] = membership
+    return membership
+
+
+def get_membership_version(user_id):
+    """Return the current membership version of the user with pk *user_id*."""
+    from django.contrib.auth import get_user_model
+
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            get_user_model()
+            .objects.filter(pk=user_id)
+            .values_list("membership_version", flat=True)
+            .first()
+        )
+        if version is None:
+            return None
+        cache.set(key, version, MEMBERSHIP_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def bump_membership_version(user_ids):
+    """Increment the membership version of every user in *user_ids*."""
+    from django.contrib.auth import get_user_model
+
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    get_user_model().objects.filter(pk__in=user_ids).update(
+        membership_version=F("membership_version") + 1
+    )
+    cache.delete_many([_version_key(user_id) for user_id in user_ids])
+
+
+def invalidate_membership(user, organization):
+    """
+    Drop cached membership state for *user* (instance or pk) in *organization*
+    (instance or pk) and bump the user's membership version. Call after any
+    change to that membership row.
+    """
+    user_id = getattr(user, "pk", user)
+    organization_id = getattr(organization, "pk", organization)
+
+    if MEMBERSHIP_CACHE_TIMEOUT:
+        cache.delete_many(
+            [_cache_key(user_id, organization_id), _cache_key(user_id, _DEFAULT)]
+        )
+    bump_membership_version([user_id])
+
+    memo = getattr(user, "_membership_memo", None)
+    if memo is not None:
+        memo.clear()
+
+    logger.debug(
+        "Membership cache invalidated for user id=%s org id=%s",
+        user_id,
+        organization_id,
+    )
+
+
+def invalidate_organization(organization):
+    """Drop cached membership state for every member of *organization*."""
+    from apps.users.models.organization import OrganizationMembership
+
+    user_ids = list(
+        OrganizationMembership.objects.filter(organization=organization).values_list(
+            "user_id", flat=True
+        )
+    )
+    bump_membership_version(user_ids)
+
+    if MEMBERSHIP_CACHE_TIMEOUT and user_ids:
+        keys = []
+        for user_id in user_ids:
+            keys.append(_cache_key(user_id, organization.pk))
+            keys.append(_cache_key(user_id, _DEFAULT))
+        cache.delete_many(keys)
@@ -1,18 +1,26 @@
 """Business logic for organization lifecycle management."""
 
 import logging
+import re
 from datetime import timedelta
 
 from django.conf import settings
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Length
 from django.utils import timezone
 from django.utils.text import slugify
 
+from apps.users.services.membership_service import invalidate_membership
+
 logger = logging.getLogger(__name__)
 
 INVITATION_EXPIRY_DAYS = getattr(settings, "ORGANIZATION_INVITATION_EXPIRY_DAYS", 7)
 MEMBER_LIMIT = getattr(settings, "ORGANIZATION_MEMBER_LIMIT", 50)
 
+# Attempts at creating an organization when a concurrent insert takes the slug.
+SLUG_RETRIES = 3
+
 
 def create_organization(user, name, description=""):
     """
@@ -21,20 +29,28 @@ def create_organization(user, name, description=""):
     """
     from apps.users.models.organization import Organization, OrganizationMembership
 
-    slug = _unique_slug(name)
-
-    with transaction.atomic():
-        org = Organization.objects.create(
-            name=name,
-            slug=slug,
-            description=description,
-            owner=user,
-        )
-        OrganizationMembership.objects.create(
-            organization=org,
-            user=user,
-            role="owner",
-        )
+    for attempt in range(1, SLUG_RETRIES + 1):
+        slug = _unique_slug(name)
+        try:
+            with transaction.atomic():
+                org = Organization.objects.create(
+                    name=name,
+                    slug=slug,
+                    description=description,
+                    owner=user,
+                )
+                OrganizationMembership.objects.create(
+                    organization=org,
+                    user=user,
+                    role="owner",
+                )
+            break
+        except IntegrityError:
+            # Another signup took the same slug between lookup and insert.
+            if attempt == SLUG_RETRIES:
+                raise
+            logger.info("Slug '%s' taken concurrently, retrying", slug)
+    invalidate_membership(user, org)
     logger.info("Organization '%s' created by user id=%s", name, user.pk)
     return org
 
@@ -98,6 +114,95 @@ def invite_member(organization, email, role, invited_by):
     return invitation, None
 
 
+def invite_members(organization, entries, invited_by):
+    """
+    Invite several people at once. *entries* is a list of ``(email, role)``.
+
+    Limits and existing memberships are checked with set-based queries,
+    previous pending invitations are revoked in one update, the new ones are
+    inserted with ``bulk_create`` and all emails go out in one batch.
+    Returns (invitations, skipped, error_message) where *skipped* lists
+    ``{"email", "error"}`` dicts for entries that were not invited.
+    """
+    from apps.users.models.organization import (
+        OrganizationInvitation,
+        OrganizationMembership,
+    )
+    from apps.users.services.email_service import send_invitation_emails
+
+    skipped = []
+    wanted = {}
+    for email, role in entries:
+        key = email.strip().lower()
+        if key in wanted:
+            skipped.append({"email": email, "error": "Duplicate email in request."})
+            continue
+        wanted[key] = (email.strip(), role)
+
+    members = set(
+        OrganizationMembership.objects.filter(
+            organization=organization,
+            is_active=True,
+        ).values_list("user__email", flat=True)
+    )
+    available = MEMBER_LIMIT - len(members)
+    if available <= 0:
+        error = f"Organization has reached the member limit ({MEMBER_LIMIT})."
+        return [], skipped, error
+
+    members = {email.lower() for email in members}
+    pending = []
+    for key, (email, role) in wanted.items():
+        if key in members:
+            skipped.append(
+                {
+                    "email": email,
+                    "error": "This user is already a member of the organization.",
+                }
+            )
+        else:
+            pending.append((email, role))
+
+    if len(pending) > available:
+        return (
+            [],
+            skipped,
+            f"Only {available} more member(s) can be invited "
+            f"(limit {MEMBER_LIMIT}).",
+        )
+    if not pending:
+        return [], skipped, None
+
+    expires_at = timezone.now() + timedelta(days=INVITATION_EXPIRY_DAYS)
+    with transaction.atomic():
+        OrganizationInvitation.objects.filter(
+            organization=organization,
+            email__in=[email for email, _ in pending],
+            status="pending",
+        ).update(status="revoked")
+        invitations = OrganizationInvitation.objects.bulk_create(
+            [
+                OrganizationInvitation(
+                    organization=organization,
+                    email=email,
+                    role=role,
+                    invited_by=invited_by,
+                    expires_at=expires_at,
+                )
+                for email, role in pending
+            ]
+        )
+
+    send_invitation_emails(invitations)
+    logger.info(
+        "%s invitation(s) sent for org '%s' (%s skipped)",
+        len(invitations),
+        organization.name,
+        len(skipped),
+    )
+    return invitations, skipped, None
+
+
 def accept_invitation(token, user):
     """
     Accept an invitation by its token.
@@ -138,6 +243,7 @@ def accept_invitation(token, user):
         invitation.accepted_at = timezone.now()
         invitation.save(update_fields=["status", "accepted_at"])
 
+    invalidate_membership(user, invitation.organization)
     logger.info(
         "User id=%s accepted invitation to org '%s'",
         user.pk,
@@ -165,6 +271,7 @@ def remove_member(organization, user_to_remove, removed_by):
 
     membership.is_active = False
     membership.save(update_fields=["is_active", "updated_at"])
+    invalidate_membership(user_to_remove, organization)
 
     logger.info(
         "User id=%s removed from org '%s' by user id=%s",
@@ -208,6 +315,8 @@ def transfer_ownership(organization, new_owner, current_owner):
         organization.owner = new_owner
         organization.save(update_fields=["owner", "updated_at"])
 
+    invalidate_membership(current_owner, organization)
+    invalidate_membership(new_owner, organization)
     logger.info(
         "Ownership of org '%s' transferred from user id=%s to user id=%s",
         organization.name,
@@ -217,14 +326,51 @@ def transfer_ownership(organization, new_owner, current_owner):
     return True, None
 
 
+def update_member_role(membership, role):
+    """
+    Change the role of an existing (non-owner) membership.
+    Returns (membership, error_message).
+    """
+    if membership.role == "owner":
+        return None, "Cannot change the owner's role. Transfer ownership instead."
+
+    membership.role = role
+    membership.save(update_fields=["role", "updated_at"])
+    invalidate_membership(membership.user_id, membership.organization_id)
+
+    logger.info(
+        "User id=%s role in org id=%s changed to %s",
+        membership.user_id,
+        membership.organization_id,
+        role,
+    )
+    return membership, None
+
+
 def _unique_slug(name):
-    """Generate a unique slug from a name."""
+    """
+    Generate a unique slug from a name.
+
+    The highest existing ``<base>-<n>`` suffix is found with a single query,
+    so the cost does not grow with the number of organizations sharing a name.
+    """
     from apps.users.models.organization import Organization
 
-    base_slug = slugify(name)
-    slug = base_slug
-    counter = 1
-    while Organization.objects.filter(slug=slug).exists():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-    return slug
+    base_slug = slugify(name) or "organization"
+    latest = (
+        Organization.objects.filter(
+            Q(slug=base_slug)
+            | Q(
+                slug__startswith=f"{base_slug}-",
+                slug__regex=rf"^{re.escape(base_slug)}-[0-9]+$",
+            )
+        )
+        .order_by(Length("slug").desc(), "-slug")
+        .values_list("slug", flat=True)
+        .first()
+    )
+    if latest is None:
+        return base_slug
+    if latest == base_slug:
+        return f"{base_slug}-1"
+    return f"{base_slug}-{int(latest.rsplit('-', 1)[1]) + 1}"
@@ -6,6 +6,8 @@ import logging
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,32 @@ OTP_EXPIRY_MINUTES = getattr(settings, "OTP_EXPIRY_MINUTES", 10)
 OTP_MAX_ATTEMPTS = getattr(settings, "OTP_MAX_ATTEMPTS", 5)
 OTP_RESEND_COOLDOWN_SECONDS = getattr(settings, "OTP_RESEND_COOLDOWN_SECONDS", 60)
 
+# Keep codes, link tokens, attempt counters and cooldowns in expiring cache
+# keys instead of the users table; only a successful verification writes the row.
+OTP_CACHE_ENABLED = getattr(settings, "OTP_CACHE_ENABLED", False)
+# Lifetime of a cached link token (DB-stored tokens never expire).
+OTP_LINK_EXPIRY_HOURS = getattr(settings, "OTP_LINK_EXPIRY_HOURS", 72)
+
+
+def _code_key(user_id):
+    return f"otp:code:{user_id}"
+
+
+def _attempts_key(user_id):
+    return f"otp:attempts:{user_id}"
+
+
+def _cooldown_key(user_id):
+    return f"otp:cooldown:{user_id}"
+
+
+def _token_key(token):
+    return f"otp:token:{token}"
+
+
+def _link_key(user_id):
+    return f"otp:link:{user_id}"
+
 
 def generate_otp(length=None):
     """Generate a cryptographically secure numeric OTP code."""
@@ -33,6 +61,11 @@ def create_otp(user):
     code = generate_otp()
     token = uuid.uuid4()
 
+    if OTP_CACHE_ENABLED:
+        _store_otp_in_cache(user, code, token)
+        logger.info("OTP created for user id=%s", user.pk)
+        return code, str(token)
+
     user.email_verification_code = code
     user.email_verification_token = token
     user.verification_code_expires_at = timezone.now() + timedelta(
@@ -53,6 +86,21 @@ def create_otp(user):
     return code, str(token)
 
 
+def _store_otp_in_cache(user, code, token):
+    code_timeout = OTP_EXPIRY_MINUTES * 60
+    link_timeout = OTP_LINK_EXPIRY_HOURS * 60 * 60
+
+    previous_token = cache.get(_link_key(user.pk))
+    if previous_token:
+        cache.delete(_token_key(previous_token))
+
+    cache.set_many({_code_key(user.pk): code, _attempts_key(user.pk): 0}, code_timeout)
+    cache.set_many(
+        {_link_key(user.pk): str(token), _token_key(token): user.pk}, link_timeout
+    )
+    cache.set(_cooldown_key(user.pk), 1, OTP_RESEND_COOLDOWN_SECONDS)
+
+
 def create_and_send_otp(user, request=None):
     """Generate OTP, store it, and send verification email."""
     from apps.users.services.email_service import send_verification_email
@@ -63,7 +111,14 @@ def create_and_send_otp(user, request=None):
 
 
 def can_resend_otp(user):
-    """Return True if enough time has passed since the last OTP was sent."""
+    """
+    Return True if enough time has passed since the last OTP was sent.
+    With ``OTP_CACHE_ENABLED`` a True result also claims the cooldown window,
+    so concurrent resend requests cannot both pass.
+    """
+    if OTP_CACHE_ENABLED:
+        return cache.add(_cooldown_key(user.pk), 1, OTP_RESEND_COOLDOWN_SECONDS)
+
     if not user.last_otp_sent_at:
         return True
     elapsed = (timezone.now() - user.last_otp_sent_at).total_seconds()
@@ -78,6 +133,9 @@ def verify_otp(user, code):
     if user.is_email_verified:
         return True, None
 
+    if OTP_CACHE_ENABLED:
+        return _verify_cached_otp(user, code)
+
     if user.verification_attempts >= OTP_MAX_ATTEMPTS:
         logger.warning("OTP max attempts exceeded for user id=%s", user.pk)
         return False, "Too many attempts. Please request a new code."
@@ -104,6 +162,47 @@ def verify_otp(user, code):
     return True, None
 
 
+def _verify_cached_otp(user, code):
+    stored_code = cache.get(_code_key(user.pk))
+    if stored_code is None:
+        return False, "Verification code has expired. Please request a new one."
+
+    try:
+        attempts = cache.incr(_attempts_key(user.pk))
+    except ValueError:
+        # Counter expired together with the code between the two reads.
+        return False, "Verification code has expired. Please request a new one."
+
+    if attempts > OTP_MAX_ATTEMPTS:
+        logger.warning("OTP max attempts exceeded for user id=%s", user.pk)
+        return False, "Too many attempts. Please request a new code."
+
+    if stored_code != code:
+        remaining = OTP_MAX_ATTEMPTS - attempts
+        return False, f"Invalid code. {remaining} attempt(s) remaining."
+
+    _mark_verified(user)
+    logger.info("OTP verified for user id=%s", user.pk)
+    return True, None
+
+
+def get_user_for_token(token):
+    """Return the user a verification link *token* was issued to, or ``None``."""
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    if OTP_CACHE_ENABLED:
+        user_id = cache.get(_token_key(token))
+        if user_id is None:
+            return None
+        return User.objects.filter(pk=user_id).first()
+
+    try:
+        return User.objects.get(email_verification_token=token)
+    except (User.DoesNotExist, ValidationError):
+        return None
+
+
 def verify_token(user, token):
     """
     Verify a UUID link token (no expiry check for link tokens – they're single-use).
@@ -112,6 +211,13 @@ def verify_token(user, token):
     if user.is_email_verified:
         return True, None
 
+    if OTP_CACHE_ENABLED:
+        if cache.get(_token_key(token)) != user.pk:
+            return False, "Invalid verification token."
+        _mark_verified(user)
+        logger.info("Token verified for user id=%s", user.pk)
+        return True, None
+
     if not user.email_verification_token:
         return False, "No verification token found. Please request a new one."
 
@@ -141,3 +247,9 @@ def _mark_verified(user):
             "verification_attempts",
         ]
     )
+    if OTP_CACHE_ENABLED:
+        keys = [_code_key(user.pk), _attempts_key(user.pk), _link_key(user.pk)]
+        link_token = cache.get(_link_key(user.pk))
+        if link_token:
+            keys.append(_token_key(link_token))
+        cache.delete_many(keys)
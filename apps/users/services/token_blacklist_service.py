@@ -0,0 +1,191 @@
+"""JTI-keyed refresh-token blacklist with entries that expire with the token."""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Dotted path of the store class used for the refresh-token blacklist.
+TOKEN_BLACKLIST_STORE = getattr(
+    settings,
+    "TOKEN_BLACKLIST_STORE",
+    "apps.users.services.token_blacklist_service.DatabaseBlacklistStore",
+)
+
+# Cache alias backing ``CacheBlacklistStore`` (Redis when CACHE_URL is set).
+TOKEN_BLACKLIST_CACHE_ALIAS = getattr(
+    settings, "TOKEN_BLACKLIST_CACHE_ALIAS", "default"
+)
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def _ttl(expires_at):
+    """Seconds left until the epoch timestamp *expires_at*."""
+    return int(expires_at - time.time()) + 1
+
+
+class BaseBlacklistStore:
+    """
+    Interface for blacklist stores. Entries are keyed by JTI and only need to
+    live until the token's own expiry, after which the signature check
+    rejects the token anyway.
+    """
+
+    def add(self, jti, expires_at):
+        """
+        Blacklist *jti* until the epoch timestamp *expires_at*. Returns
+        ``False`` if it was already blacklisted or has already expired.
+        """
+        raise NotImplementedError
+
+    def contains(self, jti):
+        """Return ``True`` if *jti* is blacklisted."""
+        raise NotImplementedError
+
+    def purge(self):
+        """Drop expired entries; returns how many. Stores with TTLs need not."""
+        return 0
+
+
+class DatabaseBlacklistStore(BaseBlacklistStore):
+    """
+    Blacklist kept in the ``revoked_tokens`` table, one row per JTI. The
+    unique JTI makes concurrent adds of the same token resolve to one winner.
+    """
+
+    def add(self, jti, expires_at):
+        from apps.users.models.token_blacklist import RevokedToken
+
+        if expires_at <= time.time():
+            return False
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(
+                    jti=jti,
+                    expires_at=datetime.fromtimestamp(expires_at, tz=dt_timezone.utc),
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def contains(self, jti):
+        from apps.users.models.token_blacklist import RevokedToken
+
+        return RevokedToken.objects.filter(
+            jti=jti, expires_at__gt=timezone.now()
+        ).exists()
+
+    def purge(self):
+        from apps.users.models.token_blacklist import RevokedToken
+
+        return RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()[0]
+
+
+class CacheBlacklistStore(BaseBlacklistStore):
+    """Blacklist kept in a Django cache, one key per JTI with a TTL."""
+
+    key_prefix = "token_blacklist"
+
+    def __init__(self, alias=None):
+        alias = alias or TOKEN_BLACKLIST_CACHE_ALIAS
+        self.cache = caches[alias]
+        if isinstance(self.cache, LocMemCache):
+            logger.warning(
+                "Token blacklist cache %r is process-local: revoked refresh "
+                "tokens stay valid in other workers and after a restart. "
+                "Configure CACHE_URL or use DatabaseBlacklistStore.",
+                alias,
+            )
+
+    def _key(self, jti):
+        return f"{self.key_prefix}:{jti}"
+
+    def add(self, jti, expires_at):
+        ttl = _ttl(expires_at)
+        if ttl <= 0:
+            return False
+        return self.cache.add(self._key(jti), 1, ttl)
+
+    def contains(self, jti):
+        return self.cache.get(self._key(jti)) is not None
+
+
+class InMemoryBlacklistStore(BaseBlacklistStore):
+    """Process-local blacklist for tests and single-process development."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._purge()
+            if expires_at <= time.time() or jti in self._entries:
+                return False
+            self._entries[jti] = expires_at
+            return True
+
+    def contains(self, jti):
+        with self._lock:
+            expires_at = self._entries.get(jti)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._entries[jti]
+                return False
+            return True
+
+    def __len__(self):
+        with self._lock:
+            self._purge()
+            return len(self._entries)
+
+    def _purge(self):
+        now = time.time()
+        for jti in [jti for jti, exp in self._entries.items() if exp <= now]:
+            del self._entries[jti]
+
+
+def get_store():
+    """Return the configured blacklist store, instantiated on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = import_string(TOKEN_BLACKLIST_STORE)()
+    return _store
+
+
+def blacklist_jti(jti, expires_at):
+    """
+    Blacklist *jti* until *expires_at* (epoch seconds). Returns ``False`` if
+    it was already blacklisted, e.g. by a concurrent refresh of the token.
+    """
+    added = get_store().add(jti, expires_at)
+    if added:
+        logger.debug("Blacklisted token jti=%s", jti)
+    return added
+
+
+def is_blacklisted(jti):
+    """Return ``True`` if the token with *jti* has been blacklisted."""
+    return get_store().contains(jti)
+
+
+def purge_expired():
+    """Drop expired entries from the configured store."""
+    purged = get_store().purge()
+    if purged:
+        logger.info("Purged %s expired blacklist entr(ies)", purged)
+    return purged
@@ -0,0 +1,37 @@
+"""Signal handlers for the users app."""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from apps.users.services.membership_service import bump_membership_version
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=User)
+def user_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Note whether the save changes the user's system role."""
+    instance._role_changed = False
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and "role" not in update_fields:
+        return
+    stored = (
+        sender._default_manager.filter(pk=instance.pk)
+        .values_list("role", flat=True)
+        .first()
+    )
+    instance._role_changed = stored is not None and stored != instance.role
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, raw=False, **kwargs):
+    """
+    Bump the membership version when the system role changed, so tokens
+    whose organization claim still carries the old role stop being trusted.
+    """
+    if not instance.__dict__.pop("_role_changed", False):
+        return
+    bump_membership_version([instance.pk])
+    instance.refresh_from_db(fields=["membership_version"])
@@ -0,0 +1,27 @@
+"""Celery tasks for the users app."""
+
+from celery import shared_task
+
+from apps.users.services.email_service import (
+    EMAIL_OUTBOX_BATCH_SIZE,
+    send_outbox_batch,
+)
+from apps.users.services.token_blacklist_service import purge_expired
+
+
+@shared_task(ignore_result=True)
+def deliver_outbox():
+    """Send due outbox emails batch by batch until none are left."""
+    total_sent = 0
+    while True:
+        claimed, sent = send_outbox_batch(EMAIL_OUTBOX_BATCH_SIZE)
+        total_sent += sent
+        if claimed < EMAIL_OUTBOX_BATCH_SIZE:
+            break
+    return total_sent
+
+
+@shared_task(ignore_result=True)
+def purge_token_blacklist():
+    """Delete blacklist entries whose tokens have expired."""
+    return purge_expired()
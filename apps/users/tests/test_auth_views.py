@@ -4,12 +4,14 @@ import uuid
 from datetime import timedelta
 from unittest.mock import patch
 
+from django.contrib.sessions.models import Session
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.users.api import views
 from apps.users.models.models import User
 from apps.users.tests.factories import create_user
 
@@ -238,6 +240,28 @@ class LoginViewTests(TestCase):
         self.assertIn("refresh", resp.data)
         self.assertIn("user", resp.data)
 
+    def test_login_is_token_only(self):
+        resp = self.client.post(
+            self.url,
+            {"email": "login@test.com", "password": "SecurePass123!"},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotIn("sessionid", resp.cookies)
+        self.assertFalse(Session.objects.exists())
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+
+    @patch.object(views, "LOGIN_CREATES_SESSION", True)
+    def test_login_can_create_session(self):
+        resp = self.client.post(
+            self.url,
+            {"email": "login@test.com", "password": "SecurePass123!"},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn("sessionid", resp.cookies)
+
     def test_login_wrong_password(self):
         resp = self.client.post(
             self.url, {"email": "login@test.com", "password": "Wrong!"}, format="json"
@@ -0,0 +1,81 @@
+"""Tests for OrganizationJWTAuthentication."""
+
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.users.authentication import OrganizationJWTAuthentication
+from apps.users.permissions import IsOrganizationAdmin, IsOrganizationMember
+from apps.users.tests.factories import create_user, create_organization, add_member
+
+
+class OrganizationJWTAuthenticationTests(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.owner = create_user(email="owner@test.com", username="owner")
+        self.org = create_organization(self.owner, "JWT Org")
+        self.worker = create_user(email="worker@test.com", username="worker")
+        add_member(self.org, self.worker, role="worker")
+
+    def _request(self, user, org_id=None):
+        token = RefreshToken.for_user(user).access_token
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+        if org_id is not None:
+            headers["HTTP_X_ORGANIZATION_ID"] = str(org_id)
+        return Request(
+            self.factory.get("/api/birds/", **headers),
+            authenticators=[OrganizationJWTAuthentication()],
+        )
+
+    def test_resolves_user_and_org_in_one_query(self):
+        request = self._request(self.worker, self.org.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(request.user, self.worker)
+            self.assertEqual(request.organization, self.org)
+            self.assertEqual(request.organization_role, "worker")
+            self.assertTrue(IsOrganizationMember().has_permission(request, None))
+            self.assertFalse(IsOrganizationAdmin().has_permission(request, None))
+            self.assertFalse(request.user.is_admin_of(self.org))
+
+    def test_auto_selects_first_org(self):
+        request = self._request(self.owner)
+        self.assertEqual(request.user, self.owner)
+        self.assertEqual(request.organization, self.org)
+        self.assertEqual(request.organization_role, "owner")
+
+    def test_non_member_org_falls_back_to_user(self):
+        other_owner = create_user(email="other@test.com", username="other")
+        other_org = create_organization(other_owner, "Other Org")
+        request = self._request(self.worker, other_org.pk)
+        self.assertEqual(request.user, self.worker)
+        self.assertIsNone(request.organization)
+        self.assertIsNone(request.organization_role)
+
+    def test_inactive_org_not_selected(self):
+        self.org.is_active = False
+        self.org.save()
+        request = self._request(self.worker, self.org.pk)
+        self.assertEqual(request.user, self.worker)
+        self.assertIsNone(request.organization)
+
+    def test_malformed_org_header(self):
+        request = self._request(self.worker, "abc")
+        self.assertEqual(request.user, self.worker)
+        self.assertIsNone(request.organization)
+
+    def test_inactive_user_rejected(self):
+        request = self._request(self.worker, self.org.pk)
+        self.worker.is_active = False
+        self.worker.save()
+        with self.assertRaises(AuthenticationFailed):
+            OrganizationJWTAuthentication().authenticate(request)
+
+    def test_no_header_returns_none(self):
+        request = Request(
+            self.factory.get("/api/birds/"),
+            authenticators=[OrganizationJWTAuthentication()],
+        )
+        self.assertFalse(request.user.is_authenticated)
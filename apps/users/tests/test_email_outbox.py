@@ -0,0 +1,96 @@
+"""Tests for outbox-based email delivery."""
+
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.users import tasks
+from apps.users.models.outbox import EmailOutbox
+from apps.users.services import email_service
+from apps.users.services.email_service import (
+    queue_email,
+    send_outbox_batch,
+    send_verification_email,
+)
+from apps.users.tests.factories import create_user
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class EmailOutboxTests(TestCase):
+
+    def setUp(self):
+        self.user = create_user(email="outbox@test.com")
+
+    @patch.object(email_service, "EMAIL_OUTBOX_ENABLED", True)
+    @patch("apps.users.tasks.deliver_outbox.delay")
+    @patch("apps.users.services.email_service.send_mail")
+    def test_enabled_outbox_queues_instead_of_sending(self, mock_send, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True), self.assertLogs(
+            email_service.logger, "INFO"
+        ) as logs:
+            send_verification_email(self.user, "123456", "token")
+
+        self.assertIn("Verification email queued", logs.output[-1])
+
+        mock_send.assert_not_called()
+        mock_delay.assert_called_once()
+        email = EmailOutbox.objects.get()
+        self.assertEqual(email.to_email, "outbox@test.com")
+        self.assertIn("123456", email.body)
+        self.assertEqual(email.status, "pending")
+
+    @patch("apps.users.tasks.deliver_outbox.delay", side_effect=OSError("down"))
+    def test_broker_failure_keeps_row(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_email("a@test.com", "Hi", "Body")
+        self.assertEqual(EmailOutbox.objects.filter(status="pending").count(), 1)
+
+    def test_batch_sends_over_one_connection(self):
+        for i in range(3):
+            queue_email(f"user{i}@test.com", "Subject", "Body", "<p>Body</p>")
+
+        with patch(
+            "apps.users.services.email_service.get_connection",
+            wraps=email_service.get_connection,
+        ) as mock_connection:
+            with self.assertLogs(email_service.logger, "INFO") as logs:
+                claimed, sent = send_outbox_batch(batch_size=10)
+
+        self.assertEqual((claimed, sent), (3, 3))
+        self.assertEqual(sum("sent to" in line for line in logs.output), 3)
+        mock_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        self.assertFalse(EmailOutbox.objects.exclude(status="sent").exists())
+
+    def test_failure_backs_off_then_gives_up(self):
+        email = queue_email("fail@test.com", "Subject", "Body")
+
+        with patch.object(
+            email_service.EmailMultiAlternatives, "send", side_effect=OSError("smtp")
+        ):
+            self.assertEqual(send_outbox_batch(), (1, 0))
+            email.refresh_from_db()
+            self.assertEqual(email.status, "pending")
+            self.assertEqual(email.attempts, 1)
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+            # Not due yet.
+            self.assertEqual(send_outbox_batch(), (0, 0))
+
+            with patch.object(email_service, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2):
+                EmailOutbox.objects.update(next_attempt_at=timezone.now())
+                send_outbox_batch()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, "failed")
+        self.assertEqual(email.last_error, "smtp")
+
+    def test_task_drains_multiple_batches(self):
+        for i in range(5):
+            queue_email(f"user{i}@test.com", "Subject", "Body")
+        with patch.object(tasks, "EMAIL_OUTBOX_BATCH_SIZE", 2):
+            self.assertEqual(tasks.deliver_outbox(), 5)
+        self.assertEqual(len(mail.outbox), 5)
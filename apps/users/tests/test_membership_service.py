@@ -0,0 +1,135 @@
+"""Tests for request-scoped and cached membership resolution."""
+
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory
+
+from apps.users.middleware import OrganizationMiddleware
+from apps.users.models.models import User
+from apps.users.permissions import (
+    IsOrganizationMember,
+    IsOrganizationAdmin,
+    IsOrganizationOwner,
+)
+from apps.users.services import membership_service
+from apps.users.services.membership_service import (
+    get_membership,
+    get_default_membership,
+    invalidate_membership,
+)
+from apps.users.services.organization_service import (
+    accept_invitation,
+    remove_member,
+    transfer_ownership,
+    update_member_role,
+)
+from apps.users.tests.factories import (
+    create_user,
+    create_organization,
+    add_member,
+    create_invitation,
+)
+
+
+class RequestScopedMembershipTests(TestCase):
+
+    def setUp(self):
+        self.owner = create_user(email="owner@test.com", username="owner")
+        self.org = create_organization(self.owner)
+        self.factory = RequestFactory()
+
+    def test_repeated_lookups_hit_db_once(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(self.owner.is_member_of(self.org))
+            self.assertTrue(self.owner.is_admin_of(self.org))
+            self.assertTrue(self.owner.is_owner_of(self.org))
+
+    def test_miss_is_memoised(self):
+        outsider = create_user(email="out@test.com", username="out")
+        with self.assertNumQueries(1):
+            self.assertFalse(outsider.is_member_of(self.org))
+            self.assertFalse(outsider.is_admin_of(self.org))
+
+    def test_permissions_reuse_middleware_membership(self):
+        request = self.factory.get("/", HTTP_X_ORGANIZATION_ID=str(self.org.pk))
+        request.user = User.objects.get(pk=self.owner.pk)
+        OrganizationMiddleware(lambda r: r)(request)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(IsOrganizationMember().has_permission(request, None))
+            self.assertTrue(IsOrganizationAdmin().has_permission(request, None))
+            self.assertTrue(IsOrganizationOwner().has_permission(request, None))
+            self.assertTrue(
+                IsOrganizationAdmin().has_object_permission(request, None, self.org)
+            )
+            self.assertTrue(request.user.is_owner_of(self.org))
+
+    def test_default_membership_primes_org_lookup(self):
+        user = User.objects.get(pk=self.owner.pk)
+        membership = get_default_membership(user)
+        self.assertEqual(membership.organization, self.org)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_membership(user, self.org), membership)
+
+    def test_invalidate_clears_instance_memo(self):
+        worker = create_user(email="w@test.com", username="w")
+        membership = add_member(self.org, worker, role="worker")
+        self.assertFalse(worker.is_admin_of(self.org))
+        update_member_role(membership, "admin")
+        invalidate_membership(worker, self.org)
+        self.assertTrue(worker.is_admin_of(self.org))
+
+
+@patch.object(membership_service, "MEMBERSHIP_CACHE_TIMEOUT", 300)
+class SharedMembershipCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user(email="owner@test.com", username="owner")
+        self.worker = create_user(email="worker@test.com", username="worker")
+        self.org = create_organization(self.owner)
+        self.membership = add_member(self.org, self.worker, role="worker")
+
+    def tearDown(self):
+        cache.clear()
+
+    def _fresh(self, user):
+        """Simulate a new request by loading a fresh user instance."""
+        return User.objects.get(pk=user.pk)
+
+    def test_warm_cache_costs_zero_queries(self):
+        get_membership(self._fresh(self.worker), self.org)
+        user = self._fresh(self.worker)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.get_role_in_organization(self.org), "worker")
+
+    def test_role_change_invalidates(self):
+        get_membership(self._fresh(self.worker), self.org)
+        update_member_role(self.membership, "admin")
+        self.assertTrue(self._fresh(self.worker).is_admin_of(self.org))
+
+    def test_removal_invalidates(self):
+        get_membership(self._fresh(self.worker), self.org)
+        remove_member(self.org, self.worker, self.owner)
+        self.assertFalse(self._fresh(self.worker).is_member_of(self.org))
+
+    def test_accept_invitation_invalidates(self):
+        invitee = create_user(email="invitee@test.com", username="invitee")
+        self.assertFalse(self._fresh(invitee).is_member_of(self.org))
+        invitation = create_invitation(self.org, "invitee@test.com")
+        accept_invitation(invitation.token, invitee)
+        self.assertTrue(self._fresh(invitee).is_member_of(self.org))
+
+    def test_transfer_ownership_invalidates(self):
+        get_membership(self._fresh(self.owner), self.org)
+        get_membership(self._fresh(self.worker), self.org)
+        transfer_ownership(self.org, self.worker, self.owner)
+        self.assertTrue(self._fresh(self.worker).is_owner_of(self.org))
+        self.assertFalse(self._fresh(self.owner).is_owner_of(self.org))
+
+    def test_mock_request_falls_back_to_user(self):
+        request = Mock()
+        request.user = self._fresh(self.owner)
+        request.organization = self.org
+        self.assertTrue(IsOrganizationOwner().has_permission(request, None))
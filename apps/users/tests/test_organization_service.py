@@ -3,6 +3,7 @@
 from datetime import timedelta
 from unittest.mock import patch
 
+from django.core import mail
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -11,10 +12,12 @@ from apps.users.models.organization import (
     OrganizationMembership,
     OrganizationInvitation,
 )
+from apps.users.services import organization_service
 from apps.users.services.organization_service import (
     create_organization,
     create_default_organization,
     invite_member,
+    invite_members,
     accept_invitation,
     remove_member,
     transfer_ownership,
@@ -132,6 +135,67 @@ class InviteMemberTests(TestCase):
         self.assertIn("member limit", error)
 
 
+# =========================================================================
+# invite_members
+# =========================================================================
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class InviteMembersTests(TestCase):
+
+    def setUp(self):
+        self.owner = create_user(email="owner@test.com", username="owner")
+        self.org = factory_create_org(self.owner)
+
+    def test_bulk_invite_uses_constant_queries(self):
+        entries = [(f"worker{i}@test.com", "worker") for i in range(20)]
+        with self.assertNumQueries(5):
+            invitations, skipped, error = invite_members(self.org, entries, self.owner)
+        self.assertIsNone(error)
+        self.assertEqual(skipped, [])
+        self.assertEqual(len(invitations), 20)
+        self.assertEqual(
+            OrganizationInvitation.objects.filter(status="pending").count(), 20
+        )
+        self.assertEqual(len(mail.outbox), 20)
+
+    def test_skips_members_and_duplicates(self):
+        existing = create_user(email="existing@test.com", username="existing")
+        add_member(self.org, existing, role="worker")
+        invitations, skipped, error = invite_members(
+            self.org,
+            [
+                ("existing@test.com", "admin"),
+                ("new@test.com", "worker"),
+                ("NEW@test.com", "admin"),
+            ],
+            self.owner,
+        )
+        self.assertIsNone(error)
+        self.assertEqual([i.email for i in invitations], ["new@test.com"])
+        self.assertEqual(
+            [s["email"] for s in skipped], ["NEW@test.com", "existing@test.com"]
+        )
+
+    def test_revokes_previous_pending_invitations(self):
+        previous = create_invitation(self.org, "repeat@test.com", invited_by=self.owner)
+        invite_members(self.org, [("repeat@test.com", "admin")], self.owner)
+        previous.refresh_from_db()
+        self.assertEqual(previous.status, "revoked")
+
+    @patch.object(organization_service, "MEMBER_LIMIT", 3)
+    def test_rejects_batch_over_member_limit(self):
+        invitations, _, error = invite_members(
+            self.org,
+            [(f"w{i}@test.com", "worker") for i in range(3)],
+            self.owner,
+        )
+        self.assertEqual(invitations, [])
+        self.assertIn("Only 2 more member(s)", error)
+        self.assertFalse(OrganizationInvitation.objects.exists())
+        self.assertEqual(len(mail.outbox), 0)
+
+
 # =========================================================================
 # accept_invitation
 # =========================================================================
@@ -287,3 +351,26 @@ class UniqueSlugTests(TestCase):
         factory_create_org(owner, name="My Org", slug="my-org")
         slug = _unique_slug("My Org")
         self.assertEqual(slug, "my-org-1")
+
+    def test_single_query_with_many_collisions(self):
+        owner = create_user()
+        factory_create_org(owner, name="Farm", slug="farm")
+        for i in range(1, 12):
+            factory_create_org(owner, name="Farm", slug=f"farm-{i}")
+        with self.assertNumQueries(1):
+            self.assertEqual(_unique_slug("Farm"), "farm-12")
+
+    def test_ignores_non_numeric_suffixes(self):
+        owner = create_user()
+        factory_create_org(owner, name="Farm", slug="farm")
+        factory_create_org(owner, name="Farm House", slug="farm-house")
+        self.assertEqual(_unique_slug("Farm"), "farm-1")
+
+    def test_create_retries_when_slug_taken_concurrently(self):
+        owner = create_user()
+        factory_create_org(owner, name="Race", slug="race")
+        with patch.object(
+            organization_service, "_unique_slug", side_effect=["race", "race-1"]
+        ):
+            org = create_organization(owner, "Race")
+        self.assertEqual(org.slug, "race-1")
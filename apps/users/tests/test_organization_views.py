@@ -4,7 +4,11 @@ import uuid
 from datetime import timedelta
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -137,6 +141,74 @@ class OrganizationMembersTests(TestCase):
         self.assertEqual(len(resp.data), 2)  # owner + worker
 
 
+class OrganizationQueryCountTests(TestCase):
+    """List endpoints cost the same number of queries regardless of size."""
+
+    def setUp(self):
+        self.user = create_user(email="count@test.com", username="count")
+        self.client = get_auth_client(self.user)
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return len(ctx), resp
+
+    def _add_workers(self, org, count, start=0):
+        for i in range(start, start + count):
+            worker = create_user(email=f"w{i}@test.com", username=f"w{i}")
+            add_member(org, worker, role="worker")
+
+    def test_organization_list(self):
+        url = reverse("organization_list_create")
+        first = create_organization(self.user, "First", slug="first")
+        self._add_workers(first, 2)
+        few, resp = self._count_queries(url)
+
+        for i in range(5):
+            owner = create_user(email=f"o{i}@test.com", username=f"o{i}")
+            org = create_organization(owner, f"Org {i}", slug=f"org-{i}")
+            add_member(org, self.user, role="admin")
+        many, resp = self._count_queries(url)
+
+        self.assertEqual(few, many)
+        rows = {row["slug"]: row for row in resp.data["results"]}
+        self.assertEqual(rows["first"]["member_count"], 3)
+        self.assertEqual(rows["first"]["current_user_role"], "owner")
+        self.assertEqual(rows["org-0"]["member_count"], 2)
+        self.assertEqual(rows["org-0"]["current_user_role"], "admin")
+
+    def test_members_list(self):
+        org = create_organization(self.user)
+        url = reverse("organization_members", kwargs={"pk": org.pk})
+        self._add_workers(org, 2)
+        few, _ = self._count_queries(url)
+        self._add_workers(org, 8, start=2)
+        many, resp = self._count_queries(url)
+        self.assertEqual(few, many)
+        self.assertEqual(resp.data["count"], 11)
+
+    def test_members_list_hidden_from_non_members(self):
+        other = create_user(email="other@test.com", username="other")
+        org = create_organization(other)
+        url = reverse("organization_members", kwargs={"pk": org.pk})
+        _, resp = self._count_queries(url)
+        self.assertEqual(resp.data["count"], 0)
+
+    def test_pending_invitations(self):
+        url = reverse("invitations_pending")
+        owner = create_user(email="inviter@test.com", username="inviter")
+        create_invitation(create_organization(owner, "A", slug="a"), self.user.email)
+        few, _ = self._count_queries(url)
+        for i in range(4):
+            org = create_organization(owner, f"B{i}", slug=f"b{i}")
+            create_invitation(org, self.user.email, invited_by=owner)
+        many, resp = self._count_queries(url)
+        self.assertEqual(few, many)
+        self.assertEqual(resp.data["count"], 5)
+        self.assertEqual(resp.data["results"][0]["organization"]["member_count"], 1)
+
+
 class InviteMemberTests(TestCase):
     """Tests for POST /api/organizations/<pk>/members/invite/."""
 
@@ -177,6 +249,66 @@ class InviteMemberTests(TestCase):
         self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
 
 
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class BulkInviteMemberTests(TestCase):
+    """Tests for bulk POST /api/organizations/<pk>/members/invite/."""
+
+    def setUp(self):
+        self.owner = create_user(email="owner@test.com", username="owner")
+        self.org = create_organization(self.owner)
+        self.client = get_auth_client(self.owner, self.org)
+        self.url = reverse("organization_invite_member", kwargs={"pk": self.org.pk})
+
+    def test_json_list(self):
+        resp = self.client.post(
+            self.url,
+            {
+                "invitations": [
+                    {"email": "a@test.com", "role": "worker"},
+                    {"email": "b@test.com", "role": "admin"},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(resp.data["invited"]), 2)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_csv_upload(self):
+        upload = SimpleUploadedFile(
+            "invites.csv",
+            b"Email,Role\na@test.com,admin\nb@test.com,\n\n",
+            content_type="text/csv",
+        )
+        resp = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        roles = {i["email"]: i["role"] for i in resp.data["invited"]}
+        self.assertEqual(roles, {"a@test.com": "admin", "b@test.com": "worker"})
+
+    def test_csv_requires_email_column(self):
+        upload = SimpleUploadedFile("invites.csv", b"name\nAlice\n")
+        resp = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_csv_row_longer_than_header_rejected(self):
+        upload = SimpleUploadedFile(
+            "invites.csv", b"email,role\na@test.com,admin\n,,extra\n"
+        )
+        resp = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Line 3", str(resp.data["file"]))
+        self.assertFalse(OrganizationInvitation.objects.exists())
+
+    def test_invalid_entry_rejected(self):
+        resp = self.client.post(
+            self.url,
+            {"invitations": [{"email": "not-an-email", "role": "worker"}]},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(OrganizationInvitation.objects.exists())
+
+
 class UpdateMemberRoleTests(TestCase):
     """Tests for PATCH /api/organizations/<pk>/members/<user_id>/role/."""
 
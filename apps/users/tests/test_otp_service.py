@@ -3,14 +3,17 @@
 from datetime import timedelta
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
+from apps.users.services import otp_service
 from apps.users.services.otp_service import (
     generate_otp,
     create_otp,
     create_and_send_otp,
     can_resend_otp,
+    get_user_for_token,
     verify_otp,
     verify_token,
     _mark_verified,
@@ -256,3 +259,75 @@ class MarkVerifiedTests(TestCase):
         self.assertIsNone(user.email_verification_code)
         self.assertIsNone(user.email_verification_token)
         self.assertEqual(user.verification_attempts, 0)
+
+
+@patch.object(otp_service, "OTP_CACHE_ENABLED", True)
+class CachedOTPTests(TestCase):
+    """Tests for OTP state kept in the cache (OTP_CACHE_ENABLED)."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(is_email_verified=False, is_active=False)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_create_does_not_touch_users_table(self):
+        with self.assertNumQueries(0):
+            code, token = create_otp(self.user)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.email_verification_code)
+        self.assertIsNone(self.user.last_otp_sent_at)
+        self.assertEqual(len(code), 6)
+
+    def test_wrong_guesses_counted_without_queries(self):
+        create_otp(self.user)
+        with self.assertNumQueries(0):
+            success, error = verify_otp(self.user, "wrong!")
+        self.assertFalse(success)
+        self.assertIn("4 attempt(s) remaining", error)
+
+    @patch.object(otp_service, "OTP_MAX_ATTEMPTS", 2)
+    def test_max_attempts_blocks_correct_code(self):
+        code, _ = create_otp(self.user)
+        verify_otp(self.user, "wrong!")
+        verify_otp(self.user, "wrong!")
+        success, error = verify_otp(self.user, code)
+        self.assertFalse(success)
+        self.assertIn("Too many attempts", error)
+
+    def test_correct_code_marks_verified_and_clears_keys(self):
+        code, token = create_otp(self.user)
+        success, error = verify_otp(self.user, code)
+        self.assertTrue(success)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_email_verified)
+        self.assertTrue(self.user.is_active)
+        self.assertIsNone(get_user_for_token(token))
+
+    def test_expired_code(self):
+        create_otp(self.user)
+        cache.delete(otp_service._code_key(self.user.pk))
+        success, error = verify_otp(self.user, "123456")
+        self.assertFalse(success)
+        self.assertIn("expired", error)
+
+    def test_link_token_lookup_and_verification(self):
+        _, token = create_otp(self.user)
+        self.assertEqual(get_user_for_token(token), self.user)
+        self.assertFalse(verify_token(self.user, "other")[0])
+        self.assertTrue(verify_token(self.user, token)[0])
+
+    def test_resend_invalidates_previous_link(self):
+        _, first = create_otp(self.user)
+        _, second = create_otp(self.user)
+        self.assertIsNone(get_user_for_token(first))
+        self.assertEqual(get_user_for_token(second), self.user)
+
+    def test_cooldown_claimed_once(self):
+        self.assertTrue(can_resend_otp(self.user))
+        self.assertFalse(can_resend_otp(self.user))
+
+    def test_cooldown_set_on_create(self):
+        create_otp(self.user)
+        self.assertFalse(can_resend_otp(self.user))
@@ -0,0 +1,178 @@
+"""Tests for the cache-backed refresh-token blacklist."""
+
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from apps.users.services import token_blacklist_service
+from apps.users.models.token_blacklist import RevokedToken
+from apps.users.services.token_blacklist_service import (
+    CacheBlacklistStore,
+    DatabaseBlacklistStore,
+    InMemoryBlacklistStore,
+)
+from apps.users.tests.factories import create_user
+from apps.users.tokens import OrganizationRefreshToken
+
+
+class BlacklistStoreTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_in_memory_store_expires_entries(self):
+        store = InMemoryBlacklistStore()
+        self.assertTrue(store.add("live", time.time() + 60))
+        self.assertFalse(store.add("live", time.time() + 60))
+        self.assertFalse(store.add("expired", time.time() - 1))
+        self.assertTrue(store.contains("live"))
+        self.assertFalse(store.contains("expired"))
+        self.assertEqual(len(store), 1)
+
+    def test_cache_store_sets_ttl_from_expiry(self):
+        store = CacheBlacklistStore()
+        with patch.object(store.cache, "add", wraps=store.cache.add) as add:
+            self.assertTrue(store.add("abc", time.time() + 30))
+        self.assertLessEqual(add.call_args.args[2], 31)
+        self.assertTrue(store.contains("abc"))
+        self.assertFalse(store.contains("other"))
+        self.assertFalse(store.add("gone", time.time() - 5))
+
+    def test_cache_store_warns_on_process_local_cache(self):
+        with self.assertLogs(token_blacklist_service.logger, "WARNING"):
+            CacheBlacklistStore()
+
+    def test_database_store_adds_once_and_purges(self):
+        store = DatabaseBlacklistStore()
+        self.assertTrue(store.add("live", time.time() + 60))
+        self.assertFalse(store.add("live", time.time() + 60))
+        self.assertFalse(store.add("expired", time.time() - 1))
+        self.assertTrue(store.contains("live"))
+        self.assertFalse(store.contains("other"))
+
+        RevokedToken.objects.create(
+            jti="stale", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertFalse(store.contains("stale"))
+        self.assertEqual(store.purge(), 1)
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["live"]
+        )
+
+
+class RefreshTokenBlacklistTests(TestCase):
+
+    def setUp(self):
+        self.store = InMemoryBlacklistStore()
+        patcher = patch.object(token_blacklist_service, "_store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = create_user(email="refresh@test.com", username="refresh")
+        self.client = APIClient()
+
+    def test_issuing_tokens_writes_no_rows(self):
+        with self.assertNumQueries(0):
+            OrganizationRefreshToken.for_user(self.user)
+        self.assertFalse(OutstandingToken.objects.exists())
+
+    def test_blacklisted_token_rejected(self):
+        refresh = OrganizationRefreshToken.for_user(self.user)
+        refresh.blacklist()
+        with self.assertRaises(TokenError):
+            OrganizationRefreshToken(str(refresh))
+
+    def test_blacklist_fails_when_already_blacklisted(self):
+        refresh = OrganizationRefreshToken.for_user(self.user)
+        # A concurrent refresh of the same token got there first.
+        self.store.add(refresh["jti"], refresh["exp"])
+        with self.assertRaises(TokenError):
+            refresh.blacklist()
+
+    def test_refresh_rotates_and_blacklists(self):
+        refresh = str(OrganizationRefreshToken.for_user(self.user))
+        url = reverse("token_refresh")
+
+        resp = self.client.post(url, {"refresh": refresh}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn("access", resp.data)
+        self.assertNotEqual(resp.data["refresh"], refresh)
+        self.assertEqual(len(self.store), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+        resp = self.client.post(url, {"refresh": refresh}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_blacklists_refresh_token(self):
+        refresh = OrganizationRefreshToken.for_user(self.user)
+        self.client.force_authenticate(user=self.user)
+        resp = self.client.post(
+            reverse("logout"), {"refresh": str(refresh)}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(self.store.contains(refresh["jti"]))
+
+    def test_logout_rejects_invalid_refresh_token(self):
+        self.client.force_authenticate(user=self.user)
+        resp = self.client.post(reverse("logout"), {"refresh": "bad"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DrainTokenBlacklistCommandTests(TestCase):
+
+    def setUp(self):
+        self.store = InMemoryBlacklistStore()
+        patcher = patch.object(token_blacklist_service, "_store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = create_user(email="drain@test.com", username="drain")
+
+    def _outstanding(self, jti, expires_in):
+        now = timezone.now()
+        return OutstandingToken.objects.create(
+            user=self.user,
+            jti=jti,
+            token="x",
+            created_at=now,
+            expires_at=now + expires_in,
+        )
+
+    def test_copies_live_entries_and_empties_tables(self):
+        BlacklistedToken.objects.create(
+            token=self._outstanding("live", timedelta(hours=1))
+        )
+        BlacklistedToken.objects.create(
+            token=self._outstanding("expired", -timedelta(hours=1))
+        )
+        self._outstanding("unused", timedelta(hours=1))
+
+        call_command("drain_token_blacklist", batch_size=1, stdout=StringIO())
+
+        self.assertTrue(self.store.contains("live"))
+        self.assertFalse(self.store.contains("expired"))
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_keep_tables(self):
+        BlacklistedToken.objects.create(
+            token=self._outstanding("live", timedelta(hours=1))
+        )
+        call_command("drain_token_blacklist", keep_tables=True, stdout=StringIO())
+        self.assertTrue(self.store.contains("live"))
+        self.assertEqual(OutstandingToken.objects.count(), 1)
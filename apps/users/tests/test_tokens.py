@@ -0,0 +1,103 @@
+"""Tests for organization claims embedded in JWTs."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.users import tokens
+from apps.users.authentication import OrganizationJWTAuthentication
+from apps.users.permissions import IsOrganizationAdmin, IsOrganizationMember
+from apps.users.services.organization_service import remove_member
+from apps.users.tests.factories import create_user, create_organization, add_member
+from apps.users.tokens import ORGANIZATION_CLAIM, OrganizationRefreshToken
+
+
+@patch.object(tokens, "ORGANIZATION_TOKEN_CLAIMS", True)
+class OrganizationClaimTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.owner = create_user(email="owner@test.com", username="owner")
+        self.org = create_organization(self.owner, "Claim Org")
+        self.worker = create_user(email="worker@test.com", username="worker")
+        add_member(self.org, self.worker, role="worker")
+
+    def tearDown(self):
+        cache.clear()
+
+    def _request(self, access_token, org_id=None):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {access_token}"}
+        if org_id is not None:
+            headers["HTTP_X_ORGANIZATION_ID"] = str(org_id)
+        return Request(
+            self.factory.get("/api/birds/", **headers),
+            authenticators=[OrganizationJWTAuthentication()],
+        )
+
+    def test_claim_embedded_in_access_token(self):
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+        claim = access[ORGANIZATION_CLAIM]
+        self.assertEqual(claim["m"], [[self.org.pk, "w"]])
+        self.assertEqual(claim["r"], "user")
+        self.assertIn("v", claim)
+
+    def test_claims_disabled_by_default(self):
+        with patch.object(tokens, "ORGANIZATION_TOKEN_CLAIMS", False):
+            refresh = OrganizationRefreshToken.for_user(self.worker)
+        self.assertNotIn(ORGANIZATION_CLAIM, refresh.payload)
+
+    def test_authorizes_without_queries(self):
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+        request = self._request(access, self.org.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(request.user.pk, self.worker.pk)
+            self.assertEqual(request.user.role, "user")
+            self.assertEqual(request.organization.pk, self.org.pk)
+            self.assertEqual(request.organization_role, "worker")
+            self.assertTrue(IsOrganizationMember().has_permission(request, None))
+            self.assertFalse(IsOrganizationAdmin().has_permission(request, None))
+
+    def test_unclaimed_org_has_no_context(self):
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+        request = self._request(access, 99999)
+        self.assertEqual(request.user.pk, self.worker.pk)
+        self.assertIsNone(request.organization)
+
+    def test_membership_change_revokes_claim(self):
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+        remove_member(self.org, self.worker, self.owner)
+        request = self._request(access, self.org.pk)
+        self.assertEqual(request.user, self.worker)
+        self.assertIsNone(request.organization)
+
+    def test_system_role_change_revokes_claim(self):
+        self.worker.role = "admin"
+        self.worker.save()
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+        self.assertEqual(access[ORGANIZATION_CLAIM]["r"], "admin")
+
+        self.worker.role = "user"
+        self.worker.save()
+
+        self.assertIsNone(tokens.user_from_claims(access, str(self.org.pk)))
+        request = self._request(access, self.org.pk)
+        self.assertEqual(request.user.role, "user")
+        self.assertEqual(request.organization.pk, self.org.pk)
+
+    def test_other_user_saves_keep_claim(self):
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+
+        self.worker.first_name = "Renamed"
+        self.worker.save()
+        self.worker.save(update_fields=["last_login"])
+
+        self.assertIsNotNone(tokens.user_from_claims(access, str(self.org.pk)))
+
+    def test_lazy_user_fields_load_on_access(self):
+        access = OrganizationRefreshToken.for_user(self.worker).access_token
+        request = self._request(access, self.org.pk)
+        self.assertEqual(request.user.email, "worker@test.com")
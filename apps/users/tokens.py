@@ -0,0 +1,168 @@
+"""JWT token classes that can embed organization roles as compact claims."""
+
+import logging
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+
+from apps.users.services.membership_service import (
+    get_membership,
+    get_membership_version,
+    remember_membership,
+)
+from apps.users.services.token_blacklist_service import blacklist_jti, is_blacklisted
+
+logger = logging.getLogger(__name__)
+
+# Opt-in: embed organization roles in issued tokens and trust them on requests.
+ORGANIZATION_TOKEN_CLAIMS = getattr(settings, "ORGANIZATION_TOKEN_CLAIMS", False)
+
+ORGANIZATION_CLAIM = "org"
+
+ROLE_CODES = {"owner": "o", "admin": "a", "worker": "w"}
+ROLE_NAMES = {code: role for role, code in ROLE_CODES.items()}
+
+
+def build_organization_claim(user):
+    """
+    Return the compact organization claim for *user*::
+
+        {"v": <membership version>, "r": <system role>, "m": [[org_id, "o"], ...]}
+
+    ``m`` lists active memberships in active organizations, oldest first.
+    """
+    from apps.users.models.organization import OrganizationMembership
+
+    memberships = (
+        OrganizationMembership.objects.filter(
+            user=user, is_active=True, organization__is_active=True
+        )
+        .order_by("pk")
+        .values_list("organization_id", "role")
+    )
+    return {
+        "v": get_membership_version(user.pk),
+        "r": user.role,
+        "m": [[org_id, ROLE_CODES[role]] for org_id, role in memberships],
+    }
+
+
+class OrganizationRefreshToken(RefreshToken):
+    """
+    Refresh token that embeds the organization claim when
+    ``ORGANIZATION_TOKEN_CLAIMS`` is enabled. Access tokens derived from it
+    carry the same claim.
+
+    Blacklisting goes through ``token_blacklist_service`` (keyed by JTI and
+    expiring with the token) instead of the ``token_blacklist`` tables, so
+    issuing tokens never writes to the database.
+    ``BlacklistMixin`` is skipped in the ``super()`` calls below for that
+    reason.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super(BlacklistMixin, cls).for_user(user)
+        if ORGANIZATION_TOKEN_CLAIMS:
+            token[ORGANIZATION_CLAIM] = build_organization_claim(user)
+        return token
+
+    def verify(self, *args, **kwargs):
+        self.check_blacklist()
+        super(BlacklistMixin, self).verify(*args, **kwargs)
+
+    def check_blacklist(self):
+        """Raise ``TokenError`` if this token has been blacklisted."""
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        """
+        Blacklist this token until it expires. Raises ``TokenError`` if it
+        was blacklisted in the meantime, so only one of two concurrent
+        refreshes of the same token succeeds.
+        """
+        if not blacklist_jti(self.payload[api_settings.JTI_CLAIM], self.payload["exp"]):
+            raise TokenError(_("Token is blacklisted"))
+        return True
+
+    def outstand(self):
+        """Outstanding tokens are not tracked; kept for API compatibility."""
+        return None
+
+
+def _deferred_instance(model, **values):
+    """Build a model instance from *values*, leaving every other field deferred."""
+    field_names = [
+        f.attname for f in model._meta.concrete_fields if f.attname in values
+    ]
+    return model.from_db(
+        DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names]
+    )
+
+
+def user_from_claims(validated_token, organization_header=None):
+    """
+    Resolve ``(user, membership)`` from the organization claim of
+    *validated_token* without touching the database.
+
+    Returns ``None`` when claims are disabled, absent, or stale (the user's
+    membership version moved on), in which case the caller should fall back
+    to the database. The user instance only has ``id``, ``role`` and
+    ``is_active`` loaded; any other field is fetched lazily on access. Every
+    claimed membership is memoised on the user, so role checks are free.
+    Memberships are built from the claim and must not be saved.
+    """
+    from django.contrib.auth import get_user_model
+    from apps.users.models.organization import Organization, OrganizationMembership
+
+    if not ORGANIZATION_TOKEN_CLAIMS:
+        return None
+
+    claim = validated_token.get(ORGANIZATION_CLAIM)
+    user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+    if not claim or user_id is None:
+        return None
+
+    user_model = get_user_model()
+    user_id = user_model._meta.pk.to_python(user_id)
+    if claim.get("v") != get_membership_version(user_id):
+        logger.debug("Stale organization claim for user id=%s", user_id)
+        return None
+
+    user = _deferred_instance(
+        user_model, id=user_id, role=claim.get("r"), is_active=True
+    )
+
+    memberships = claim.get("m") or []
+    for org_id, role_code in memberships:
+        remember_membership(
+            user,
+            OrganizationMembership(
+                organization=_deferred_instance(
+                    Organization, id=org_id, is_active=True
+                ),
+                user=user,
+                role=ROLE_NAMES[role_code],
+                is_active=True,
+            ),
+        )
+
+    selected = None
+    if organization_header:
+        try:
+            wanted = int(organization_header)
+        except (TypeError, ValueError):
+            wanted = None
+        selected = next((m for m in memberships if m[0] == wanted), None)
+    elif memberships:
+        selected = memberships[0]
+
+    membership = None
+    if selected is not None:
+        membership = get_membership(user, selected[0])
+    return user, membership
@@ -0,0 +1,152 @@
+"""Pagination classes shared by the record list endpoints."""
+
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on ``(view.keyset_field, id)``, newest first.
+
+    Every page seeks past the boundary row of the previous one with an
+    indexed range condition instead of an ``OFFSET``, so page 1,000 costs the
+    same as page 1. No total count is returned.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    default_keyset_field = "date"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if queryset.query.combinator:
+            # Seek conditions cannot be added to a UNION (include_archived).
+            raise ValidationError(
+                {"pagination": "Cursor pagination is not available for this query."}
+            )
+        self.request = request
+        self.field = getattr(view, "keyset_field", self.default_keyset_field)
+        self.model_field = queryset.model._meta.get_field(self.field)
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        reverse, position = self.decode_cursor(request)
+        if reverse:
+            queryset = queryset.order_by(self.field, "pk")
+        else:
+            queryset = queryset.order_by(f"-{self.field}", "-pk")
+        if position is not None:
+            value, pk = position
+            lookup = "gt" if reverse else "lt"
+            queryset = queryset.filter(
+                Q(**{f"{self.field}__{lookup}": value})
+                | Q(**{self.field: value, f"pk__{lookup}": pk})
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE
+        return max(1, min(page_size, self.max_page_size))
+
+    def decode_cursor(self, request):
+        """Return ``(reverse, (value, pk) or None)`` from the cursor parameter."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            reverse, value, pk = json.loads(b64decode(encoded.encode("ascii")))
+            return bool(reverse), (self.model_field.to_python(value), int(pk))
+        except (
+            BinasciiError,
+            UnicodeError,
+            ValueError,
+            TypeError,
+            DjangoValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, reverse, instance):
+        value = getattr(instance, self.field)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        payload = json.dumps([int(reverse), value, instance.pk])
+        encoded = b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(False, self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(True, self.page[0])
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class OptionalKeysetPagination(PageNumberPagination):
+    """
+    Page-number pagination by default; clients opt into keyset pagination
+    with ``?pagination=cursor`` and then follow the returned links.
+    """
+
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if (
+            request.query_params.get("pagination") == "cursor"
+            or self.keyset_class.cursor_query_param in request.query_params
+        ):
+            self.keyset = self.keyset_class()
+            self.display_page_controls = False
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
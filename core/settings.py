@@ -103,6 +103,31 @@ if "test" in sys.argv or "test_coverage" in sys.argv:
         "NAME": ":memory:",
     }
 
+# Cache: Redis when CACHE_URL is configured, local memory otherwise
+CACHE_URL = config("CACHE_URL", default="")
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Sessions are only used by the admin: read from the cache, written through to the DB.
+SESSION_ENGINE = config(
+    "SESSION_ENGINE", default="django.contrib.sessions.backends.cached_db"
+)
+# API login issues JWTs only; set to also create a Django session.
+API_LOGIN_CREATES_SESSION = config(
+    "API_LOGIN_CREATES_SESSION", default=False, cast=bool
+)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -142,6 +167,12 @@ EMAIL_USE_SSL = False
 EMAIL_HOST_USER = ""
 EMAIL_HOST_PASSWORD = ""
 DEFAULT_FROM_EMAIL = "noreply@minija.com"
+# Queue verification/invitation emails in the outbox table and send them from
+# the Celery worker (apps.users.tasks.deliver_outbox) instead of in the request.
+EMAIL_OUTBOX_ENABLED = config("EMAIL_OUTBOX_ENABLED", default=False, cast=bool)
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY_SECONDS = 60
 FRONTEND_URL = "http://localhost:3000"
 
 # ==================== OTP SETTINGS ====================
@@ -149,10 +180,48 @@ OTP_LENGTH = 6
 OTP_EXPIRY_MINUTES = 10
 OTP_MAX_ATTEMPTS = 5
 OTP_RESEND_COOLDOWN_SECONDS = 60
+# Keep OTP codes, attempt counters and cooldowns in the cache instead of the
+# users table. Needs a shared cache (CACHE_URL) so every worker sees them.
+OTP_CACHE_ENABLED = config("OTP_CACHE_ENABLED", default=False, cast=bool)
+OTP_LINK_EXPIRY_HOURS = 72
 
 # ==================== ORGANIZATION SETTINGS ====================
 ORGANIZATION_INVITATION_EXPIRY_DAYS = 7
 ORGANIZATION_MEMBER_LIMIT = 50
+# Seconds to keep resolved memberships in the shared cache (0 = request-scoped only).
+# Only enable with a shared cache backend (CACHE_URL) so invalidation reaches all workers.
+ORGANIZATION_MEMBERSHIP_CACHE_TIMEOUT = config(
+    "ORGANIZATION_MEMBERSHIP_CACHE_TIMEOUT", default=0, cast=int
+)
+# Embed organization roles in issued JWTs and authorize requests from them
+# without DB round-trips. Needs a shared cache (CACHE_URL) for revocation.
+ORGANIZATION_TOKEN_CLAIMS = config(
+    "ORGANIZATION_TOKEN_CLAIMS", default=False, cast=bool
+)
+
+# ==================== BIRDS SETTINGS ====================
+# Seconds to cache per-organization batch statistics (0 disables the cache).
+# Batch saves invalidate it; use a shared cache (CACHE_URL) with many workers.
+BATCH_STATISTICS_CACHE_TIMEOUT = config(
+    "BATCH_STATISTICS_CACHE_TIMEOUT", default=300, cast=int
+)
+# Seconds to cache a batch's growth-curve series; record writes invalidate it.
+GROWTH_CURVE_CACHE_TIMEOUT = config(
+    "GROWTH_CURVE_CACHE_TIMEOUT", default=3600, cast=int
+)
+# Days a sold batch stays untouched before its records move to archive tables.
+BATCH_ARCHIVE_AFTER_DAYS = config("BATCH_ARCHIVE_AFTER_DAYS", default=180, cast=int)
+
+# ==================== HEALTH SETTINGS ====================
+# 30-day deaths, as % of current birds, that raise a medium / high alert.
+MORTALITY_ALERT_THRESHOLD = config("MORTALITY_ALERT_THRESHOLD", default=5, cast=float)
+MORTALITY_ALERT_HIGH_THRESHOLD = config(
+    "MORTALITY_ALERT_HIGH_THRESHOLD", default=10, cast=float
+)
+# Days before a scheduled vaccination is due that its reminder is created.
+VACCINATION_REMINDER_DAYS_AHEAD = config(
+    "VACCINATION_REMINDER_DAYS_AHEAD", default=3, cast=int
+)
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -160,7 +229,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST Framework configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.OrganizationJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -251,6 +320,33 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    # Safety net for outbox rows whose wake-up task was lost or backed off.
+    "deliver-email-outbox": {
+        "task": "apps.users.tasks.deliver_outbox",
+        "schedule": 60.0,
+    },
+    "purge-token-blacklist": {
+        "task": "apps.users.tasks.purge_token_blacklist",
+        "schedule": 24 * 60 * 60.0,
+    },
+    "archive-sold-batches": {
+        "task": "apps.birds.tasks.archive_sold_batches",
+        "schedule": 24 * 60 * 60.0,
+    },
+    "evaluate-mortality-alerts": {
+        "task": "apps.health.tasks.evaluate_mortality_alerts",
+        "schedule": 60 * 60.0,
+    },
+    "generate-vaccination-reminders": {
+        "task": "apps.health.tasks.generate_vaccination_reminders",
+        "schedule": 24 * 60 * 60.0,
+    },
+    "ensure-reading-partitions": {
+        "task": "apps.production.tasks.ensure_reading_partitions",
+        "schedule": 24 * 60 * 60.0,
+    },
+}
 
 # Custom user model
 AUTH_USER_MODEL = "users.User"
@@ -286,6 +382,21 @@ SIMPLE_JWT: Dict[str, Any] = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 }
 
+# Refresh-token blacklist keyed by JTI, expiring with the token: cache keys
+# when a shared cache (CACHE_URL) is configured, the revoked_tokens table
+# otherwise, so revocations always reach every worker. The token_blacklist
+# app stays installed only so drain_token_blacklist can migrate and empty
+# its tables.
+TOKEN_BLACKLIST_STORE = config(
+    "TOKEN_BLACKLIST_STORE",
+    default=(
+        "apps.users.services.token_blacklist_service.CacheBlacklistStore"
+        if CACHE_URL
+        else "apps.users.services.token_blacklist_service.DatabaseBlacklistStore"
+    ),
+)
+TOKEN_BLACKLIST_CACHE_ALIAS = "default"
+
 # Logging configuration
 LOGS_DIR = os.path.join(BASE_DIR, "core", "logs")
 LOGGING: Dict[str, Any] = {
@@ -0,0 +1,29 @@
+"""Signal receivers shared by the apps that keep denormalized record data."""
+
+
+def remember_previous(sender, instance, raw=False, **kwargs):
+    """
+    ``pre_save`` receiver storing the stored row of an edited instance on
+    ``instance._previous`` (``None`` for new rows) for ``post_save``
+    receivers to diff against. Every app connects it for the senders it
+    needs; Django keeps one connection per sender, so the row is read once.
+    """
+    previous = None
+    if not raw and not instance._state.adding and instance.pk is not None:
+        previous = sender._default_manager.filter(pk=instance.pk).first()
+    instance._previous = previous
+
+
+def previous_state(instance):
+    """The row ``remember_previous`` stored for the save in progress, if any."""
+    return instance.__dict__.get("_previous")
+
+
+def deleted_with_batch(origin):
+    """
+    Whether a ``post_delete`` with *origin* is part of deleting its batch (an
+    instance or queryset), whose denormalized rows cascade along with it.
+    """
+    from apps.birds.models.models import Batch
+
+    return isinstance(origin, Batch) or getattr(origin, "model", None) is Batch